@@ -0,0 +1,139 @@
+"""Persistent cache of parsed docs files, so later launches skip parsing."""
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import dataclasses
+import hashlib
+import pathlib
+import pickle
+import sys
+
+from satisfactory_recipes import config as sr_config
+from satisfactory_recipes import docs_parser
+from satisfactory_recipes import info_classes as ic
+
+CACHE_FILENAME = "docs-cache.pickle"
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class DocsFingerprint:
+    """Identifies one docs file as parsed by one parser version."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    parser_version: int
+
+    @classmethod
+    def from_path(cls, docs_json: pathlib.Path) -> DocsFingerprint:
+        stat = docs_json.stat()
+        with open(docs_json, "rb") as source:
+            sha256 = hashlib.file_digest(source, "sha256").hexdigest()
+        return cls(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=sha256,
+            parser_version=docs_parser.PARSER_VERSION,
+        )
+
+
+def get_cache_path() -> pathlib.Path:
+    return sr_config.get_config_path().parent / CACHE_FILENAME
+
+
+def _read_cache(
+    cache_path: pathlib.Path,
+    fingerprint: DocsFingerprint,
+) -> docs_parser.ParseResult | None:
+    try:
+        with open(cache_path, "rb") as source:
+            cached_fingerprint, result = pickle.load(source)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+        ValueError,
+    ) as exc:
+        # Truncated or written by incompatible code; reparse and overwrite it.
+        print(f"Ignoring unreadable docs cache {cache_path}: {exc}", file=sys.stderr)
+        return None
+
+    if cached_fingerprint != fingerprint or not isinstance(
+        result, docs_parser.ParseResult
+    ):
+        return None
+    return result
+
+
+def _write_cache(
+    cache_path: pathlib.Path,
+    fingerprint: DocsFingerprint,
+    result: docs_parser.ParseResult,
+) -> None:
+    # Write then rename, so an interrupted write never leaves a torn cache.
+    temporary_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    try:
+        with open(temporary_path, "wb") as destination:
+            pickle.dump(
+                (fingerprint, result),
+                destination,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        temporary_path.replace(cache_path)
+    except OSError as exc:
+        print(f"Could not write docs cache {cache_path}: {exc}", file=sys.stderr)
+
+
+def parse_game_data(
+    docs_json: pathlib.Path,
+    *,
+    cache_path: pathlib.Path | None = None,
+    on_phase: cabc.Callable[[docs_parser.LoadPhase], None] | None = None,
+) -> docs_parser.ParseResult:
+    """
+    Like docs_parser.parse_game_data, but reuse a matching cached result.
+
+    The cache holds one docs file and is replaced whenever the docs file's
+    size, mtime or contents, or the parser version, change. on_phase is only
+    called when the docs are actually parsed.
+    """
+    if cache_path is None:
+        cache_path = get_cache_path()
+
+    fingerprint = DocsFingerprint.from_path(docs_json)
+    result = _read_cache(cache_path, fingerprint)
+    if result is None:
+        result = docs_parser.parse_game_data(docs_json, on_phase=on_phase)
+        _write_cache(cache_path, fingerprint, result)
+    return result
+
+
+def load_game_data(
+    docs_json: pathlib.Path,
+    *,
+    use_cache: bool = True,
+    profile: bool = False,
+    on_phase: cabc.Callable[[docs_parser.LoadPhase], None] | None = None,
+) -> ic.GameData:
+    """
+    Load domain data, going through the cache unless use_cache is False.
+
+    With profile, the docs are always parsed and the cost of each load phase
+    is printed to stderr. The cache is still refreshed if enabled. on_phase
+    is passed on to the parser.
+    """
+    if profile:
+        result = docs_parser.parse_game_data(docs_json, profile=True, on_phase=on_phase)
+        print(docs_parser.format_phase_costs(result.report), file=sys.stderr)
+        if use_cache:
+            _write_cache(get_cache_path(), DocsFingerprint.from_path(docs_json), result)
+        return result.game_data
+    if not use_cache:
+        return docs_parser.parse_game_data(docs_json, on_phase=on_phase).game_data
+    return parse_game_data(docs_json, on_phase=on_phase).game_data
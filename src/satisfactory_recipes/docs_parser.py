@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import collections.abc as cabc
+import contextlib
 import dataclasses
+import enum
 import fractions as fr
 import json
 import pathlib
+import re
+import time
+import tracemalloc
 import typing as ty
 
 from satisfactory_recipes import info_classes as ic
-from satisfactory_recipes import stupid_classes as sc
+from satisfactory_recipes import item_counter
+
+# Bump whenever parsing or the parsed classes change, to invalidate docs caches.
+PARSER_VERSION = 5
 
 RECIPE_NATIVE_CLASS = "/Script/CoreUObject.Class'/Script/FactoryGame.FGRecipe'"
 FIXED_MANUFACTURER_NATIVE_CLASS = (
@@ -68,6 +77,42 @@ DOCS_DEFAULT_VARIABLE_POWER = ic.VariablePowerParameters(
     factor=fr.Fraction(1),
 )
 
+WANTED_NATIVE_CLASSES = frozenset(
+    {
+        *ITEM_KINDS_BY_NATIVE_CLASS,
+        *BUILDING_POWER_MODES_BY_NATIVE_CLASS,
+        RECIPE_NATIVE_CLASS,
+    }
+)
+
+# A section object opening with its NativeClass key, as the docs files are laid out.
+_SECTION_START = re.compile(r'\{\s*"NativeClass"\s*:\s*"((?:[^"\\]|\\.)*)"')
+# Enough text to hold a leading NativeClass key and value.
+_PEEK_CHARS = 4096
+_READ_CHUNK_CHARS = 1 << 20
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+class LoadPhase(enum.StrEnum):
+    READ_FILE = enum.auto()
+    DECODE_JSON = enum.auto()
+    VALIDATE_SECTIONS = enum.auto()
+    PARSE_ITEMS = enum.auto()
+    PARSE_BUILDINGS = enum.auto()
+    PARSE_RECIPES = enum.auto()
+    RESOLVE_RECIPES = enum.auto()
+    BUILD_REPORT = enum.auto()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class PhaseCost:
+    """Wall time spent in a load phase, and peak traced memory while in it."""
+
+    seconds: float
+    peak_bytes: int
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class ParseReport:
@@ -83,6 +128,15 @@ class ParseReport:
         str, ic.VariablePowerParameters
     ]
     recipe_power_recipes_with_default_parameters: frozenset[str]
+    loaded_section_count: int
+    skipped_section_count: int
+    # Cost of reading and decoding the docs file; varies run to run.
+    docs_load_seconds: float = dataclasses.field(default=0.0, compare=False)
+    docs_load_peak_bytes: int | None = dataclasses.field(default=None, compare=False)
+    # Only filled in when parsing with profile=True.
+    phase_costs: dict[LoadPhase, PhaseCost] = dataclasses.field(
+        default_factory=dict[LoadPhase, PhaseCost], compare=False
+    )
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
@@ -111,6 +165,55 @@ class _RawRecipe:
     variable_power: ic.VariablePowerParameters
 
 
+_DOCS_LOAD_PHASES = (
+    LoadPhase.READ_FILE,
+    LoadPhase.DECODE_JSON,
+    LoadPhase.VALIDATE_SECTIONS,
+)
+
+
+class _PhaseRecorder:
+    """
+    Accumulates time and peak traced memory per phase, if enabled.
+
+    on_phase, if given, is called whenever a different phase is entered.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        on_phase: cabc.Callable[[LoadPhase], None] | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.on_phase = on_phase
+        self.costs: dict[LoadPhase, PhaseCost] = {}
+        self._current_phase: LoadPhase | None = None
+
+    @contextlib.contextmanager
+    def phase(self, phase: LoadPhase) -> cabc.Generator[None]:
+        if self.on_phase is not None and phase is not self._current_phase:
+            self.on_phase(phase)
+        self._current_phase = phase
+        if not self.enabled:
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            # Phases can be entered repeatedly, e.g. once per section.
+            previous = self.costs.get(phase)
+            if previous is not None:
+                seconds += previous.seconds
+                peak_bytes = max(peak_bytes, previous.peak_bytes)
+            self.costs[phase] = PhaseCost(seconds=seconds, peak_bytes=peak_bytes)
+
+
 def _validated_record(value: object) -> dict[str, object]:
     if not isinstance(value, dict):
         raise TypeError(f"Expected docs class record to be an object, got {value!r}")
@@ -131,31 +234,159 @@ def _string_record(record: dict[str, object]) -> dict[str, str]:
     return string_record
 
 
-def _load_sections(docs_json: pathlib.Path) -> tuple[_DocsSection, ...]:
-    with open(docs_json, "rb") as source:
-        raw_data = ty.cast(object, json.load(source))
-    if not isinstance(raw_data, list):
-        raise TypeError("Expected Satisfactory docs root to be a list")
+def _validated_section(raw_section: object) -> _DocsSection:
+    if not isinstance(raw_section, dict):
+        raise TypeError("Expected each Satisfactory docs section to be an object")
+    raw_section = ty.cast(dict[object, object], raw_section)
+    native_class = raw_section.get("NativeClass")
+    raw_records = raw_section.get("Classes")
+    if not isinstance(native_class, str) or not isinstance(raw_records, list):
+        raise TypeError("Docs section requires string NativeClass and list Classes")
+    return _DocsSection(
+        native_class=native_class,
+        records=tuple(
+            _validated_record(record) for record in ty.cast(list[object], raw_records)
+        ),
+    )
 
-    sections: list[_DocsSection] = []
-    for raw_section in ty.cast(list[object], raw_data):
-        if not isinstance(raw_section, dict):
+
+class _SectionReader:
+    """
+    Walks the docs root list one section at a time, reading the file in chunks.
+
+    Only the unread rest of the current chunk is held, plus the text of a
+    section being kept; skipped sections are scanned for their end and dropped.
+    """
+
+    def __init__(self, source: ty.TextIO) -> None:
+        self._source = source
+        self._buffer = ""
+        self._position = 0
+        self._in_list = False
+
+    def _refill(self) -> bool:
+        chunk = self._source.read(_READ_CHUNK_CHARS)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _next_char(self) -> str:
+        """Skip whitespace; return the next character, or "" at the end of the file."""
+        while True:
+            self._position = ty.cast(
+                re.Match[str], _WHITESPACE.match(self._buffer, self._position)
+            ).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._refill():
+                return ""
+
+    def next_section(self) -> bool:
+        """Move to the start of the next section; False once the root list ends."""
+        char = self._next_char()
+        if not self._in_list:
+            if char != "[":
+                raise TypeError("Expected Satisfactory docs root to be a list")
+            self._in_list = True
+            self._position += 1
+            char = self._next_char()
+            if char == "]":
+                return False
+        elif char == ",":
+            self._position += 1
+            char = self._next_char()
+        elif char == "]":
+            return False
+        else:
+            raise ValueError(f"Expected , or ] after a docs section, got {char!r}")
+        if char != "{":
             raise TypeError("Expected each Satisfactory docs section to be an object")
-        raw_section = ty.cast(dict[object, object], raw_section)
-        native_class = raw_section.get("NativeClass")
-        raw_records = raw_section.get("Classes")
-        if not isinstance(native_class, str) or not isinstance(raw_records, list):
-            raise TypeError("Docs section requires string NativeClass and list Classes")
-        sections.append(
-            _DocsSection(
-                native_class=native_class,
-                records=tuple(
-                    _validated_record(record)
-                    for record in ty.cast(list[object], raw_records)
-                ),
-            )
-        )
-    return tuple(sections)
+        return True
+
+    def leading_native_class(self) -> str | None:
+        """The section's NativeClass, if it is the first key, as the docs lay it out."""
+        while len(self._buffer) - self._position < _PEEK_CHARS and self._refill():
+            pass
+        match = _SECTION_START.match(self._buffer, self._position)
+        if match is None:
+            return None
+        native_class = match[1]
+        if "\\" in native_class:
+            native_class = ty.cast(str, json.loads(f'"{native_class}"'))
+        return native_class
+
+    def take_section(self, *, keep: bool) -> str:
+        """Move past the current section, returning its text if keep, else ""."""
+        parts: list[str] = []
+        start = self._position
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buffer, self._position)
+            if match is None:
+                resume = len(self._buffer)
+            elif match[0] == '"':
+                string = _STRING.match(self._buffer, match.start())
+                if string is not None:
+                    self._position = string.end()
+                    continue
+                # The string goes on into the next chunk; rescan it from its quote.
+                resume = match.start()
+            else:
+                depth += 1 if match[0] in "{[" else -1
+                self._position = match.end()
+                if depth == 0:
+                    if keep:
+                        parts.append(self._buffer[start : self._position])
+                    return "".join(parts)
+                continue
+
+            if keep:
+                parts.append(self._buffer[start:resume])
+            self._position = resume
+            if not self._refill():
+                raise ValueError("Satisfactory docs JSON ends inside a section")
+            start = 0
+
+
+def _load_wanted_sections(
+    docs_json: pathlib.Path,
+    recorder: _PhaseRecorder,
+) -> tuple[tuple[_DocsSection, ...], int]:
+    """
+    Decode only sections whose NativeClass is wanted; also return how many were skipped.
+
+    The file is streamed one section at a time, so skipped sections never become
+    Python objects and the whole text is never held at once. A section that does
+    not lead with its NativeClass is decoded to find out whether it is wanted.
+    """
+    sections: list[_DocsSection] = []
+    skipped_count = 0
+    with recorder.phase(LoadPhase.READ_FILE), open(docs_json, "rb") as source:
+        encoding = json.detect_encoding(source.read(4))
+    with open(docs_json, encoding=encoding, newline="") as source:
+        reader = _SectionReader(source)
+        while True:
+            with recorder.phase(LoadPhase.READ_FILE):
+                if not reader.next_section():
+                    break
+                native_class = reader.leading_native_class()
+                wanted = native_class is None or native_class in WANTED_NATIVE_CLASSES
+                section_text = reader.take_section(keep=wanted)
+            if not wanted:
+                skipped_count += 1
+                continue
+
+            with recorder.phase(LoadPhase.DECODE_JSON):
+                raw_section = ty.cast(object, json.loads(section_text))
+            with recorder.phase(LoadPhase.VALIDATE_SECTIONS):
+                section = _validated_section(raw_section)
+            if section.native_class in WANTED_NATIVE_CLASSES:
+                sections.append(section)
+            else:
+                skipped_count += 1
+    return tuple(sections), skipped_count
 
 
 def _parse_item(
@@ -249,15 +480,14 @@ def _parse_recipe(
 def _convert_item_counts(
     counts: dict[str, fr.Fraction],
     items: dict[str, ic.Item],
-) -> sc.ScalableCounter[ic.Item]:
-    converted = sc.ScalableCounter[ic.Item]()
+) -> item_counter.ItemCounter:
+    converted: dict[ic.Item, fr.Fraction] = {}
     for class_name, amount in counts.items():
         item = items[class_name]
         if item.is_fluid:
             amount /= 1000
         converted[item] = amount
-    converted.freeze()
-    return converted
+    return item_counter.ItemCounter(converted, frozen=True)
 
 
 def _resolve_power_profile(
@@ -295,9 +525,38 @@ def _resolve_recipe(
     )
 
 
-def parse_game_data(docs_json: pathlib.Path) -> ParseResult:
-    """Load supported production data and report why other recipes were excluded."""
-    sections = _load_sections(docs_json)
+def parse_game_data(
+    docs_json: pathlib.Path,
+    *,
+    profile: bool = False,
+    on_phase: cabc.Callable[[LoadPhase], None] | None = None,
+) -> ParseResult:
+    """
+    Load supported production data and report why other recipes were excluded.
+
+    With profile, the report also gets time and peak traced memory for each
+    LoadPhase. Tracing memory makes loading noticeably slower. on_phase is
+    called with each LoadPhase as loading reaches it, e.g. to show progress.
+    """
+    started_tracing = profile and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        return _parse_game_data(
+            docs_json, _PhaseRecorder(enabled=profile, on_phase=on_phase)
+        )
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _parse_game_data(
+    docs_json: pathlib.Path,
+    recorder: _PhaseRecorder,
+) -> ParseResult:
+    load_started = time.perf_counter()
+    sections, skipped_section_count = _load_wanted_sections(docs_json, recorder)
+    docs_load_seconds = time.perf_counter() - load_started
     items: dict[str, ic.Item] = {}
     buildings: dict[str, ic.Building] = {}
     raw_recipes: dict[str, _RawRecipe] = {}
@@ -306,120 +565,151 @@ def parse_game_data(docs_json: pathlib.Path) -> ParseResult:
         if (
             item_kind := ITEM_KINDS_BY_NATIVE_CLASS.get(section.native_class)
         ) is not None:
-            for record in section.records:
-                item = _parse_item(
-                    record,
-                    source_native_class=section.native_class,
-                    kind=item_kind,
-                )
-                if item.class_name in items:
-                    raise RuntimeError(f"Duplicate item class {item.class_name}")
-                items[item.class_name] = item
+            with recorder.phase(LoadPhase.PARSE_ITEMS):
+                for record in section.records:
+                    item = _parse_item(
+                        record,
+                        source_native_class=section.native_class,
+                        kind=item_kind,
+                    )
+                    if item.class_name in items:
+                        raise RuntimeError(f"Duplicate item class {item.class_name}")
+                    items[item.class_name] = item
             continue
 
         if (
             power_mode := BUILDING_POWER_MODES_BY_NATIVE_CLASS.get(section.native_class)
         ) is not None:
-            for record in section.records:
-                building = _parse_building(
-                    record,
-                    source_native_class=section.native_class,
-                    power_mode=power_mode,
-                )
-                if building.class_name in buildings:
-                    raise RuntimeError(
-                        f"Duplicate building class {building.class_name}"
+            with recorder.phase(LoadPhase.PARSE_BUILDINGS):
+                for record in section.records:
+                    building = _parse_building(
+                        record,
+                        source_native_class=section.native_class,
+                        power_mode=power_mode,
                     )
-                buildings[building.class_name] = building
+                    if building.class_name in buildings:
+                        raise RuntimeError(
+                            f"Duplicate building class {building.class_name}"
+                        )
+                    buildings[building.class_name] = building
             continue
 
         if section.native_class == RECIPE_NATIVE_CLASS:
-            for record in section.records:
-                recipe = _parse_recipe(
-                    record,
-                    source_native_class=section.native_class,
+            with recorder.phase(LoadPhase.PARSE_RECIPES):
+                for record in section.records:
+                    recipe = _parse_recipe(
+                        record,
+                        source_native_class=section.native_class,
+                    )
+                    if recipe.class_name in raw_recipes:
+                        raise RuntimeError(
+                            f"Duplicate recipe class {recipe.class_name}"
+                        )
+                    raw_recipes[recipe.class_name] = recipe
+
+    with recorder.phase(LoadPhase.RESOLVE_RECIPES):
+        automated_recipes: dict[str, tuple[_RawRecipe, ic.Building]] = {}
+        ignored_recipe_count = 0
+        for class_name, raw_recipe in raw_recipes.items():
+            producers = [
+                buildings[producer_class]
+                for producer_class in raw_recipe.produced_in
+                if producer_class in buildings
+            ]
+            if not producers:
+                ignored_recipe_count += 1
+                continue
+            if len(producers) > 1:
+                raise RuntimeError(
+                    f"Recipe {class_name} resolved to multiple automated producers: "
+                    f"{producers}"
                 )
-                if recipe.class_name in raw_recipes:
-                    raise RuntimeError(f"Duplicate recipe class {recipe.class_name}")
-                raw_recipes[recipe.class_name] = recipe
-
-    automated_recipes: dict[str, tuple[_RawRecipe, ic.Building]] = {}
-    ignored_recipe_count = 0
-    for class_name, raw_recipe in raw_recipes.items():
-        producers = [
-            buildings[producer_class]
-            for producer_class in raw_recipe.produced_in
-            if producer_class in buildings
-        ]
-        if not producers:
-            ignored_recipe_count += 1
-            continue
-        if len(producers) > 1:
-            raise RuntimeError(
-                f"Recipe {class_name} resolved to multiple automated producers: "
-                f"{producers}"
+            automated_recipes[class_name] = (raw_recipe, producers[0])
+
+        missing_item_classes_by_recipe = {
+            class_name: frozenset(
+                item_class
+                for counts in (raw_recipe.ingredients, raw_recipe.products)
+                for item_class in counts
+                if item_class not in items
             )
-        automated_recipes[class_name] = (raw_recipe, producers[0])
-
-    missing_item_classes_by_recipe = {
-        class_name: frozenset(
-            item_class
-            for counts in (raw_recipe.ingredients, raw_recipe.products)
-            for item_class in counts
-            if item_class not in items
+            for class_name, (raw_recipe, _building) in automated_recipes.items()
+        }
+        missing_item_classes_by_recipe = {
+            class_name: missing_items
+            for class_name, missing_items in missing_item_classes_by_recipe.items()
+            if missing_items
+        }
+
+        fixed_power_recipes_with_nondefault_parameters = {
+            class_name: raw_recipe.variable_power
+            for class_name, (raw_recipe, building) in automated_recipes.items()
+            if building.power_mode is ic.BuildingPowerMode.CONSTANT
+            and raw_recipe.variable_power != DOCS_DEFAULT_VARIABLE_POWER
+        }
+        recipe_power_recipes_with_default_parameters = frozenset(
+            class_name
+            for class_name, (raw_recipe, building) in automated_recipes.items()
+            if building.power_mode is ic.BuildingPowerMode.RECIPE_DEFINED
+            and raw_recipe.variable_power == DOCS_DEFAULT_VARIABLE_POWER
         )
-        for class_name, (raw_recipe, _building) in automated_recipes.items()
-    }
-    missing_item_classes_by_recipe = {
-        class_name: missing_items
-        for class_name, missing_items in missing_item_classes_by_recipe.items()
-        if missing_items
-    }
 
-    fixed_power_recipes_with_nondefault_parameters = {
-        class_name: raw_recipe.variable_power
-        for class_name, (raw_recipe, building) in automated_recipes.items()
-        if building.power_mode is ic.BuildingPowerMode.CONSTANT
-        and raw_recipe.variable_power != DOCS_DEFAULT_VARIABLE_POWER
-    }
-    recipe_power_recipes_with_default_parameters = frozenset(
-        class_name
-        for class_name, (raw_recipe, building) in automated_recipes.items()
-        if building.power_mode is ic.BuildingPowerMode.RECIPE_DEFINED
-        and raw_recipe.variable_power == DOCS_DEFAULT_VARIABLE_POWER
-    )
+        recipes = {
+            class_name: _resolve_recipe(
+                raw_recipe,
+                items=items,
+                building=building,
+            )
+            for class_name, (raw_recipe, building) in automated_recipes.items()
+            if class_name not in missing_item_classes_by_recipe
+        }
 
-    recipes = {
-        class_name: _resolve_recipe(
-            raw_recipe,
-            items=items,
-            building=building,
-        )
-        for class_name, (raw_recipe, building) in automated_recipes.items()
-        if class_name not in missing_item_classes_by_recipe
-    }
-    report = ParseReport(
-        raw_recipe_count=len(raw_recipes),
-        automated_recipe_count=len(automated_recipes),
-        loaded_recipe_count=len(recipes),
-        ignored_recipe_count=ignored_recipe_count,
-        skipped_recipe_count=len(missing_item_classes_by_recipe),
-        missing_item_classes_by_recipe=missing_item_classes_by_recipe,
-        fixed_power_recipes_with_nondefault_parameters=(
-            fixed_power_recipes_with_nondefault_parameters
-        ),
-        recipe_power_recipes_with_default_parameters=(
-            recipe_power_recipes_with_default_parameters
-        ),
-    )
-    return ParseResult(
-        game_data=ic.GameData(
+    with recorder.phase(LoadPhase.BUILD_REPORT):
+        game_data = ic.GameData(
             buildings_d=buildings,
             items_d=items,
             recipes_d=recipes,
-        ),
-        report=report,
-    )
+        )
+        report = ParseReport(
+            raw_recipe_count=len(raw_recipes),
+            automated_recipe_count=len(automated_recipes),
+            loaded_recipe_count=len(recipes),
+            ignored_recipe_count=ignored_recipe_count,
+            skipped_recipe_count=len(missing_item_classes_by_recipe),
+            missing_item_classes_by_recipe=missing_item_classes_by_recipe,
+            fixed_power_recipes_with_nondefault_parameters=(
+                fixed_power_recipes_with_nondefault_parameters
+            ),
+            recipe_power_recipes_with_default_parameters=(
+                recipe_power_recipes_with_default_parameters
+            ),
+            loaded_section_count=len(sections),
+            skipped_section_count=skipped_section_count,
+            docs_load_seconds=docs_load_seconds,
+            docs_load_peak_bytes=max(
+                (
+                    recorder.costs[phase].peak_bytes
+                    for phase in _DOCS_LOAD_PHASES
+                    if phase in recorder.costs
+                ),
+                default=None,
+            ),
+            # Shared with the recorder, so this phase's own cost lands in it too.
+            phase_costs=recorder.costs,
+        )
+    return ParseResult(game_data=game_data, report=report)
+
+
+def format_phase_costs(report: ParseReport) -> str:
+    """Render a profiled report's phase costs as an aligned table."""
+    lines = [f"{'Phase':<20}{'Seconds':>10}{'Peak MiB':>12}"]
+    for phase, cost in report.phase_costs.items():
+        lines.append(
+            f"{phase:<20}{cost.seconds:>10.3f}{cost.peak_bytes / 2**20:>12.1f}"
+        )
+    total_seconds = sum(cost.seconds for cost in report.phase_costs.values())
+    lines.append(f"{'total':<20}{total_seconds:>10.3f}")
+    return "\n".join(lines)
 
 
 def load_game_data(docs_json: pathlib.Path) -> ic.GameData:
@@ -9,9 +9,7 @@ import sys
 from PySide6 import QtCore, QtWidgets
 
 from satisfactory_recipes import config as sr_config
-from satisfactory_recipes import docs_parser
 from satisfactory_recipes import info_classes as ic
-from satisfactory_recipes import production_chain as pc
 from satisfactory_recipes.gui import dialogs
 from satisfactory_recipes.gui import main_window
 
@@ -89,6 +87,8 @@ def main(
     game_path: pathlib.Path | None = None,
     filename: pathlib.Path | None = None,
     initial_scale: fr.Fraction = fr.Fraction(1, 1),
+    use_docs_cache: bool = True,
+    profile_load: bool = False,
 ) -> int:
     app = QtWidgets.QApplication.instance()
     owns_app = app is None
@@ -105,24 +105,19 @@ def main(
         return 1
 
     docs_path, user_config = docs_resolution
-    game_data = docs_parser.load_game_data(docs_path)
-    production_chain = None
-    if filename is not None:
-        production_chain = pc.ProductionChain.load(filename, game_data)
-    elif initial_scale != 1:
-        game_data.scale_recipes(initial_scale)
-
+    # Show the window at once; the docs load behind it, with progress.
     window = main_window.MainWindow(
         docs_path=docs_path,
-        game_data=game_data,
+        game_data=ic.GameData(buildings_d={}, items_d={}, recipes_d={}),
         user_config=user_config,
-        production_chain=production_chain,
-        filename=filename,
+        use_docs_cache=use_docs_cache,
     )
     window.show()
-
-    if production_chain is None:
-        QtCore.QTimer.singleShot(0, window.prompt_for_goal_if_needed)
+    window.load_startup_data(
+        filename=filename,
+        initial_scale=initial_scale,
+        profile=profile_load,
+    )
 
     if owns_app:
         return app.exec()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import collections.abc as cabc
+import concurrent.futures
 import dataclasses
 import fractions as fr
 import typing as ty
@@ -11,6 +12,8 @@ from PySide6 import QtCore, QtWidgets
 
 from satisfactory_recipes import search
 
+_NO_PARENT = QtCore.QModelIndex()
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class SelectionOption[T]:
@@ -27,11 +30,125 @@ def _default_selection_sort_key[T](
     return False, option.label.casefold()
 
 
+# One worker, so a search index is never used by two searches at once.
+_BACKGROUND_SEARCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="selection-search",
+)
+
+
+class SelectionListModel[T](QtCore.QAbstractListModel):
+    """Read-only model over a fixed tuple of selection options."""
+
+    def __init__(
+        self,
+        options: tuple[SelectionOption[T], ...],
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.options = options
+
+    def rowCount(
+        self,
+        parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _NO_PARENT,
+    ) -> int:
+        return 0 if parent.isValid() else len(self.options)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if not index.isValid():
+            return None
+        option = self.options[index.row()]
+        match role:
+            case QtCore.Qt.ItemDataRole.DisplayRole:
+                return option.label
+            case QtCore.Qt.ItemDataRole.ToolTipRole:
+                return option.subtitle or None
+            case QtCore.Qt.ItemDataRole.UserRole:
+                return option.value
+            case _:
+                return None
+
+
+class RowOrderProxyModel(QtCore.QAbstractProxyModel):
+    """Shows a subset of a list model's rows in a given order."""
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._source_rows: list[int] = []
+        self._proxy_rows: dict[int, int] = {}
+
+    def set_source_rows(self, source_rows: cabc.Sequence[int]) -> None:
+        self.beginResetModel()
+        self._source_rows = list(source_rows)
+        self._proxy_rows = {
+            source_row: proxy_row for proxy_row, source_row in enumerate(source_rows)
+        }
+        self.endResetModel()
+
+    def rowCount(
+        self,
+        parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _NO_PARENT,
+    ) -> int:
+        return 0 if parent.isValid() else len(self._source_rows)
+
+    def columnCount(
+        self,
+        parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _NO_PARENT,
+    ) -> int:
+        return 0 if parent.isValid() else 1
+
+    def index(
+        self,
+        row: int,
+        column: int,
+        parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _NO_PARENT,
+    ) -> QtCore.QModelIndex:
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(  # type: ignore[override]
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+    ) -> QtCore.QModelIndex:
+        return QtCore.QModelIndex()
+
+    def mapToSource(
+        self,
+        proxyIndex: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+    ) -> QtCore.QModelIndex:
+        if not proxyIndex.isValid():
+            return QtCore.QModelIndex()
+        return self.sourceModel().index(self._source_rows[proxyIndex.row()], 0)
+
+    def mapFromSource(
+        self,
+        sourceIndex: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+    ) -> QtCore.QModelIndex:
+        proxy_row = self._proxy_rows.get(sourceIndex.row())
+        if not sourceIndex.isValid() or proxy_row is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(proxy_row, 0)
+
+
 class SearchableSelectionList[T](QtWidgets.QWidget):
-    """A searchable single-selection list carrying arbitrary Python objects."""
+    """
+    A searchable single-selection list carrying arbitrary Python objects.
+
+    Large option sets are ranked on a worker thread once typing pauses, so the
+    list only changes after the last keystroke and the GUI never waits.
+    """
+
+    debounce_interval_ms = 150
+    background_search_threshold = 5000
 
     selection_changed = QtCore.Signal(object)
     selection_activated = QtCore.Signal(object)
+    _matches_ready = QtCore.Signal(int, object)
 
     def __init__(
         self,
@@ -41,78 +158,145 @@ class SearchableSelectionList[T](QtWidgets.QWidget):
         unfiltered_sort_key: cabc.Callable[[SelectionOption[T]], tuple[bool, str]]
         | None = None,
         detail_widget: QtWidgets.QWidget | None = None,
+        search_index: search.Searcher[SelectionOption[T]] | None = None,
         parent: QtWidgets.QWidget | None = None,
     ) -> None:
         super().__init__(parent)
         self._options = tuple(options)
-        self._unfiltered_sort_key: cabc.Callable[
-            [SelectionOption[T]], tuple[bool, str]
-        ] = (
+        self._rows_by_option_id = {
+            id(option): row for row, option in enumerate(self._options)
+        }
+        self._search_index: search.Searcher[SelectionOption[T]] = (
+            search_index
+            if search_index is not None
+            else search.SearchIndex(self._options, label=lambda option: option.label)
+        )
+        sort_key = (
             unfiltered_sort_key
             if unfiltered_sort_key is not None
             else _default_selection_sort_key
         )
+        self._unfiltered_rows = sorted(
+            range(len(self._options)),
+            key=lambda row: sort_key(self._options[row]),
+        )
+        # Bumped by every refresh, so late background results are dropped.
+        self._search_generation = 0
 
         self.search_edit = QtWidgets.QLineEdit()
         self.search_edit.setPlaceholderText(search_placeholder)
-        self.list_widget = QtWidgets.QListWidget()
-        self.list_widget.setSelectionMode(
+        self.model = SelectionListModel(self._options, self)
+        self.proxy_model = RowOrderProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setModel(self.proxy_model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
         )
 
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.debounce_interval_ms)
+
         layout = QtWidgets.QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.search_edit)
         if detail_widget is None:
-            layout.addWidget(self.list_widget)
+            layout.addWidget(self.list_view)
         else:
             splitter = QtWidgets.QSplitter()
-            splitter.addWidget(self.list_widget)
+            splitter.addWidget(self.list_view)
             splitter.addWidget(detail_widget)
             splitter.setStretchFactor(0, 2)
             splitter.setStretchFactor(1, 3)
             layout.addWidget(splitter)
         self.setLayout(layout)
 
-        self.search_edit.textChanged.connect(self.refresh)
-        self.list_widget.itemSelectionChanged.connect(self._emit_selection)
-        self.list_widget.itemDoubleClicked.connect(self._emit_activation)
+        self.search_edit.textChanged.connect(self._schedule_refresh)
+        self._refresh_timer.timeout.connect(
+            lambda: self.refresh(self.search_edit.text())
+        )
+        self._matches_ready.connect(self._show_background_matches)
+        selection_model = self.list_view.selectionModel()
+        assert selection_model is not None
+        selection_model.selectionChanged.connect(self._emit_selection)
+        self.list_view.doubleClicked.connect(self._emit_activation)
         self.refresh("")
 
     @property
     def selected_object(self) -> T | None:
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        selected_indexes = self.list_view.selectedIndexes()
+        if not selected_indexes:
             return None
-        return self._object_from_item(selected_items[0])
+        return self._object_from_index(selected_indexes[0])
+
+    @property
+    def searches_in_background(self) -> bool:
+        return len(self._options) >= self.background_search_threshold
 
     def refresh(self, text: str) -> None:
-        options = (
-            search.sort_objects(self._options, text, label=lambda option: option.label)
-            if text
-            else sorted(self._options, key=self._unfiltered_sort_key)
-        )
+        self._refresh_timer.stop()
+        self._search_generation += 1
+        if not text:
+            self._show_rows(self._unfiltered_rows)
+        elif not self.searches_in_background:
+            self._show_matches(self._search_index.best_matches(text))
+        else:
+            generation = self._search_generation
+            future = _BACKGROUND_SEARCH_EXECUTOR.submit(
+                self._search_index.best_matches, text
+            )
+            future.add_done_callback(
+                lambda done: self._deliver_background_matches(generation, done)
+            )
 
-        self.list_widget.clear()
-        for option in options:
-            item = QtWidgets.QListWidgetItem(option.label)
-            if option.subtitle:
-                item.setToolTip(option.subtitle)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, option.value)
-            self.list_widget.addItem(item)
+    def _schedule_refresh(self, text: str) -> None:
+        if self.searches_in_background:
+            self._refresh_timer.start()
+        else:
+            self.refresh(text)
 
-        if self.list_widget.count():
-            self.list_widget.setCurrentRow(0)
+    def _deliver_background_matches(
+        self,
+        generation: int,
+        future: concurrent.futures.Future[list[SelectionOption[T]]],
+    ) -> None:
+        # Runs on the worker thread; the signal queues the result to the GUI.
+        try:
+            self._matches_ready.emit(generation, future)
+        except RuntimeError:
+            pass  # The widget was deleted while searching.
+
+    def _show_background_matches(
+        self,
+        generation: int,
+        future: concurrent.futures.Future[list[SelectionOption[T]]],
+    ) -> None:
+        if generation == self._search_generation:
+            self._show_matches(future.result())
+
+    def _show_matches(self, matches: cabc.Iterable[SelectionOption[T]]) -> None:
+        self._show_rows([self._rows_by_option_id[id(option)] for option in matches])
+
+    def _show_rows(self, rows: cabc.Sequence[int]) -> None:
+        self.proxy_model.set_source_rows(rows)
+        if rows:
+            self.list_view.setCurrentIndex(self.proxy_model.index(0, 0))
+        else:
+            self._emit_selection()
 
     def _emit_selection(self) -> None:
         self.selection_changed.emit(self.selected_object)
 
-    def _emit_activation(self, item: QtWidgets.QListWidgetItem) -> None:
-        self.selection_activated.emit(self._object_from_item(item))
+    def _emit_activation(self, index: QtCore.QModelIndex) -> None:
+        self.selection_activated.emit(self._object_from_index(index))
 
     @staticmethod
-    def _object_from_item(item: QtWidgets.QListWidgetItem) -> T:
-        return ty.cast("T", item.data(QtCore.Qt.ItemDataRole.UserRole))
+    def _object_from_index(
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+    ) -> T:
+        return ty.cast("T", index.data(QtCore.Qt.ItemDataRole.UserRole))
 
 
 class PositiveFractionInput(QtWidgets.QWidget):
@@ -12,6 +12,8 @@ from PySide6 import QtWidgets
 
 from satisfactory_recipes import config as sr_config
 from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import recipe_search
+from satisfactory_recipes import search
 from satisfactory_recipes.gui import dialog_components, recipe_format
 
 
@@ -187,6 +189,8 @@ class _SearchDialog[T](QtWidgets.QDialog):
         ]
         | None = None,
         detail_widget: QtWidgets.QWidget | None = None,
+        search_index: search.Searcher[dialog_components.SelectionOption[T]]
+        | None = None,
         parent: QtWidgets.QWidget | None = None,
     ) -> None:
         super().__init__(parent)
@@ -200,6 +204,7 @@ class _SearchDialog[T](QtWidgets.QDialog):
             search_placeholder=search_placeholder,
             unfiltered_sort_key=unfiltered_sort_key,
             detail_widget=detail_widget,
+            search_index=search_index,
         )
         self.search_edit = self.selection_widget.search_edit
 
@@ -287,7 +292,7 @@ class ItemSearchDialog(_SearchDialog[ic.Item]):
             show_amount=show_amount,
             parent=parent,
         )
-        self.item_list = self.selection_widget.list_widget
+        self.item_list = self.selection_widget.list_view
         if allow_load_file:
             load_button = self.button_box.addButton(
                 "Load File...",
@@ -382,20 +387,25 @@ class RecipeSearchDialog(_SearchDialog[ic.Recipe]):
         self.selected_recipe: ic.Recipe | None = None
         self.details = QtWidgets.QTextEdit()
         self.details.setReadOnly(True)
+        options = [
+            dialog_components.SelectionOption(label=recipe.name, value=recipe)
+            for recipe in recipes
+        ]
         super().__init__(
-            options=(
-                dialog_components.SelectionOption(label=recipe.name, value=recipe)
-                for recipe in recipes
-            ),
+            options=options,
             title=title,
-            search_placeholder="Search recipes",
+            search_placeholder='Search recipes, or "uses:", "makes:" or "in:" a name',
             size=(760, 640),
             show_amount=show_amount,
             unfiltered_sort_key=_recipe_selection_sort_key,
             detail_widget=self.details,
+            search_index=recipe_search.RecipeSearchIndex(
+                options,
+                recipe=lambda option: option.value,
+            ),
             parent=parent,
         )
-        self.recipe_list = self.selection_widget.list_widget
+        self.recipe_list = self.selection_widget.list_view
         self.selection_widget.selection_changed.connect(self._update_recipe_preview)
         self._update_recipe_preview(self.selection_widget.selected_object)
 
@@ -2,21 +2,48 @@
 
 from __future__ import annotations
 
+import collections.abc as cabc
+import concurrent.futures
 import fractions as fr
 import pathlib
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from satisfactory_recipes import config as sr_config
+from satisfactory_recipes import docs_cache
 from satisfactory_recipes import docs_parser
+from satisfactory_recipes import history
 from satisfactory_recipes import info_classes as ic
 from satisfactory_recipes import production_chain as pc
 from satisfactory_recipes.gui import appearance, dialogs, view_state, widgets
 
+# One worker, so a newer view state is never computed beside an older one.
+_VIEW_STATE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="view-state",
+)
+# Parsing docs takes seconds, so it never runs on the GUI thread either.
+_DOCS_LOAD_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="docs-load",
+)
+_LOAD_PHASES = tuple(docs_parser.LoadPhase)
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """Top-level GUI window for a production chain."""
 
+    # Chains with at least this many recipes compute their view state off
+    # the GUI thread, so edits to big chains do not freeze the window.
+    background_refresh_threshold = 200
+    # Where those view states are computed; it must run one task at a time, so
+    # a newer view state is never computed beside an older one.
+    view_state_executor: concurrent.futures.Executor = _VIEW_STATE_EXECUTOR
+
+    _view_state_ready = QtCore.Signal(int, object)
+    _docs_load_progress = QtCore.Signal(int, object)
+    _docs_loaded = QtCore.Signal(int, object)
+
     def __init__(
         self,
         *,
@@ -25,15 +52,24 @@ class MainWindow(QtWidgets.QMainWindow):
         user_config: sr_config.Configuration,
         production_chain: pc.ProductionChain | None = None,
         filename: pathlib.Path | None = None,
+        use_docs_cache: bool = True,
     ) -> None:
         super().__init__()
         self.docs_path = docs_path
+        self.use_docs_cache = use_docs_cache
         self.user_config = user_config
         self.game_data = game_data
+        self.history: history.ChainHistory | None = None
         self.production_chain = production_chain
         self.filename = filename
         self.has_unsaved_changes = False
         self.selected_recipe: ic.Recipe | None = None
+        self._refresh_generation = 0
+        self._pending_refresh: (
+            concurrent.futures.Future[view_state.MainWindowViewState] | None
+        ) = None
+        self._docs_load_generation = 0
+        self._on_docs_loaded: cabc.Callable[[ic.GameData], None] | None = None
         self.appearance_manager = appearance.AppearanceManager(
             configuration=self.user_config,
             save_callback=self._save_user_config,
@@ -47,11 +83,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self.recipes_panel = widgets.RecipesPanel()
         self.chain_details = widgets.ChainDetailsTabs()
         self.status_label = QtWidgets.QLabel()
+        self.load_progress = QtWidgets.QProgressBar()
 
         self._setup_actions()
         self._setup_theme_actions()
         self._setup_layout()
         self.appearance_manager.apply_saved_preferences()
+        self._view_state_ready.connect(self._show_background_view_state)
+        self._docs_load_progress.connect(self._show_docs_load_progress)
+        self._docs_loaded.connect(self._finish_docs_load)
         self.refresh()
 
     def _setup_actions(self) -> None:
@@ -63,10 +103,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self.exit_action = QtGui.QAction("Exit", self)
         self.add_goal_recipe_action = QtGui.QAction("Add Goal Recipe...", self)
         self.add_shortage_recipe_action = QtGui.QAction("Add Shortage Recipe...", self)
+        self.undo_action = QtGui.QAction("Undo", self)
+        self.redo_action = QtGui.QAction("Redo", self)
+        self.round_goal_rate_action = QtGui.QAction("Round Goal Rate", self)
         self.open_action.setShortcut(QtGui.QKeySequence.StandardKey.Open)
         self.save_action.setShortcut(QtGui.QKeySequence.StandardKey.Save)
         self.save_as_action.setShortcut(QtGui.QKeySequence.StandardKey.SaveAs)
         self.new_action.setShortcut(QtGui.QKeySequence.StandardKey.New)
+        self.undo_action.setShortcut(QtGui.QKeySequence.StandardKey.Undo)
+        self.redo_action.setShortcut(QtGui.QKeySequence.StandardKey.Redo)
 
         self.new_action.triggered.connect(self.new_chain)
         self.open_action.triggered.connect(self.open_chain)
@@ -74,6 +119,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.save_action.triggered.connect(self.save_chain)
         self.save_as_action.triggered.connect(self.save_chain_as)
         self.exit_action.triggered.connect(self.close)
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action.triggered.connect(self.redo)
+        self.round_goal_rate_action.setStatusTip(
+            "Scale the whole chain so the goal rate is a simple fraction; "
+            "every net rate changes with it"
+        )
+        self.round_goal_rate_action.triggered.connect(self.round_goal_rate)
         self.add_goal_recipe_action.triggered.connect(self.add_goal_recipe_from_ui)
         self.add_shortage_recipe_action.triggered.connect(
             self.add_shortage_recipe_from_ui
@@ -89,6 +141,12 @@ class MainWindow(QtWidgets.QMainWindow):
         file_menu.addSeparator()
         file_menu.addAction(self.exit_action)
 
+        edit_menu = self.menuBar().addMenu("Edit")
+        edit_menu.addAction(self.undo_action)
+        edit_menu.addAction(self.redo_action)
+        edit_menu.addSeparator()
+        edit_menu.addAction(self.round_goal_rate_action)
+
         recipe_menu = self.menuBar().addMenu("Recipes")
         recipe_menu.addAction(self.add_goal_recipe_action)
         recipe_menu.addAction(self.add_shortage_recipe_action)
@@ -144,9 +202,27 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addWidget(splitter, stretch=1)
 
         self.status_label.setObjectName("statusLabel")
-        layout.addWidget(self.status_label)
+        self.load_progress.setTextVisible(True)
+        self.load_progress.hide()
+        status_row = QtWidgets.QHBoxLayout()
+        status_row.addWidget(self.status_label, stretch=1)
+        status_row.addWidget(self.load_progress)
+        layout.addLayout(status_row)
         self.setCentralWidget(central)
 
+    @property
+    def production_chain(self) -> pc.ProductionChain | None:
+        return self._production_chain
+
+    @production_chain.setter
+    def production_chain(self, chain: pc.ProductionChain | None) -> None:
+        # History covers edits to one chain; a different chain starts afresh.
+        self._production_chain = chain
+        if chain is None:
+            self.history = None
+        elif self.history is None or self.history.chain is not chain:
+            self.history = history.ChainHistory(chain)
+
     def prompt_for_goal_if_needed(self) -> None:
         if self.production_chain is not None:
             return
@@ -315,9 +391,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         filename = pathlib.Path(filename_str)
         try:
-            game_data = docs_parser.load_game_data(self.docs_path)
-            self.production_chain = pc.ProductionChain.load(filename, game_data)
-            self.game_data = game_data
+            self.production_chain, self.game_data = pc.ProductionChain.load_at_scale(
+                filename, self.game_data
+            )
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Open Failed", str(exc))
             return False
@@ -342,24 +418,159 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         scale = self.game_data.scale
+
+        def use_game_data(game_data: ic.GameData) -> None:
+            self.docs_path = selection.docs_path
+            self.game_data = game_data.at_scale(scale)
+            self.production_chain = None
+            self.filename = None
+            self.has_unsaved_changes = False
+            self.user_config.docs_path = selection.docs_path
+            self.user_config.game_path = selection.game_path
+            self._save_user_config()
+            self.refresh()
+
+        self.load_game_data_in_background(selection.docs_path, on_loaded=use_game_data)
+
+    def load_startup_data(
+        self,
+        *,
+        filename: pathlib.Path | None,
+        initial_scale: fr.Fraction,
+        profile: bool = False,
+    ) -> None:
+        """Load this window's docs, then open filename or prompt for a goal."""
+
+        def show_startup_data(game_data: ic.GameData) -> None:
+            if filename is not None:
+                try:
+                    self.production_chain, self.game_data = (
+                        pc.ProductionChain.load_at_scale(filename, game_data)
+                    )
+                except (OSError, ValueError) as exc:
+                    QtWidgets.QMessageBox.critical(self, "Open Failed", str(exc))
+                else:
+                    self.filename = filename
+                    self.refresh()
+                    return
+
+            self.game_data = game_data.at_scale(initial_scale)
+            self.refresh()
+            self.prompt_for_goal_if_needed()
+
+        self.load_game_data_in_background(
+            self.docs_path,
+            on_loaded=show_startup_data,
+            profile=profile,
+        )
+
+    @property
+    def loading_game_data(self) -> bool:
+        return self._on_docs_loaded is not None
+
+    def load_game_data_in_background(
+        self,
+        docs_path: pathlib.Path,
+        *,
+        on_loaded: cabc.Callable[[ic.GameData], None],
+        profile: bool = False,
+    ) -> None:
+        """
+        Load docs_path on a worker thread, then call on_loaded on the GUI thread.
+
+        Until then, progress is shown beside the status text and everything
+        that needs game data is disabled. Load failures are reported instead.
+        """
+        self._docs_load_generation += 1
+        generation = self._docs_load_generation
+        self._on_docs_loaded = on_loaded
+        # Busy until the parser reports its first phase; cache hits report none.
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setFormat("Loading game data...")
+        self.load_progress.show()
+        self._set_game_data_controls_enabled(False)
+
+        def report_phase(phase: docs_parser.LoadPhase) -> None:
+            try:
+                self._docs_load_progress.emit(generation, phase)
+            except RuntimeError:
+                pass  # The window was deleted while loading.
+
+        future = _DOCS_LOAD_EXECUTOR.submit(
+            docs_cache.load_game_data,
+            docs_path,
+            use_cache=self.use_docs_cache,
+            profile=profile,
+            on_phase=report_phase,
+        )
+        future.add_done_callback(lambda done: self._deliver_docs_load(generation, done))
+
+    def _deliver_docs_load(
+        self,
+        generation: int,
+        future: concurrent.futures.Future[ic.GameData],
+    ) -> None:
+        # Runs on the worker thread; the signal queues the result to the GUI.
+        try:
+            self._docs_loaded.emit(generation, future)
+        except RuntimeError:
+            pass  # The window was deleted while loading.
+
+    def _show_docs_load_progress(
+        self,
+        generation: int,
+        phase: docs_parser.LoadPhase,
+    ) -> None:
+        if generation != self._docs_load_generation:
+            return
+        # Sections are decoded and validated in turn, so never step backwards.
+        step = _LOAD_PHASES.index(phase) + 1
+        if self.load_progress.maximum() == 0 or step > self.load_progress.value():
+            self.load_progress.setRange(0, len(_LOAD_PHASES))
+            self.load_progress.setValue(step)
+            self.load_progress.setFormat(
+                f"Loading game data: {phase.replace('_', ' ')}"
+            )
+
+    def _finish_docs_load(
+        self,
+        generation: int,
+        future: concurrent.futures.Future[ic.GameData],
+    ) -> None:
+        if generation != self._docs_load_generation:
+            return
+        on_loaded = self._on_docs_loaded
+        assert on_loaded is not None
+        self._on_docs_loaded = None
+        self.load_progress.hide()
+        self._set_game_data_controls_enabled(True)
+
         try:
-            game_data = docs_parser.load_game_data(selection.docs_path)
+            game_data = future.result()
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Game Data Load Failed", str(exc))
+            self.refresh()
             return
 
-        if scale != 1:
-            game_data.scale_recipes(scale)
+        on_loaded(game_data)
 
-        self.docs_path = selection.docs_path
-        self.game_data = game_data
-        self.production_chain = None
-        self.filename = None
-        self.has_unsaved_changes = False
-        self.user_config.docs_path = selection.docs_path
-        self.user_config.game_path = selection.game_path
-        self._save_user_config()
-        self.refresh()
+    def _set_game_data_controls_enabled(self, enabled: bool) -> None:
+        for action in (
+            self.new_action,
+            self.open_action,
+            self.select_docs_action,
+            self.save_action,
+            self.save_as_action,
+        ):
+            action.setEnabled(enabled)
+        for widget in (self.goal_header, self.recipes_panel, self.chain_details):
+            widget.setEnabled(enabled)
+        if not enabled:
+            self.add_goal_recipe_action.setEnabled(False)
+            self.add_shortage_recipe_action.setEnabled(False)
+            self.undo_action.setEnabled(False)
+            self.redo_action.setEnabled(False)
+            self.round_goal_rate_action.setEnabled(False)
 
     def save_chain(self) -> None:
         if self.production_chain is None:
@@ -406,13 +617,117 @@ class MainWindow(QtWidgets.QMainWindow):
         self.refresh()
         return True
 
+    def undo(self) -> None:
+        if self.history is not None and self.history.undo():
+            self._mark_unsaved()
+            self.refresh()
+
+    def redo(self) -> None:
+        if self.history is not None and self.history.redo():
+            self._mark_unsaved()
+            self.refresh()
+
+    def round_goal_rate(self) -> None:
+        if self.production_chain is None:
+            return
+
+        chain = self.production_chain
+        old_rate = chain.get_net_per_min()[chain.goal]
+        try:
+            changed = chain.round_goal_rate()
+        except ValueError as exc:
+            QtWidgets.QMessageBox.critical(self, "Could Not Round", str(exc))
+            return
+
+        if changed:
+            self._mark_unsaved()
+        self.refresh()
+        if changed:
+            new_rate = chain.get_net_per_min()[chain.goal]
+            QtWidgets.QMessageBox.information(
+                self,
+                "Goal Rate Rounded",
+                f"Scaled the whole chain by {new_rate / old_rate}: "
+                f"{chain.goal.name} went from {old_rate}/min to {new_rate}/min, "
+                "and every other net rate changed by the same factor.",
+            )
+
     def refresh(self) -> None:
-        state = view_state.build_main_window_view_state(
-            chain=self.production_chain,
+        self._refresh_generation += 1
+        self.undo_action.setEnabled(
+            self.history is not None
+            and self.history.can_undo
+            and not self.loading_game_data
+        )
+        self.redo_action.setEnabled(
+            self.history is not None
+            and self.history.can_redo
+            and not self.loading_game_data
+        )
+        if self._pending_refresh is not None:
+            # Superseded; it is dropped if it has already started.
+            self._pending_refresh.cancel()
+            self._pending_refresh = None
+
+        chain = self.production_chain
+        if chain is None or len(chain.recipes) < self.background_refresh_threshold:
+            self._apply_view_state(
+                view_state.build_main_window_view_state(
+                    chain=chain,
+                    game_data=self.game_data,
+                    filename=self.filename,
+                    has_unsaved_changes=self.has_unsaved_changes,
+                )
+            )
+            return
+
+        generation = self._refresh_generation
+        future = self.view_state_executor.submit(
+            view_state.build_main_window_view_state,
+            chain=chain.snapshot(),
             game_data=self.game_data,
             filename=self.filename,
             has_unsaved_changes=self.has_unsaved_changes,
         )
+        self._pending_refresh = future
+        future.add_done_callback(
+            lambda done: self._deliver_view_state(generation, done)
+        )
+
+    @property
+    def refresh_pending(self) -> bool:
+        return self._pending_refresh is not None
+
+    def _deliver_view_state(
+        self,
+        generation: int,
+        future: concurrent.futures.Future[view_state.MainWindowViewState],
+    ) -> None:
+        # Runs on the worker thread; the signal queues the result to the GUI.
+        if future.cancelled():
+            return
+        try:
+            self._view_state_ready.emit(generation, future)
+        except RuntimeError:
+            pass  # The window was deleted while computing.
+
+    def _show_background_view_state(
+        self,
+        generation: int,
+        future: concurrent.futures.Future[view_state.MainWindowViewState],
+    ) -> None:
+        if generation != self._refresh_generation:
+            return
+        self._pending_refresh = None
+        try:
+            state = future.result()
+        except (ArithmeticError, LookupError, ValueError) as exc:
+            QtWidgets.QMessageBox.critical(self, "Refresh Failed", str(exc))
+            return
+
+        self._apply_view_state(state)
+
+    def _apply_view_state(self, state: view_state.MainWindowViewState) -> None:
         displayed_recipes = {recipe for recipe, _count in state.recipes}
         if self.selected_recipe not in displayed_recipes:
             self.selected_recipe = None
@@ -433,8 +748,15 @@ class MainWindow(QtWidgets.QMainWindow):
             recipes=state.recipes,
             selected_recipe=self.selected_recipe,
         )
-        self.add_goal_recipe_action.setEnabled(state.can_add_goal_recipe)
-        self.add_shortage_recipe_action.setEnabled(state.can_add_shortage_recipe)
+        self.add_goal_recipe_action.setEnabled(
+            state.can_add_goal_recipe and not self.loading_game_data
+        )
+        self.add_shortage_recipe_action.setEnabled(
+            state.can_add_shortage_recipe and not self.loading_game_data
+        )
+        self.round_goal_rate_action.setEnabled(
+            state.can_round_goal_rate and not self.loading_game_data
+        )
 
     def _handle_recipe_selected(self, selected: object) -> None:
         recipe = selected if isinstance(selected, ic.Recipe) else None
@@ -491,7 +813,7 @@ class MainWindow(QtWidgets.QMainWindow):
             result = QtWidgets.QMessageBox.question(
                 self,
                 "Change Recipe Scale",
-                "Changing recipe scale reloads game data and clears all recipes "
+                "Changing recipe scale rescales game data and clears all recipes "
                 "in the current production chain. Continue?",
                 QtWidgets.QMessageBox.StandardButton.Yes
                 | QtWidgets.QMessageBox.StandardButton.No,
@@ -516,11 +838,7 @@ class MainWindow(QtWidgets.QMainWindow):
             else None
         )
 
-        game_data = docs_parser.load_game_data(self.docs_path)
-        if scale != 1:
-            game_data.scale_recipes(scale)
-
-        self.game_data = game_data
+        self.game_data = self.game_data.at_scale(scale)
         if goal_class_name is not None:
             self.production_chain = pc.ProductionChain(
                 goal=self.game_data.items_d[goal_class_name],
@@ -571,3 +889,5 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _mark_unsaved(self) -> None:
         self.has_unsaved_changes = True
+        if self.history is not None:
+            self.history.record()
@@ -25,6 +25,7 @@ class MainWindowViewState:
     outputs: ItemRates
     can_add_goal_recipe: bool
     can_add_shortage_recipe: bool
+    can_round_goal_rate: bool
 
 
 def build_main_window_view_state(
@@ -45,6 +46,7 @@ def build_main_window_view_state(
             outputs=(),
             can_add_goal_recipe=False,
             can_add_shortage_recipe=False,
+            can_round_goal_rate=False,
         )
 
     recipes = tuple(
@@ -63,13 +65,27 @@ def build_main_window_view_state(
             key=lambda pair: pair[0].name.lower(),
         )
     )
-    producible_items = set(game_data.producible_items)
+    producible_items = game_data.producible_items
     displayed_filename = filename if filename is not None else "Unsaved"
     unsaved_marker = " *" if has_unsaved_changes else ""
+    status_text = f"File: {displayed_filename}{unsaved_marker}"
+    goal_rate = net_rates[chain.goal]
+    rounded_goal_rate = pc.simple_rate(goal_rate) if goal_rate > 0 else goal_rate
+    count_bits = chain.count_denominator_bits()
+    if count_bits > pc.DENOMINATOR_WARNING_BITS:
+        status_text += (
+            f"  |  Recipe counts have fractions over {pc.DENOMINATOR_WARNING_BITS} bits"
+        )
+        # Only suggested when the large denominators come from the goal rate.
+        if (
+            rounded_goal_rate != goal_rate
+            and chain.count_denominator_bits(rounded_goal_rate / goal_rate) < count_bits
+        ):
+            status_text += "; Edit > Round Goal Rate can shrink them"
     return MainWindowViewState(
         goal=chain.goal,
         recipe_scale=game_data.scale,
-        status_text=f"File: {displayed_filename}{unsaved_marker}",
+        status_text=status_text,
         recipes=recipes,
         inputs=inputs,
         outputs=outputs,
@@ -77,4 +93,5 @@ def build_main_window_view_state(
         can_add_shortage_recipe=any(
             item in producible_items for item, _amount in inputs
         ),
+        can_round_goal_rate=rounded_goal_rate != goal_rate,
     )
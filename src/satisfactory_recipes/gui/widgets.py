@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import collections
 import collections.abc as cabc
+import difflib
 import fractions as fr
 import functools
+import typing as ty
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -14,7 +17,84 @@ from satisfactory_recipes.gui import number_format, recipe_format
 type ItemRates = cabc.Sequence[tuple[ic.Item, fr.Fraction]]
 type RecipeCounts = cabc.Sequence[tuple[ic.Recipe, fr.Fraction]]
 
+_NO_PARENT = QtCore.QModelIndex()
+
 EXACT_VALUE_ROLE = int(QtCore.Qt.ItemDataRole.UserRole) + 1
+RECIPE_ROLE = int(QtCore.Qt.ItemDataRole.UserRole) + 2
+CARD_HTML_ROLE = int(QtCore.Qt.ItemDataRole.UserRole) + 3
+CARD_HTML_CACHE_SIZE = 1024
+_RIGHT_ALIGNED = (
+    QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+)
+
+
+def _row_edits[K](
+    old_keys: cabc.Sequence[K],
+    new_keys: cabc.Sequence[K],
+) -> list[tuple[str, int, int, int, int]]:
+    """
+    difflib opcodes turning rows keyed by old_keys into rows keyed by new_keys.
+
+    They are back to front, so applying each in turn leaves the row numbers of
+    the ones still to come valid.
+    """
+    matcher = difflib.SequenceMatcher(a=old_keys, b=new_keys, autojunk=False)
+    return list(reversed(matcher.get_opcodes()))
+
+
+def _sync_table_rows[K](
+    table: QtWidgets.QTableWidget,
+    old_keys: cabc.Sequence[K],
+    new_keys: cabc.Sequence[K],
+) -> None:
+    """
+    Insert and remove rows so that row i holds new_keys[i].
+
+    Rows whose key survives keep their items, cell widgets and selection, so
+    callers can update their cells in place and only report real changes.
+    """
+    for tag, old_start, old_end, new_start, new_end in _row_edits(old_keys, new_keys):
+        if tag == "equal":
+            continue
+        for _ in range(old_end - old_start):
+            table.removeRow(old_start)
+        for _ in range(new_end - new_start):
+            table.insertRow(old_start)
+
+
+def _update_table_cell(
+    table: QtWidgets.QTableWidget,
+    row: int,
+    column: int,
+    *,
+    text: str,
+    tooltip: str = "",
+    editable: bool = False,
+    right_aligned: bool = False,
+    role_data: cabc.Iterable[tuple[int, object]] = (),
+) -> bool:
+    """Create or update one cell, touching only what differs. True if changed."""
+    table_item = table.item(row, column)
+    changed = table_item is None
+    if table_item is None:
+        table_item = QtWidgets.QTableWidgetItem()
+        if right_aligned:
+            table_item.setTextAlignment(_RIGHT_ALIGNED)
+        if not editable:
+            table_item.setFlags(table_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
+        table.setItem(row, column, table_item)
+
+    if table_item.text() != text:
+        table_item.setText(text)
+        changed = True
+    if table_item.toolTip() != tooltip:
+        table_item.setToolTip(tooltip)
+        changed = True
+    for role, value in role_data:
+        if table_item.data(role) != value:
+            table_item.setData(role, value)
+            changed = True
+    return changed
 
 
 class _ExactFractionDelegate(QtWidgets.QStyledItemDelegate):
@@ -205,61 +285,63 @@ class RecipesPanel(QtWidgets.QWidget):
         can_add_shortage_recipe: bool,
         selected_recipe: ic.Recipe | None = None,
     ) -> None:
+        old_recipes = self._recipes_by_row
         self._recipes_by_row = [recipe for recipe, _count in recipes]
         self._recipe_counts = dict(recipes)
+        changed_rows: list[int] = []
         blocker = QtCore.QSignalBlocker(self.table)
         try:
-            self.table.setRowCount(0)
-            self.table.setRowCount(len(recipes))
+            _sync_table_rows(self.table, old_recipes, self._recipes_by_row)
             selected_row: int | None = None
             for row, (recipe, count) in enumerate(recipes):
-                self.table.setCellWidget(row, 0, self._make_remove_button(recipe))
-                building = recipe.produced_in.name if recipe.produced_in else ""
-                power = recipe.mean_power * count
-                values = (
-                    (recipe.name, ""),
-                    (
-                        number_format.decimal(count),
-                        number_format.exact_tooltip(count),
-                    ),
-                    (building, ""),
-                    (
-                        number_format.decimal(power, unit="MW"),
-                        number_format.exact_tooltip(power, unit="MW"),
-                    ),
+                # Empty cells return None, though the stubs do not say so.
+                remove_widget = ty.cast(
+                    "QtWidgets.QWidget | None", self.table.cellWidget(row, 0)
                 )
-                for column, (value, tooltip) in enumerate(values, start=1):
-                    table_item = QtWidgets.QTableWidgetItem(value)
-                    if column in (2, 4):
-                        table_item.setTextAlignment(
-                            QtCore.Qt.AlignmentFlag.AlignRight
-                            | QtCore.Qt.AlignmentFlag.AlignVCenter
-                        )
-                    if column != 2:
-                        table_item.setFlags(
-                            table_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-                        )
-                    else:
-                        table_item.setData(EXACT_VALUE_ROLE, count)
-                        tooltip = number_format.exact_tooltip(
-                            count,
-                            hint=self.COUNT_EDIT_HINT,
-                        )
-                    if tooltip:
-                        table_item.setToolTip(tooltip)
-                    self.table.setItem(row, column, table_item)
+                if remove_widget is None:
+                    self.table.setCellWidget(row, 0, self._make_remove_button(recipe))
+                if self._update_row(row, recipe, count):
+                    changed_rows.append(row)
                 if recipe is selected_recipe:
                     selected_row = row
 
-            if selected_row is not None:
+            if selected_row is None:
+                self.table.clearSelection()
+            elif not self.table.selectionModel().isRowSelected(selected_row):
                 self.table.selectRow(selected_row)
         finally:
             del blocker
 
-        self.table.resizeRowsToContents()
+        for row in changed_rows:
+            self.table.resizeRowToContents(row)
         self.add_goal_recipe_button.setEnabled(can_add_goal_recipe)
         self.add_shortage_recipe_button.setEnabled(can_add_shortage_recipe)
 
+    def _update_row(self, row: int, recipe: ic.Recipe, count: fr.Fraction) -> bool:
+        building = recipe.produced_in.name if recipe.produced_in else ""
+        power = recipe.mean_power * count
+        changed = _update_table_cell(self.table, row, 1, text=recipe.name)
+        changed |= _update_table_cell(
+            self.table,
+            row,
+            2,
+            text=number_format.decimal(count),
+            tooltip=number_format.exact_tooltip(count, hint=self.COUNT_EDIT_HINT),
+            editable=True,
+            right_aligned=True,
+            role_data=((EXACT_VALUE_ROLE, count),),
+        )
+        changed |= _update_table_cell(self.table, row, 3, text=building)
+        changed |= _update_table_cell(
+            self.table,
+            row,
+            4,
+            text=number_format.decimal(power, unit="MW"),
+            tooltip=number_format.exact_tooltip(power, unit="MW"),
+            right_aligned=True,
+        )
+        return changed
+
     def _emit_selected_recipe(self) -> None:
         selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
@@ -407,44 +489,50 @@ class NetItemsTable(QtWidgets.QTableWidget):
         self.itemDoubleClicked.connect(self._handle_item_double_clicked)
 
     def set_view(self, values: ItemRates) -> None:
+        old_items = list(self._values)
         self._values = dict(values)
+        changed_rows: list[int] = []
         self._rendering = True
         try:
-            self.setRowCount(len(values))
+            _sync_table_rows(self, old_items, list(self._values))
             for row, (item, amount) in enumerate(values):
-                name_item = QtWidgets.QTableWidgetItem(item.name)
-                name_item.setFlags(
-                    name_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                changed = _update_table_cell(
+                    self,
+                    row,
+                    0,
+                    text=item.name,
+                    tooltip=self._activation_hint or "",
+                    role_data=((QtCore.Qt.ItemDataRole.UserRole, item),),
                 )
-                name_item.setData(QtCore.Qt.ItemDataRole.UserRole, item)
-                if self._activation_hint is not None:
-                    name_item.setToolTip(self._activation_hint)
-
-                amount_item = QtWidgets.QTableWidgetItem(number_format.decimal(amount))
-                amount_item.setTextAlignment(
-                    QtCore.Qt.AlignmentFlag.AlignRight
-                    | QtCore.Qt.AlignmentFlag.AlignVCenter
-                )
-                amount_item.setData(QtCore.Qt.ItemDataRole.UserRole, item)
-                amount_item.setToolTip(
-                    number_format.exact_tooltip(amount, hint=self.RATE_EDIT_HINT)
+                changed |= _update_table_cell(
+                    self,
+                    row,
+                    1,
+                    text=number_format.decimal(amount),
+                    tooltip=number_format.exact_tooltip(
+                        amount, hint=self.RATE_EDIT_HINT
+                    ),
+                    editable=True,
+                    right_aligned=True,
+                    role_data=((QtCore.Qt.ItemDataRole.UserRole, item),),
                 )
-                self.setItem(row, 0, name_item)
-                self.setItem(row, 1, amount_item)
+                if changed:
+                    changed_rows.append(row)
         finally:
             self._rendering = False
         self._apply_highlights()
-        self.resizeRowsToContents()
+        for row in changed_rows:
+            self.resizeRowToContents(row)
 
     def highlight_items(self, items: cabc.Iterable[ic.Item]) -> None:
         self._highlighted_items = frozenset(items)
         self._apply_highlights()
 
     def refresh_appearance(self) -> None:
-        self._apply_highlights()
+        self._apply_highlights(palette_changed=True)
         self.resizeRowsToContents()
 
-    def _apply_highlights(self) -> None:
+    def _apply_highlights(self, *, palette_changed: bool = False) -> None:
         highlight_background = self.palette().brush(QtGui.QPalette.ColorRole.Highlight)
         highlight_foreground = self.palette().brush(
             QtGui.QPalette.ColorRole.HighlightedText
@@ -458,13 +546,15 @@ class NetItemsTable(QtWidgets.QTableWidget):
                         continue
                     item = table_item.data(QtCore.Qt.ItemDataRole.UserRole)
                     highlighted = item in self._highlighted_items
+                    font = table_item.font()
+                    if font.bold() == highlighted and not palette_changed:
+                        continue
                     table_item.setBackground(
                         highlight_background if highlighted else QtGui.QBrush()
                     )
                     table_item.setForeground(
                         highlight_foreground if highlighted else QtGui.QBrush()
                     )
-                    font = table_item.font()
                     font.setBold(highlighted)
                     table_item.setFont(font)
         finally:
@@ -503,104 +593,326 @@ class NetItemsTable(QtWidgets.QTableWidget):
             self.item_activated.emit(item)
 
 
-class RecipeDetailsView(QtWidgets.QScrollArea):
-    """Scrollable collection of rich recipe detail cards."""
+class RecipeDetailsModel(QtCore.QAbstractListModel):
+    """
+    One rich recipe card per row.
+
+    Card HTML is cached by recipe class name, exact count and theme, so
+    refreshing a chain only formats the cards whose count actually changed.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[ic.Recipe, fr.Fraction]] = []
+        self._theme = ""
+        # Scaled variants share class names, so entries remember their recipe.
+        self._card_html: collections.OrderedDict[
+            tuple[str, fr.Fraction, str], tuple[ic.Recipe, str]
+        ] = collections.OrderedDict()
+
+    def rowCount(
+        self,
+        parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _NO_PARENT,
+    ) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if not index.isValid():
+            return None
+        recipe, count = self._rows[index.row()]
+        match role:
+            case QtCore.Qt.ItemDataRole.DisplayRole:
+                return f"{recipe.name} x {number_format.decimal(count)}"
+            case QtCore.Qt.ItemDataRole.ToolTipRole:
+                return recipe_format.recipe_exact_tooltip(recipe, count)
+            case _ if role == RECIPE_ROLE:
+                return recipe
+            case _ if role == CARD_HTML_ROLE:
+                return self._get_card_html(recipe, count)
+            case _:
+                return None
+
+    def row_of(self, recipe: ic.Recipe | None) -> int | None:
+        for row, (row_recipe, _count) in enumerate(self._rows):
+            if row_recipe is recipe:
+                return row
+        return None
+
+    def set_rows(self, rows: RecipeCounts) -> None:
+        new_rows = list(rows)
+        edits = _row_edits(
+            [recipe for recipe, _count in self._rows],
+            [recipe for recipe, _count in new_rows],
+        )
+        for tag, old_start, old_end, new_start, new_end in edits:
+            if tag == "equal":
+                for offset in range(old_end - old_start):
+                    new_row = new_rows[new_start + offset]
+                    if self._rows[old_start + offset][1] != new_row[1]:
+                        self._rows[old_start + offset] = new_row
+                        changed = self.index(old_start + offset)
+                        self.dataChanged.emit(changed, changed)
+                continue
+            if old_end > old_start:
+                self.beginRemoveRows(_NO_PARENT, old_start, old_end - 1)
+                del self._rows[old_start:old_end]
+                self.endRemoveRows()
+            if new_end > new_start:
+                self.beginInsertRows(
+                    _NO_PARENT, old_start, old_start + new_end - new_start - 1
+                )
+                self._rows[old_start:old_start] = new_rows[new_start:new_end]
+                self.endInsertRows()
+
+    def set_theme(self, theme: str) -> None:
+        """Set the text color cards are drawn in, as a color name."""
+        if theme == self._theme:
+            return
+        self._theme = theme
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1))
+
+    def _get_card_html(self, recipe: ic.Recipe, count: fr.Fraction) -> str:
+        key = (recipe.class_name, count, self._theme)
+        cached = self._card_html.get(key)
+        if cached is not None and cached[0] is recipe:
+            self._card_html.move_to_end(key)
+            return cached[1]
+
+        card = recipe_format.recipe_details_html(recipe, count)
+        card_html = recipe_format.recipe_details_document_html(
+            [f'<div style="color: {self._theme}">{card}</div>']
+        )
+        self._card_html[key] = (recipe, card_html)
+        if len(self._card_html) > CARD_HTML_CACHE_SIZE:
+            self._card_html.popitem(last=False)
+        return card_html
+
+
+class _RecipeCardDelegate(QtWidgets.QStyledItemDelegate):
+    """Lays out and paints card HTML, only for rows the view asks about."""
+
+    DOCUMENT_CACHE_SIZE = CARD_HTML_CACHE_SIZE
+    CARD_MARGIN = 4
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._documents: collections.OrderedDict[
+            tuple[str, int], QtGui.QTextDocument
+        ] = collections.OrderedDict()
+
+    def clear_cache(self) -> None:
+        self._documents.clear()
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+    ) -> None:
+        rect = option.rect
+        palette = option.palette
+        document = self._get_document(index, rect.width())
+        painter.save()
+        try:
+            if option.state & QtWidgets.QStyle.StateFlag.State_Selected:
+                highlight = palette.color(QtGui.QPalette.ColorRole.Highlight)
+                fill = QtGui.QColor(highlight)
+                fill.setAlpha(36)
+                painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+                painter.setPen(QtGui.QPen(highlight, 3))
+                painter.setBrush(fill)
+                painter.drawRoundedRect(
+                    rect.adjusted(
+                        self.CARD_MARGIN // 2,
+                        self.CARD_MARGIN // 2,
+                        -self.CARD_MARGIN // 2,
+                        -self.CARD_MARGIN // 2,
+                    ),
+                    6,
+                    6,
+                )
+            painter.translate(rect.left(), rect.top() + self.CARD_MARGIN)
+            document.drawContents(painter)
+        finally:
+            painter.restore()
+
+    def sizeHint(
+        self,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+    ) -> QtCore.QSize:
+        width = option.rect.width()
+        document = self._get_document(index, width)
+        return QtCore.QSize(
+            width,
+            int(document.size().height()) + 2 * self.CARD_MARGIN,
+        )
+
+    def _get_document(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        width: int,
+    ) -> QtGui.QTextDocument:
+        card_html = str(index.data(CARD_HTML_ROLE))
+        key = (card_html, width)
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+            return document
+
+        document = QtGui.QTextDocument()
+        document.setHtml(card_html)
+        if width > 0:
+            document.setTextWidth(width)
+        self._documents[key] = document
+        if len(self._documents) > self.DOCUMENT_CACHE_SIZE:
+            self._documents.popitem(last=False)
+        return document
+
+
+class RecipeDetailsView(QtWidgets.QListView):
+    """
+    Scrollable list of rich recipe detail cards.
+
+    Cards are painted by a delegate, so only visible cards are drawn, and each
+    card's laid-out document is reused until its HTML or width changes. Painted
+    cards cannot be selected as text, so their context menu copies them instead.
+    """
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
-        self.content_widget = QtWidgets.QWidget()
-        self.content_layout = QtWidgets.QVBoxLayout(self.content_widget)
-        self.setWidget(self.content_widget)
-        self.setWidgetResizable(True)
+        self.details_model = RecipeDetailsModel(self)
+        self.card_delegate = _RecipeCardDelegate(self)
+        self.setModel(self.details_model)
+        self.setItemDelegate(self.card_delegate)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(
+            QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        self.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        # A scroll bar appearing would change the width and relayout every card.
+        self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.setSizePolicy(
             QtWidgets.QSizePolicy.Policy.Expanding,
             QtWidgets.QSizePolicy.Policy.Expanding,
         )
-        self._cards: dict[ic.Recipe, QtWidgets.QGroupBox] = {}
         self._selected_recipe: ic.Recipe | None = None
+        self._menu_row: int | None = None
+        self.copy_card_action = QtGui.QAction("Copy Card", self)
+        self.copy_card_action.setShortcut(QtGui.QKeySequence.StandardKey.Copy)
+        self.copy_card_action.setShortcutContext(
+            QtCore.Qt.ShortcutContext.WidgetShortcut
+        )
+        self.copy_card_action.triggered.connect(self._copy_card)
+        self.copy_all_cards_action = QtGui.QAction("Copy All Cards", self)
+        self.copy_all_cards_action.triggered.connect(self._copy_all_cards)
+        self.addAction(self.copy_card_action)
+        self.addAction(self.copy_all_cards_action)
         self._scroll_timer = QtCore.QTimer(self)
         self._scroll_timer.setSingleShot(True)
         self._scroll_timer.timeout.connect(self._scroll_to_selected_recipe)
+        self._apply_theme()
+        self._update_copy_actions()
+
+    @property
+    def selected_recipe(self) -> ic.Recipe | None:
+        return self._selected_recipe
 
     def set_view(self, recipes: RecipeCounts) -> None:
-        self.clear()
-        for recipe, count in recipes:
-            card = self._make_card(recipe, count)
-            self._cards[recipe] = card
-            self.content_layout.addWidget(card)
-        self.content_layout.addStretch()
-        if self._selected_recipe not in self._cards:
+        self.details_model.set_rows(recipes)
+        if self.details_model.row_of(self._selected_recipe) is None:
             self._selected_recipe = None
         self._refresh_card_highlights()
 
     def clear(self) -> None:
-        self._cards.clear()
-        while self.content_layout.count():
-            layout_item = self.content_layout.takeAt(0)
-            if layout_item is None:
-                continue
-            widget = layout_item.widget()
-            if widget is not None:
-                widget.deleteLater()
+        self.details_model.set_rows(())
+        self._selected_recipe = None
+        self._update_copy_actions()
+
+    def card_text(self, row: int) -> str:
+        """The card at row as plain text, as it reads on screen."""
+        document = QtGui.QTextDocument()
+        document.setHtml(str(self.details_model.index(row).data(CARD_HTML_ROLE)))
+        return document.toPlainText().strip()
+
+    def contextMenuEvent(self, event: QtGui.QContextMenuEvent) -> None:
+        index = self.indexAt(event.pos())
+        self._menu_row = index.row() if index.isValid() else None
+        self._update_copy_actions()
+        menu = QtWidgets.QMenu(self)
+        menu.addAction(self.copy_card_action)
+        menu.addAction(self.copy_all_cards_action)
+        try:
+            menu.exec(event.globalPos())
+        finally:
+            self._menu_row = None
+            self._update_copy_actions()
 
     def focus_recipe(self, recipe: ic.Recipe | None, *, scroll: bool = True) -> None:
-        self._selected_recipe = recipe if recipe in self._cards else None
+        self._selected_recipe = (
+            recipe if self.details_model.row_of(recipe) is not None else None
+        )
         self._refresh_card_highlights()
         if scroll and self._selected_recipe is not None:
             self._scroll_timer.start(0)
 
     def refresh_appearance(self) -> None:
+        self._apply_theme()
         self._refresh_card_highlights()
 
+    def _apply_theme(self) -> None:
+        self.card_delegate.clear_cache()
+        self.details_model.set_theme(
+            self.palette().color(QtGui.QPalette.ColorRole.Text).name()
+        )
+        self.scheduleDelayedItemsLayout()
+
     def _scroll_to_selected_recipe(self) -> None:
-        if self._selected_recipe is None:
-            return
-        card = self._cards.get(self._selected_recipe)
-        if card is not None:
-            self.ensureWidgetVisible(card, 0, 12)
+        row = self.details_model.row_of(self._selected_recipe)
+        if row is not None:
+            self.scrollTo(
+                self.details_model.index(row),
+                QtWidgets.QAbstractItemView.ScrollHint.EnsureVisible,
+            )
 
-    def _refresh_card_highlights(self) -> None:
-        highlight = self.palette().color(QtGui.QPalette.ColorRole.Highlight)
-        selected_stylesheet = (
-            "QGroupBox {"
-            f"border: 3px solid rgb({highlight.red()}, {highlight.green()}, "
-            f"{highlight.blue()});"
-            "border-radius: 6px;"
-            "margin-top: 0.7em;"
-            f"background-color: rgba({highlight.red()}, {highlight.green()}, "
-            f"{highlight.blue()}, 36);"
-            "font-weight: 700;"
-            "}"
-            "QGroupBox::title {"
-            "subcontrol-origin: margin;"
-            "left: 8px;"
-            "padding: 0 4px;"
-            "}"
+    def _copy_row(self) -> int | None:
+        """The card under the open context menu, else the highlighted card."""
+        if self._menu_row is not None:
+            return self._menu_row
+        return self.details_model.row_of(self._selected_recipe)
+
+    def _update_copy_actions(self) -> None:
+        self.copy_card_action.setEnabled(self._copy_row() is not None)
+        self.copy_all_cards_action.setEnabled(self.details_model.rowCount() > 0)
+
+    def _copy_card(self) -> None:
+        row = self._copy_row()
+        if row is not None:
+            QtGui.QGuiApplication.clipboard().setText(self.card_text(row))
+
+    def _copy_all_cards(self) -> None:
+        QtGui.QGuiApplication.clipboard().setText(
+            "\n\n".join(
+                self.card_text(row) for row in range(self.details_model.rowCount())
+            )
         )
-        for recipe, card in self._cards.items():
-            selected = recipe is self._selected_recipe
-            card.setProperty("selectedRecipe", selected)
-            card.setStyleSheet(selected_stylesheet if selected else "")
 
-    @staticmethod
-    def _make_card(
-        recipe: ic.Recipe,
-        count: fr.Fraction,
-    ) -> QtWidgets.QGroupBox:
-        card = QtWidgets.QGroupBox(f"{recipe.name} x {number_format.decimal(count)}")
-        card.setToolTip(recipe_format.recipe_exact_tooltip(recipe, count))
-        card_layout = QtWidgets.QVBoxLayout(card)
-
-        body = QtWidgets.QLabel()
-        body.setTextFormat(QtCore.Qt.TextFormat.RichText)
-        body.setText(recipe_format.recipe_body_html(recipe, count))
-        body.setToolTip(recipe_format.recipe_exact_tooltip(recipe, count))
-        body.setWordWrap(True)
-        body.setTextInteractionFlags(
-            QtCore.Qt.TextInteractionFlag.TextSelectableByMouse
-        )
-        card_layout.addWidget(body)
-        return card
+    def _refresh_card_highlights(self) -> None:
+        selection_model = self.selectionModel()
+        row = self.details_model.row_of(self._selected_recipe)
+        if row is None:
+            selection_model.clearSelection()
+        else:
+            selection_model.select(
+                self.details_model.index(row),
+                QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect,
+            )
+        self._update_copy_actions()
 
 
 class ChainDetailsTabs(QtWidgets.QTabWidget):
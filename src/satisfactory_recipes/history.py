@@ -0,0 +1,93 @@
+"""Undo and redo for the recipe counts of a production chain."""
+
+from __future__ import annotations
+
+import collections
+import fractions as fr
+
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import persistent_map as pm
+from satisfactory_recipes import production_chain as pc
+
+HISTORY_LIMIT = 500
+
+type _Counts = pm.PersistentMap[ic.Recipe, fr.Fraction]
+
+
+class ChainHistory:
+    """
+    Undo/redo stack of one chain's recipe counts.
+
+    Each step is a PersistentMap sharing everything unchanged with the step
+    before it, so recording an edit copies only the trie paths to the recipes
+    it touched, and undo or redo rewrites only the recipes that differ.
+    """
+
+    def __init__(
+        self,
+        chain: pc.ProductionChain,
+        *,
+        limit: int = HISTORY_LIMIT,
+    ) -> None:
+        self.chain = chain
+        chain.take_changed_recipes()
+        self._current: _Counts = pm.PersistentMap(chain.recipes.items())
+        self._undo_steps = collections.deque[_Counts](maxlen=limit)
+        self._redo_steps: list[_Counts] = []
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo_steps)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo_steps)
+
+    def record(self) -> bool:
+        """Make the chain's counts a new step. Return False if nothing changed."""
+        changed = self.chain.take_changed_recipes()
+        recipes = self.chain.recipes
+        if changed is None:
+            counts: _Counts = pm.PersistentMap(recipes.items())
+        else:
+            counts = self._current
+            for recipe in changed:
+                if recipe in recipes:
+                    counts = counts.set(recipe, recipes[recipe])
+                else:
+                    counts = counts.discard(recipe)
+
+        if not any(True for _recipe in self._current.changed_keys(counts)):
+            return False
+        self._undo_steps.append(self._current)
+        self._redo_steps.clear()
+        self._current = counts
+        return True
+
+    def undo(self) -> bool:
+        """Restore the counts before the last step. Unrecorded edits count as one."""
+        self.record()
+        if not self._undo_steps:
+            return False
+        self._redo_steps.append(self._current)
+        self._restore(self._undo_steps.pop())
+        return True
+
+    def redo(self) -> bool:
+        """Reapply the last undone step, unless the chain was edited since."""
+        self.record()
+        if not self._redo_steps:
+            return False
+        self._undo_steps.append(self._current)
+        self._restore(self._redo_steps.pop())
+        return True
+
+    def _restore(self, counts: _Counts) -> None:
+        recipes = self.chain.recipes
+        for recipe in self._current.changed_keys(counts):
+            if recipe in counts:
+                recipes[recipe] = counts[recipe]
+            else:
+                del recipes[recipe]
+        self.chain.take_changed_recipes()
+        self._current = counts
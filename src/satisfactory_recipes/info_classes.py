@@ -4,20 +4,122 @@ Contains basic classes for things like recipes, items, buildings
 
 from __future__ import annotations
 
+import collections
+import collections.abc as cabc
 import copy
 import dataclasses
 import enum
 import fractions as fr
+import functools
 import sys
+import threading
 import typing as ty
+import weakref
 
-from satisfactory_recipes import stupid_classes as sc
+from satisfactory_recipes import item_counter
+from satisfactory_recipes import recipe_scaling
 
+if ty.TYPE_CHECKING:
+    from satisfactory_recipes import stoichiometry
+
+
+class ContentInternable(ty.Protocol):
+    """What ContentInternRegistry needs from the instances it interns."""
+
+    def identity_key(self) -> tuple[ty.Any, ...]:
+        """The small key that hashing and ordering use."""
+        ...
+
+    def interned_content(self) -> tuple[object, ...]:
+        """Every compared field, which decides whether two instances are one."""
+        ...
+
+
+class ContentInternRegistry:
+    """
+    Keeps one live instance of each distinct Item, Recipe or Building.
+
+    Instances are interned by their full content, not by identity_key: two
+    instances with the same key but different data stay separate objects,
+    which then hash alike but never compare equal.
+    """
+
+    __slots__ = ("_instances", "_lock")
+
+    def __init__(self) -> None:
+        self._instances: weakref.WeakValueDictionary[
+            tuple[object, ...], ContentInternable
+        ]
+        self._instances = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def intern[T: ContentInternable](self, instance: T) -> T:
+        """The live instance with the same data as instance, else instance itself."""
+        content = (type(instance), *instance.interned_content())
+        with self._lock:
+            existing = self._instances.get(content)
+            if existing is not None:
+                return ty.cast("T", existing)
+            object.__setattr__(instance, "_hash", hash(instance.identity_key()))
+            self._instances[content] = instance
+            return instance
+
+
+# Shared by every info class, so reparsing or rescaling to data that already
+# exists hands back the same objects.
+CONTENT_INTERN_REGISTRY = ContentInternRegistry()
+
+
+class _Interned(type):
+    """Metaclass whose constructor returns the registry's instance for the data."""
+
+    def __call__[T](cls: type[T], *args: ty.Any, **kwargs: ty.Any) -> T:
+        instance = type.__call__(cls, *args, **kwargs)
+        return ty.cast("T", CONTENT_INTERN_REGISTRY.intern(instance))
+
+
+@functools.cache
+def _content_fields(cls: type[_BaseInfo]) -> tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(cls) if field.compare)
+
+
+@dataclasses.dataclass(
+    frozen=True, kw_only=True, slots=True, eq=False, weakref_slot=True
+)
+class _BaseInfo(metaclass=_Interned):
+    """
+    Base of interned game data.
+
+    Equal data always gives the same instance, so equality is identity, and
+    hashing and ordering use only the small key from identity_key. Instances are
+    cheap dictionary keys no matter how much data they hold.
+    """
 
-@dataclasses.dataclass(frozen=True, kw_only=True, slots=True, order=True)
-class _BaseInfo:
     class_name: str  # Used as key in dictionaries
     source_native_class: str
+    _hash: int = dataclasses.field(default=0, init=False, repr=False, compare=False)
+
+    def identity_key(self) -> tuple[ty.Any, ...]:
+        return (self.class_name,)
+
+    def interned_content(self) -> tuple[object, ...]:
+        return tuple(getattr(self, name) for name in _content_fields(type(self)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __lt__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.identity_key() < ty.cast("_BaseInfo", other).identity_key()
+
+    def __reduce__(self) -> tuple[ty.Any, ...]:
+        # Rebuild through the constructor, so unpickled data is interned too.
+        fields = {name: getattr(self, name) for name in _content_fields(type(self))}
+        return (functools.partial(type(self), **fields), ())
 
 
 class BuildingKind(enum.StrEnum):
@@ -29,7 +131,7 @@ class BuildingPowerMode(enum.StrEnum):
     RECIPE_DEFINED = enum.auto()
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True, slots=True, order=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True, eq=False)
 class Building(_BaseInfo):
     """An automated producer with power behavior defined by its source class."""
 
@@ -70,7 +172,7 @@ class ItemKind(enum.StrEnum):
     VEHICLE = enum.auto()
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True, slots=True, order=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True, eq=False)
 class Item(_BaseInfo):
     name: str
     kind: ItemKind
@@ -170,16 +272,31 @@ def round_half_up(value: fr.Fraction) -> fr.Fraction:
     return fr.Fraction(quotient, 1)
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True, slots=True, order=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True, eq=False)
 class Recipe(_BaseInfo):
     name: str
-    inputs: sc.ScalableCounter[Item]
-    inputs_per_min: sc.ScalableCounter[Item]
-    products: sc.ScalableCounter[Item]
-    products_per_min: sc.ScalableCounter[Item]
+    inputs: item_counter.ItemCounter
+    inputs_per_min: item_counter.ItemCounter
+    products: item_counter.ItemCounter
+    products_per_min: item_counter.ItemCounter
     produced_in: Building | None
     craft_time: fr.Fraction
     power_profile: PowerProfile
+    # Input scale of the game data this recipe was scaled for. Part of the key,
+    # so recipes from differently scaled data never compare or hash equal.
+    scale: fr.Fraction = fr.Fraction(1)
+
+    def __post_init__(self) -> None:
+        # Any item mapping is stored as a frozen ItemCounter, so recipes hash.
+        for name in ("inputs", "inputs_per_min", "products", "products_per_min"):
+            counts = getattr(self, name)
+            if not isinstance(counts, item_counter.ItemCounter) or not counts.frozen:
+                object.__setattr__(
+                    self, name, item_counter.ItemCounter(counts, frozen=True)
+                )
+
+    def identity_key(self) -> tuple[ty.Any, ...]:
+        return (self.class_name, self.scale)
 
     @staticmethod
     def scale_one_input(
@@ -200,25 +317,20 @@ class Recipe(_BaseInfo):
 
     def create_scaled(self, factor: fr.Fraction) -> Recipe:
         """Return a new recipes, scaling inputs by factor, handling rounding as done in 1.2."""
-        new_inputs = sc.ScalableCounter[Item](
-            {
-                item: self.scale_one_input(amount, factor, item.is_fluid)
+        new_inputs = item_counter.ItemCounter(
+            (
+                (item, self.scale_one_input(amount, factor, item.is_fluid))
                 for item, amount in self.inputs.items()
-            },
-            frozen=True,
-        )
-        new_inputs_per_min = sc.ScalableCounter[Item](
-            {
-                item: amount / fr.Fraction(self.craft_time, 60)
-                for item, amount in new_inputs.items()
-            },
+            ),
             frozen=True,
         )
+        new_inputs_per_min = (new_inputs / fr.Fraction(self.craft_time, 60)).freeze()
 
         return copy.replace(
             self,
             inputs=new_inputs,
             inputs_per_min=new_inputs_per_min,
+            scale=self.scale * factor,
         )
 
     @property
@@ -264,46 +376,170 @@ class Recipe(_BaseInfo):
         file.write(f"{self.make_pretty_str(indent=indent, scale=scale)}\n")
 
 
+# Scaled GameData variants kept per base, least recently used evicted first.
+SCALED_VARIANT_CACHE_SIZE = 4
+
+
+def _new_scaled_variants() -> collections.OrderedDict[fr.Fraction, GameData]:
+    return collections.OrderedDict()
+
+
 @dataclasses.dataclass(kw_only=True)
 class GameData:
     buildings_d: dict[str, Building]
     items_d: dict[str, Item]
-    recipes_d: dict[str, Recipe]
+    # A dict, or recipe_scaling.ScaledRecipes once scaled; either way read-only.
+    recipes_d: cabc.Mapping[str, Recipe]
     scale: fr.Fraction = fr.Fraction(1)
+    # Bumped whenever recipes change; derived views built for an older
+    # generation are discarded on next access.
+    generation: int = dataclasses.field(default=0, init=False, compare=False)
+    _derived_views: dict[str, ty.Any] = dataclasses.field(
+        default_factory=dict[str, ty.Any], init=False, repr=False, compare=False
+    )
+    _derived_views_generation: int = dataclasses.field(
+        default=0, init=False, repr=False, compare=False
+    )
+    # The GameData this was scaled from by at_scale, and that base's variants.
+    _base: GameData | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _scaled_variants: collections.OrderedDict[fr.Fraction, GameData] = (
+        dataclasses.field(
+            default_factory=_new_scaled_variants,
+            init=False,
+            repr=False,
+            compare=False,
+        )
+    )
+    # Names of automated recipes by the items they make and use, kept in
+    # recipes_d order. Scaling keeps names and items, so these never go stale,
+    # and lookups only build the scaled recipes they return.
+    _producer_names: dict[Item, tuple[str, ...]] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _consumer_names: dict[Item, tuple[str, ...]] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._index_recipes()
 
     def scale_recipes(self, factor: fr.Fraction) -> None:
         """Replace recipes with scaled version."""
         self.scale *= factor
-        self.recipes_d |= {
-            key: value.create_scaled(factor) for key, value in self.recipes_d.items()
-        }
+        self.recipes_d = self._scaled_recipes(factor)
+        self.generation += 1
+        self._scaled_variants.clear()
+
+    def at_scale(self, scale: fr.Fraction) -> GameData:
+        """
+        Game data with recipe inputs at scale, leaving this object untouched.
+
+        Recipes are always scaled from the base data this came from, so
+        rounding never compounds. Variants are cached on the base and share
+        its items and buildings; treat them as read-only.
+        """
+        base = self._base if self._base is not None else self
+        if scale == base.scale:
+            return base
+
+        variants = base._scaled_variants
+        variant = variants.get(scale)
+        if variant is not None:
+            variants.move_to_end(scale)
+            return variant
+
+        variant = GameData(
+            buildings_d=base.buildings_d,
+            items_d=base.items_d,
+            recipes_d=base._scaled_recipes(scale / base.scale),
+            scale=scale,
+        )
+        variant._base = base
+        variants[scale] = variant
+        while len(variants) > SCALED_VARIANT_CACHE_SIZE:
+            variants.popitem(last=False)
+        return variant
+
+    def _scaled_recipes(self, factor: fr.Fraction) -> recipe_scaling.ScaledRecipes:
+        """Every recipe scaled by factor as by create_scaled, built on access."""
+        recipes = self.recipes_d
+        if isinstance(recipes, recipe_scaling.ScaledRecipes):
+            return recipes.rescaled(factor)
+        layout = self._derived_view(
+            "input_layout", lambda: recipe_scaling.InputLayout.from_recipes(recipes)
+        )
+        return recipe_scaling.ScaledRecipes(layout, factor)
+
+    def _index_recipes(self) -> None:
+        recipes = self.recipes_d
+        if isinstance(recipes, recipe_scaling.ScaledRecipes):
+            # Same names and items, without building any scaled recipe.
+            recipes = recipes.templates
+        producers: dict[Item, list[str]] = {}
+        consumers: dict[Item, list[str]] = {}
+        for name, recipe in recipes.items():
+            if not recipe.produced_in:
+                continue
+            for item in recipe.products:
+                producers.setdefault(item, []).append(name)
+            for item in recipe.inputs:
+                consumers.setdefault(item, []).append(name)
+        self._producer_names = {item: tuple(names) for item, names in producers.items()}
+        self._consumer_names = {item: tuple(names) for item, names in consumers.items()}
+
+    def _derived_view[T](self, name: str, build: ty.Callable[[], T]) -> T:
+        """Return a view cached for the current generation, building it if needed."""
+        if self._derived_views_generation != self.generation:
+            self._derived_views.clear()
+            self._derived_views_generation = self.generation
+        try:
+            return ty.cast("T", self._derived_views[name])
+        except KeyError:
+            view = self._derived_views[name] = build()
+            return view
+
+    @property
+    def stoichiometry_matrix(self) -> stoichiometry.StoichiometryMatrix:
+        """Recipe x item rate matrix, built on first use and again after rescaling."""
+        from satisfactory_recipes import stoichiometry
+
+        return self._derived_view(
+            "stoichiometry_matrix",
+            lambda: stoichiometry.StoichiometryMatrix.from_game_data(self),
+        )
 
     @property
     def producible_items(self) -> frozenset[Item]:
-        return frozenset(
-            item
-            for recipe in self.recipes_d.values()
-            for item in recipe.products
-            if recipe.produced_in
+        return self._derived_view(
+            "producible_items", lambda: frozenset(self._producer_names)
         )
 
     @property
     def item_name_d(self) -> dict[str, Item]:
-        item_name_d = {item.name: item for item in self.items_d.values()}
-        assert len(item_name_d) == len(self.items_d)
-        return item_name_d
+        """Items by display name. Cached and shared, so do not modify."""
+        return self._derived_view("item_name_d", self._build_item_name_d)
 
     @property
     def producible_item_name_d(self) -> dict[str, Item]:
-        return {
-            name: item
-            for name, item in self.item_name_d.items()
-            if item in self.producible_items
-        }
+        """Producible items by display name. Cached and shared, so do not modify."""
+        return self._derived_view(
+            "producible_item_name_d",
+            lambda: {
+                name: item
+                for name, item in self.item_name_d.items()
+                if item in self._producer_names
+            },
+        )
+
+    def _build_item_name_d(self) -> dict[str, Item]:
+        item_name_d = {item.name: item for item in self.items_d.values()}
+        assert len(item_name_d) == len(self.items_d)
+        return item_name_d
 
     def get_recipes_producing(self, item: Item) -> list[Recipe]:
-        return [
-            recipe
-            for recipe in self.recipes_d.values()
-            if (item in recipe.products and recipe.produced_in)
-        ]
+        return [self.recipes_d[name] for name in self._producer_names.get(item, ())]
+
+    def get_recipes_consuming(self, item: Item) -> list[Recipe]:
+        return [self.recipes_d[name] for name in self._consumer_names.get(item, ())]
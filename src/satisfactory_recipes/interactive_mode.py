@@ -8,8 +8,10 @@ import pathlib
 import traceback
 import typing as ty
 
+from satisfactory_recipes import history
 from satisfactory_recipes import info_classes as ic
 from satisfactory_recipes import production_chain as pc
+from satisfactory_recipes import recipe_search
 from satisfactory_recipes import search
 
 MAX_DISPLAY_OPTIONS = 10
@@ -125,14 +127,60 @@ def choose_bounded_int(
 def choose_named[T: _SupportsName](
     items: cabc.Sequence[T],
     prompt: str = "Choose an option",
+) -> T:
+    """Choose from items by index, or by searching their names for the index."""
+    return _choose_indexed(
+        items,
+        prompt,
+        search.SearchIndex(
+            enumerate(items),
+            label=lambda indexed_item: indexed_item[1].name,
+        ),
+    )
+
+
+def choose_recipe(
+    recipes: cabc.Sequence[ic.Recipe],
+    prompt: str = "Choose a recipe",
+) -> ic.Recipe:
+    """Like choose_named, but searches also accept "uses:", "makes:" and "in:"."""
+    return _choose_indexed(
+        recipes,
+        prompt,
+        recipe_search.RecipeSearchIndex(
+            enumerate(recipes),
+            recipe=lambda indexed_recipe: indexed_recipe[1],
+        ),
+    )
+
+
+def _choose_indexed[T: _SupportsName](
+    items: cabc.Sequence[T],
+    prompt: str,
+    search_index: search.Searcher[tuple[int, T]],
 ) -> T:
     print(f"{prompt}:")
     index_len = len(f"{len(items) - 1}")
     for index, item in enumerate(items):
         print(f"    {index:>{index_len}} - {item.name}")
 
-    chosen_index = choose_bounded_int("Select index", 0, len(items))
-    return items[chosen_index]
+    while True:
+        entry = exceptional_input("Select index or search: ")
+        if entry.isdigit():
+            chosen_index = int(entry)
+            if 0 <= chosen_index < len(items):
+                return items[chosen_index]
+            print(f"Index {chosen_index} out of range 0-{len(items) - 1}")
+            continue
+
+        matches = search_index.best_matches(entry, limit=MAX_DISPLAY_OPTIONS)
+        if not matches:
+            print(f"No match for {entry!r}")
+            continue
+        print("Did you mean:")
+        for index, item in matches:
+            print(f"    {index:>{index_len}} - {item.name}")
+        print()
 
 
 def get_arbitrary_item(
@@ -144,6 +192,7 @@ def get_arbitrary_item(
         item_name_d = game_data.producible_item_name_d
     else:
         item_name_d = game_data.item_name_d
+    search_index = search.SearchIndex(item_name_d, label=str)
 
     options: list[str] = []
     while True:
@@ -152,7 +201,7 @@ def get_arbitrary_item(
             continue
         if item_name.isdigit():
             item_index = int(item_name)
-            if 0 <= item_index < min(MAX_DISPLAY_OPTIONS, len(options)):
+            if 0 <= item_index < len(options):
                 return game_data.item_name_d[options[item_index]]
             continue
 
@@ -160,10 +209,10 @@ def get_arbitrary_item(
         if item is not None:
             return item
 
-        options = search.sort_options(item_name_d.keys(), item_name)
+        options = search_index.best_matches(item_name, limit=MAX_DISPLAY_OPTIONS)
         if options:
             print("Did you mean:")
-            for index, option in enumerate(options[:MAX_DISPLAY_OPTIONS]):
+            for index, option in enumerate(options):
                 print(f"{index} - {option}")
             print()
 
@@ -174,6 +223,10 @@ def get_arbitrary_item(
 class InteractiveRunner:
     game_data: ic.GameData
     production_chain: pc.ProductionChain
+    history: history.ChainHistory = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        self.history = history.ChainHistory(self.production_chain)
 
     @_cancelable
     def add_recipe_for_shortage_item(self) -> None:
@@ -194,7 +247,7 @@ class InteractiveRunner:
             recipe.print(indent=4)
             print()
 
-        recipe = choose_named(recipes)
+        recipe = choose_recipe(recipes)
         self.production_chain.add_scaled_recipe(recipe, item)
         print("New Recipe:")
         recipe.print(indent=4, scale=self.production_chain.recipes[recipe])
@@ -209,7 +262,7 @@ class InteractiveRunner:
             recipe.print(indent=4)
             print()
 
-        recipe = choose_named(recipes)
+        recipe = choose_recipe(recipes)
         per_min = get_positive_float(
             f"How many {self.production_chain.goal.name} per minute with this recipe"
         )
@@ -242,7 +295,7 @@ class InteractiveRunner:
 
     @_cancelable
     def remove_recipe(self) -> None:
-        recipe = choose_named(
+        recipe = choose_recipe(
             sorted(
                 self.production_chain.recipes.keys(),
                 key=lambda it: it.name.lower(),
@@ -250,6 +303,25 @@ class InteractiveRunner:
         )
         del self.production_chain.recipes[recipe]
 
+    def undo(self) -> None:
+        if self.history.undo():
+            print("Undid last change")
+        else:
+            print("Nothing to undo")
+
+    def redo(self) -> None:
+        if self.history.redo():
+            print("Redid last undone change")
+        else:
+            print("Nothing to redo")
+
+    def record_history(self) -> None:
+        """Record the chain as a history step, starting over if it was replaced."""
+        if self.history.chain is self.production_chain:
+            self.history.record()
+        else:
+            self.history = history.ChainHistory(self.production_chain)
+
     def print_state(self) -> None:
         print("\n")
         self.production_chain.print()
@@ -336,6 +408,7 @@ class InteractiveRunner:
                     print(f"Invalid command {command_str}")
                 else:
                     command(self)
+                    self.record_history()
         except ExitInteractiveException:
             pass
 
@@ -345,6 +418,8 @@ class InteractiveRunner:
         "scale-item": scale_item,
         "remove-recipe": remove_recipe,
         "clear-recipes": clear_recipes,
+        "u": undo,
+        "r": redo,
         "print": print_state,
         "help": print_help,
         "save": save,
@@ -0,0 +1,642 @@
+"""
+Compact exact item counts keyed by dense integer item indices.
+
+An ItemCounter stores sorted item indices and integer numerators in arrays
+over one shared denominator, so adding, subtracting and scaling whole
+counters is integer arithmetic on a few machine words per item rather than a
+Fraction and a dict slot per item.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import collections.abc as cabc
+import fractions as fr
+import functools
+import math
+import threading
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    from satisfactory_recipes import info_classes as ic
+
+type _Numerators = array.array[int] | list[int]
+
+
+class ItemTable:
+    """Gives each item a dense integer index, once, for the life of the table."""
+
+    __slots__ = ("_index", "_items", "_lock")
+
+    def __init__(self) -> None:
+        self._items: list[ic.Item] = []
+        self._index: dict[ic.Item, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def index(self, item: ic.Item) -> int:
+        """Index of item, assigning the next free one if item is new."""
+        index = self._index.get(item)
+        if index is None:
+            # Docs can load on a worker while the GUI thread builds counters.
+            with self._lock:
+                index = self._index.setdefault(item, len(self._items))
+                if index == len(self._items):
+                    self._items.append(item)
+        return index
+
+    def find(self, item: object) -> int | None:
+        """Index of item, or None if it was never indexed."""
+        return self._index.get(ty.cast("ic.Item", item))
+
+    def item(self, index: int) -> ic.Item:
+        return self._items[index]
+
+
+# Shared by every counter. Recipes are built before the GameData holding them,
+# and scaled GameData variants share their base's items, so a table per
+# GameData would only force conversions between tables.
+ITEM_TABLE = ItemTable()
+
+
+def _numerator_buffer(numerators: cabc.Iterable[int]) -> _Numerators:
+    numerators = list(numerators)
+    try:
+        return array.array("q", numerators)
+    except OverflowError:
+        # Exact rates can outgrow 64 bits after enough rescaling.
+        return numerators
+
+
+def _normalized(
+    totals: cabc.Mapping[int, int],
+    denominator: int,
+) -> tuple[array.array[int], _Numerators, int]:
+    """Sorted nonzero entries of totals over denominator, in lowest terms."""
+    indices = sorted(index for index, numerator in totals.items() if numerator)
+    numerators = [totals[index] for index in indices]
+    common = math.gcd(denominator, *numerators)
+    if common > 1:
+        numerators = [numerator // common for numerator in numerators]
+        denominator //= common
+    if not indices:
+        denominator = 1
+    return array.array("I", indices), _numerator_buffer(numerators), denominator
+
+
+def _pairs(
+    mapping: cabc.Mapping[ic.Item, fr.Fraction]
+    | cabc.Iterable[tuple[ic.Item, fr.Fraction]],
+) -> cabc.Iterable[tuple[ic.Item, fr.Fraction]]:
+    if isinstance(mapping, cabc.Mapping):
+        return ty.cast("cabc.Mapping[ic.Item, fr.Fraction]", mapping).items()
+    return mapping
+
+
+class _ItemCounterItems(cabc.ItemsView["ic.Item", fr.Fraction]):
+    _mapping: ItemCounter
+
+    def __iter__(self) -> cabc.Iterator[tuple[ic.Item, fr.Fraction]]:
+        return self._mapping.iter_amounts()
+
+
+class _ItemCounterValues(cabc.ValuesView[fr.Fraction]):
+    _mapping: ItemCounter
+
+    def __iter__(self) -> cabc.Iterator[fr.Fraction]:
+        for _item, value in self._mapping.iter_amounts():
+            yield value
+
+
+class ItemCounter(cabc.Mapping["ic.Item", fr.Fraction]):
+    """
+    Exact per-item amounts with the ScalableCounter add/sub/scale/freeze API.
+
+    Missing items read as 0 without being inserted, and zero amounts are
+    never stored, so two counters are equal exactly when their nonzero
+    amounts are. Can be frozen for hashability.
+    """
+
+    __slots__ = (
+        "_denominator",
+        "_frozen",
+        "_hash",
+        "_indices",
+        "_numerators",
+        "_owned",
+        "_reduced",
+    )
+
+    _indices: array.array[int]
+    _numerators: _Numerators
+    _denominator: int
+
+    def __init__(
+        self,
+        mapping: cabc.Mapping[ic.Item, fr.Fraction]
+        | cabc.Iterable[tuple[ic.Item, fr.Fraction]] = (),
+        /,
+        *,
+        frozen: bool = False,
+    ) -> None:
+        self._frozen = False
+        if isinstance(mapping, ItemCounter):
+            self._set(
+                mapping._indices,
+                mapping._numerators,
+                mapping._denominator,
+                reduced=mapping._reduced,
+            )
+            # The buffers are shared now, so neither side may write in place.
+            mapping._owned = False
+        else:
+            self._set_amounts(
+                {
+                    ITEM_TABLE.index(item): fr.Fraction(amount)
+                    for item, amount in _pairs(mapping)
+                }
+            )
+        self._frozen = frozen
+
+    @classmethod
+    def from_numerators(
+        cls,
+        indices: cabc.Iterable[int],
+        numerators: cabc.Iterable[int],
+        denominator: int,
+        *,
+        frozen: bool = False,
+    ) -> ty.Self:
+        """Counter of ITEM_TABLE indices paired with numerators over denominator."""
+        counter = cls()
+        counter._set(
+            *_normalized(dict(zip(indices, numerators, strict=True)), denominator)
+        )
+        counter._frozen = frozen
+        return counter
+
+    def _set(
+        self,
+        indices: array.array[int],
+        numerators: _Numerators,
+        denominator: int,
+        *,
+        reduced: bool = True,
+    ) -> None:
+        # Buffers set here may be shared with other counters, so they are
+        # copied once by _own before the first in-place write.
+        self._indices = indices
+        self._numerators = numerators
+        self._denominator = denominator
+        self._owned = False
+        self._reduced = reduced
+        self._hash: int | None = None
+
+    def _own(self) -> None:
+        if not self._owned:
+            self._indices = self._indices[:]
+            self._numerators = self._numerators[:]
+            self._owned = True
+
+    def _reduce(self) -> None:
+        # Single-key writes skip the gcd over every numerator, so the shared
+        # denominator is only brought back to lowest terms when it is read.
+        if self._reduced:
+            return
+        common = math.gcd(self._denominator, *self._numerators)
+        if common > 1:
+            self._numerators = _numerator_buffer(
+                numerator // common for numerator in self._numerators
+            )
+            self._denominator //= common
+        self._reduced = True
+
+    def _write(self, index: int, amount: fr.Fraction) -> None:
+        """Set the amount at index in place, leaving every other slot alone."""
+        position = bisect.bisect_left(self._indices, index)
+        present = position < len(self._indices) and self._indices[position] == index
+        if not amount:
+            if present:
+                self._remove(position)
+            return
+        if self._denominator % amount.denominator:
+            denominator = math.lcm(self._denominator, amount.denominator)
+            widen_by = denominator // self._denominator
+            self._numerators = _numerator_buffer(
+                numerator * widen_by for numerator in self._numerators
+            )
+            self._denominator = denominator
+        numerator = amount.numerator * (self._denominator // amount.denominator)
+        self._own()
+        if isinstance(self._numerators, array.array) and numerator.bit_length() > 63:
+            # Exact rates can outgrow 64 bits after enough rescaling.
+            self._numerators = self._numerators.tolist()
+        if present:
+            self._numerators[position] = numerator
+        else:
+            self._numerators.insert(position, numerator)
+            self._indices.insert(position, index)
+        self._reduced = False
+        self._hash = None
+
+    def _remove(self, position: int) -> None:
+        self._own()
+        del self._indices[position]
+        del self._numerators[position]
+        self._reduced = False
+        self._hash = None
+
+    def _set_amounts(self, amounts: cabc.Mapping[int, fr.Fraction]) -> None:
+        denominator = math.lcm(*(amount.denominator for amount in amounts.values()))
+        self._set(
+            *_normalized(
+                {
+                    index: amount.numerator * (denominator // amount.denominator)
+                    for index, amount in amounts.items()
+                },
+                denominator,
+            )
+        )
+
+    def _amounts(self) -> dict[int, fr.Fraction]:
+        return {
+            index: fr.Fraction(numerator, self._denominator)
+            for index, numerator in zip(self._indices, self._numerators, strict=True)
+        }
+
+    def as_numerators(self) -> tuple[cabc.Sequence[int], cabc.Sequence[int], int]:
+        """
+        Sorted ITEM_TABLE indices, their numerators, and the denominator.
+
+        The denominator may not be in lowest terms. The sequences are shared
+        with the counter, so read them before it is next changed.
+        """
+        return self._indices, self._numerators, self._denominator
+
+    def iter_amounts(self) -> cabc.Iterator[tuple[ic.Item, fr.Fraction]]:
+        """Iterate (item, amount) pairs in index order, without a view."""
+        item = ITEM_TABLE.item
+        denominator = self._denominator
+        for index, numerator in zip(self._indices, self._numerators, strict=True):
+            yield item(index), fr.Fraction(numerator, denominator)
+
+    def _position(self, item: object) -> int | None:
+        index = ITEM_TABLE.find(item)
+        if index is None:
+            return None
+        position = bisect.bisect_left(self._indices, index)
+        if position < len(self._indices) and self._indices[position] == index:
+            return position
+        return None
+
+    @property
+    def denominator(self) -> int:
+        """Denominator shared by every stored amount, in lowest terms."""
+        self._reduce()
+        return self._denominator
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self) -> ty.Self:
+        self._reduce()
+        self._frozen = True
+        self._hash = None
+        return self
+
+    def frozen_copy(self) -> ty.Self:
+        return type(self)(self, frozen=True)
+
+    def unfrozen_copy(self) -> ty.Self:
+        return type(self)(self, frozen=False)
+
+    def copy(self) -> ty.Self:
+        return type(self)(self, frozen=self._frozen)
+
+    def __copy__(self) -> ty.Self:
+        return self.copy()
+
+    def __reduce__(self) -> tuple[ty.Any, ...]:
+        # Indices are only meaningful within one process, so pickle by item.
+        return (
+            functools.partial(type(self), frozen=self._frozen),
+            (dict(self.iter_amounts()),),
+        )
+
+    def __getitem__(self, item: ic.Item) -> fr.Fraction:
+        position = self._position(item)
+        if position is None:
+            return fr.Fraction(0)
+        return fr.Fraction(self._numerators[position], self._denominator)
+
+    @ty.overload
+    def get(self, item: ic.Item, /) -> fr.Fraction | None: ...
+    @ty.overload
+    def get(self, item: ic.Item, default: fr.Fraction, /) -> fr.Fraction: ...
+    @ty.overload
+    def get[D](self, item: ic.Item, default: D, /) -> fr.Fraction | D: ...
+    def get[D](
+        self, item: ic.Item, default: D | None = None, /
+    ) -> fr.Fraction | D | None:
+        position = self._position(item)
+        if position is None:
+            return default
+        return fr.Fraction(self._numerators[position], self._denominator)
+
+    def __contains__(self, item: object) -> bool:
+        return self._position(item) is not None
+
+    def __iter__(self) -> cabc.Iterator[ic.Item]:
+        return map(ITEM_TABLE.item, self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def items(self) -> _ItemCounterItems:
+        return _ItemCounterItems(self)
+
+    def values(self) -> _ItemCounterValues:
+        return _ItemCounterValues(self)
+
+    def restricted_to(self, items: cabc.Iterable[ic.Item]) -> ItemCounter:
+        """A new, unfrozen counter of only the amounts of items, in one pass."""
+        keep: set[int | None]
+        if isinstance(items, ItemCounter):
+            keep = set(items._indices)
+        else:
+            keep = {ITEM_TABLE.find(item) for item in items}
+        counter = ItemCounter()
+        counter._set(
+            *_normalized(
+                {
+                    index: numerator
+                    for index, numerator in zip(
+                        self._indices, self._numerators, strict=True
+                    )
+                    if index in keep
+                },
+                self._denominator,
+            )
+        )
+        return counter
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.iter_amounts())!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ItemCounter):
+            self._reduce()
+            other._reduce()
+            return (
+                self._denominator == other._denominator
+                and self._indices == other._indices
+                and list(self._numerators) == list(other._numerators)
+            )
+        if isinstance(other, cabc.Mapping):
+            other_amounts = ty.cast(cabc.Mapping[object, object], other)
+            return dict(self.iter_amounts()) == {
+                item: amount for item, amount in other_amounts.items() if amount
+            }
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if not self._frozen:
+            raise TypeError(
+                f"Called __hash__ from non-frozen {type(self).__name__} {self}. "
+                "You can freeze first with thing.freeze()."
+            )
+
+        if self._hash is None:
+            self._hash = hash(
+                (tuple(self._indices), tuple(self._numerators), self._denominator)
+            )
+
+        return self._hash
+
+    def _check_mutable(self, operation: str) -> None:
+        if self._frozen:
+            raise TypeError(f"Called {operation} from frozen {type(self).__name__}")
+
+    def __setitem__(self, item: ic.Item, value: fr.Fraction) -> None:
+        self._check_mutable("__setitem__")
+        self._write(ITEM_TABLE.index(item), fr.Fraction(value))
+
+    def __delitem__(self, item: ic.Item) -> None:
+        self._check_mutable("__delitem__")
+        position = self._position(item)
+        if position is None:
+            raise KeyError(item)
+        self._remove(position)
+
+    def pop(self, item: ic.Item, default: object = ty.cast(object, ...)) -> fr.Fraction:
+        self._check_mutable("pop")
+        if item not in self:
+            if default is ...:
+                raise KeyError(item)
+            return ty.cast(fr.Fraction, default)
+        value = self[item]
+        del self[item]
+        return value
+
+    def clear(self) -> None:
+        self._check_mutable("clear")
+        self._set(array.array("I"), array.array("q"), 1)
+
+    def update(
+        self,
+        mapping: cabc.Mapping[ic.Item, fr.Fraction]
+        | cabc.Iterable[tuple[ic.Item, fr.Fraction]] = (),
+        /,
+    ) -> None:
+        self._check_mutable("update")
+        updates = [
+            (ITEM_TABLE.index(item), fr.Fraction(amount))
+            for item, amount in _pairs(mapping)
+        ]
+        if len(updates) * 4 <= len(self):
+            # A few keys are cheaper written in place than rebuilt around.
+            for index, amount in updates:
+                self._write(index, amount)
+            return
+        amounts = self._amounts()
+        amounts.update(updates)
+        self._set_amounts(amounts)
+
+    def _as_counter(self, other: cabc.Mapping[ic.Item, fr.Fraction]) -> ItemCounter:
+        return other if isinstance(other, ItemCounter) else ItemCounter(other)
+
+    def _add_scaled(self, other: ItemCounter, factor: fr.Fraction) -> None:
+        """Set self to self + factor * other, all in integers."""
+        if not factor or not other._indices:
+            return
+        scaled_denominator = factor.denominator * other._denominator
+        denominator = math.lcm(self._denominator, scaled_denominator)
+        self_scale = denominator // self._denominator
+        other_scale = factor.numerator * (denominator // scaled_denominator)
+        totals = {
+            index: numerator * self_scale
+            for index, numerator in zip(self._indices, self._numerators, strict=True)
+        }
+        for index, numerator in zip(other._indices, other._numerators, strict=True):
+            totals[index] = totals.get(index, 0) + numerator * other_scale
+        self._set(*_normalized(totals, denominator))
+
+    def add_scaled(
+        self,
+        other: cabc.Mapping[ic.Item, fr.Fraction],
+        factor: fr.Fraction,
+    ) -> None:
+        """In place self += other * factor, without building other * factor."""
+        self._check_inplace()
+        self._add_scaled(self._as_counter(other), fr.Fraction(factor))
+
+    def _scale(self, factor: fr.Fraction) -> None:
+        if not factor:
+            self._set(array.array("I"), array.array("q"), 1)
+            return
+        numerators = [numerator * factor.numerator for numerator in self._numerators]
+        denominator = self._denominator * factor.denominator
+        common = math.gcd(denominator, *numerators)
+        self._set(
+            self._indices,
+            _numerator_buffer(numerator // common for numerator in numerators),
+            denominator // common,
+        )
+
+    def __add__(self, other: cabc.Mapping[ic.Item, fr.Fraction]) -> ty.Self:
+        summed = self.unfrozen_copy()
+        summed += other
+        return summed
+
+    def __iadd__(self, other: cabc.Mapping[ic.Item, fr.Fraction]) -> ty.Self:
+        self._check_inplace()
+        self._add_scaled(self._as_counter(other), fr.Fraction(1))
+        return self
+
+    def __sub__(self, other: cabc.Mapping[ic.Item, fr.Fraction]) -> ty.Self:
+        subbed = self.unfrozen_copy()
+        subbed -= other
+        return subbed
+
+    def __isub__(self, other: cabc.Mapping[ic.Item, fr.Fraction]) -> ty.Self:
+        self._check_inplace()
+        self._add_scaled(self._as_counter(other), fr.Fraction(-1))
+        return self
+
+    def __mul__(self, scale: fr.Fraction) -> ty.Self:
+        scaled = self.unfrozen_copy()
+        scaled *= scale
+        return scaled
+
+    def __rmul__(self, scale: fr.Fraction) -> ty.Self:
+        return self * scale
+
+    def __imul__(self, scale: fr.Fraction) -> ty.Self:
+        self._check_inplace()
+        self._scale(fr.Fraction(scale))
+        return self
+
+    def __truediv__(self, scale: fr.Fraction) -> ty.Self:
+        scaled = self.unfrozen_copy()
+        scaled /= scale
+        return scaled
+
+    def __itruediv__(self, scale: fr.Fraction) -> ty.Self:
+        self._check_inplace()
+        self._scale(1 / fr.Fraction(scale))
+        return self
+
+    def _check_inplace(self) -> None:
+        if self._frozen:
+            raise TypeError(
+                f"inplace operations not supported for frozen {type(self).__name__}"
+            )
+
+
+class RateTotals:
+    """
+    Running per-item totals kept as integers over one fixed denominator.
+
+    The denominator only grows, to a multiple of whatever is added, so adding
+    a scaled counter is one integer multiply-add per item with no gcd. Read
+    the totals with to_counter, which reduces them to lowest terms.
+    """
+
+    __slots__ = ("_denominator", "_numerators")
+
+    def __init__(self) -> None:
+        self._numerators: dict[int, int] = {}
+        self._denominator = 1
+
+    @property
+    def denominator(self) -> int:
+        """The current common denominator; not necessarily in lowest terms."""
+        return self._denominator
+
+    def __len__(self) -> int:
+        return len(self._numerators)
+
+    def copy(self) -> RateTotals:
+        copied = RateTotals()
+        copied._numerators = self._numerators.copy()
+        copied._denominator = self._denominator
+        return copied
+
+    def clear(self) -> None:
+        self._numerators.clear()
+        self._denominator = 1
+
+    def _widen(self, needed: int) -> None:
+        denominator = math.lcm(self._denominator, needed)
+        widen_by = denominator // self._denominator
+        numerators = self._numerators
+        for index, numerator in numerators.items():
+            numerators[index] = numerator * widen_by
+        self._denominator = denominator
+
+    def add_scaled(self, counter: ItemCounter, factor: fr.Fraction) -> None:
+        """Add counter * factor."""
+        indices, counter_numerators, counter_denominator = counter.as_numerators()
+        if not factor or not indices:
+            return
+        needed = factor.denominator * counter_denominator
+        if self._denominator % needed:
+            self._widen(needed)
+        scale = factor.numerator * (self._denominator // needed)
+        numerators = self._numerators
+        for index, numerator in zip(indices, counter_numerators, strict=True):
+            total = numerators.get(index, 0) + numerator * scale
+            if total:
+                numerators[index] = total
+            else:
+                del numerators[index]
+
+    def scale(self, factor: fr.Fraction) -> None:
+        """Multiply every total by factor."""
+        if not factor:
+            self.clear()
+            return
+        numerators = self._numerators
+        if factor.numerator != 1:
+            for index, numerator in numerators.items():
+                numerators[index] = numerator * factor.numerator
+        self._denominator *= factor.denominator
+
+    def reduce(self) -> None:
+        """Bring the denominator back down to lowest terms."""
+        numerators = self._numerators
+        common = math.gcd(self._denominator, *numerators.values())
+        if common > 1:
+            for index, numerator in numerators.items():
+                numerators[index] = numerator // common
+            self._denominator //= common
+
+    def to_counter(self) -> ItemCounter:
+        """The totals as a new, unfrozen ItemCounter; self is left as is."""
+        return ItemCounter.from_numerators(
+            self._numerators.keys(), self._numerators.values(), self._denominator
+        )
@@ -0,0 +1,65 @@
+"""Exact sparse linear algebra over Fractions."""
+
+from __future__ import annotations
+
+import fractions as fr
+
+
+def solve_sparse(
+    rows: list[dict[int, fr.Fraction]],
+    rhs: list[fr.Fraction],
+) -> list[fr.Fraction]:
+    """
+    Solve a square sparse system exactly with Gauss-Jordan elimination.
+
+    Rows are column -> coefficient dicts. Pivots prefer short rows and rarely
+    used columns, which keeps fill-in low for the mostly tree-shaped systems
+    production chains produce. Raises ValueError if the system is singular.
+    """
+    rows = [dict(row) for row in rows]
+    rhs = list(rhs)
+    column_rows: dict[int, set[int]] = {}
+    for row_index, row in enumerate(rows):
+        for column in row:
+            column_rows.setdefault(column, set()).add(row_index)
+
+    pivots: list[tuple[int, int]] = []
+    pending = set(range(len(rows)))
+    while pending:
+        pivot_row = min(pending, key=lambda row_index: len(rows[row_index]))
+        pending.remove(pivot_row)
+        row = rows[pivot_row]
+        if not row:
+            raise ValueError("Singular system")
+        pivot_column = min(row, key=lambda column: len(column_rows[column]))
+        pivot = row[pivot_column]
+        if pivot != 1:
+            for column in row:
+                row[column] /= pivot
+            rhs[pivot_row] /= pivot
+
+        for other_index in tuple(column_rows[pivot_column]):
+            if other_index == pivot_row:
+                continue
+            other = rows[other_index]
+            factor = other[pivot_column]
+            for column, value in row.items():
+                updated = other.get(column, fr.Fraction(0)) - factor * value
+                if updated:
+                    if column not in other:
+                        column_rows[column].add(other_index)
+                    other[column] = updated
+                elif column in other:
+                    del other[column]
+                    column_rows[column].discard(other_index)
+            rhs[other_index] -= factor * rhs[pivot_row]
+
+        # Only the pivot row still uses the pivot column. Later pivots keep
+        # eliminating from this row, so its rhs is read once at the end.
+        del column_rows[pivot_column]
+        pivots.append((pivot_row, pivot_column))
+
+    solution = [fr.Fraction(0)] * len(rows)
+    for row_index, column in pivots:
+        solution[column] = rhs[row_index]
+    return solution
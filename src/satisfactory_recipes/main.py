@@ -9,7 +9,7 @@ import sys
 import typing as ty
 
 from satisfactory_recipes import config as sr_config
-from satisfactory_recipes import docs_parser
+from satisfactory_recipes import docs_cache
 from satisfactory_recipes import interactive_mode as im
 
 
@@ -30,6 +30,19 @@ def add_docs_args(
         default=default,
         type=pathlib.Path,
     )
+    parser.add_argument(
+        "--no-docs-cache",
+        dest="use_docs_cache",
+        help="Parse the docs file instead of reusing the parsed copy cached from it",
+        action="store_false",
+        default=argparse.SUPPRESS if default is argparse.SUPPRESS else True,
+    )
+    parser.add_argument(
+        "--profile-load",
+        help="Parse the docs file and print time and peak memory for each phase",
+        action="store_true",
+        default=argparse.SUPPRESS if default is argparse.SUPPRESS else False,
+    )
 
 
 def add_cli_args(
@@ -129,7 +142,11 @@ def resolve_docs_path(args: argparse.Namespace) -> pathlib.Path:
 def run_cli(args: argparse.Namespace) -> None:
     docs_path = resolve_docs_path(args)
 
-    game_data = docs_parser.load_game_data(docs_path)
+    game_data = docs_cache.load_game_data(
+        docs_path,
+        use_cache=getattr(args, "use_docs_cache", True),
+        profile=getattr(args, "profile_load", False),
+    )
     scale = getattr(args, "scale", fr.Fraction(1, 1))
     if scale != 1:
         game_data.scale_recipes(scale)
@@ -158,6 +175,8 @@ def run_gui(args: argparse.Namespace) -> None:
         game_path=getattr(args, "game_path", None),
         filename=getattr(args, "filename", None),
         initial_scale=scale,
+        use_docs_cache=getattr(args, "use_docs_cache", True),
+        profile_load=getattr(args, "profile_load", False),
     )
 
 
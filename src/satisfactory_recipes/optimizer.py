@@ -0,0 +1,491 @@
+"""
+Choose recipe counts across all recipes, including alternates, at minimum cost.
+
+The problem is a linear program solved with an exact rational simplex, so the
+resulting counts are Fractions like everywhere else in the tool.
+"""
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import enum
+import fractions as fr
+
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import linear_algebra
+from satisfactory_recipes import production_chain as pc
+from satisfactory_recipes import stupid_classes as sc
+
+# Float tableau entries smaller than this are treated as zero.
+_FLOAT_TOLERANCE = 1e-9
+
+# Float pivots must be at least this fraction of the largest positive entry in
+# their column.
+_FLOAT_PIVOT_TOLERANCE = 1e-6
+
+
+class Objective(enum.StrEnum):
+    RAW_RESOURCES = enum.auto()
+    POWER = enum.auto()
+    BUILDINGS = enum.auto()
+
+
+class OptimizationError(ValueError):
+    """Raised when no chain makes the goal, or the cost has no minimum."""
+
+
+def optimize_chain(
+    game_data: ic.GameData,
+    goal: ic.Item,
+    rate: fr.Fraction,
+    *,
+    objective: Objective = Objective.RAW_RESOURCES,
+    raw_weights: cabc.Mapping[ic.Item, fr.Fraction] | None = None,
+) -> pc.ProductionChain:
+    """
+    Build the cheapest chain making rate of goal per minute.
+
+    Raw items are resources plus anything no recipe makes, and may be consumed
+    freely. Every other item must net at least zero, so surplus byproducts are
+    allowed. RAW_RESOURCES weighs raw intake per item by raw_weights (1 per
+    unit for unlisted items), POWER minimizes total mean draw and BUILDINGS the
+    total recipe count.
+    """
+    if rate <= 0:
+        raise ValueError("Goal rate must be positive")
+
+    recipes = _candidate_recipes(game_data, goal)
+    if not recipes:
+        raise OptimizationError(f"No recipe can produce {goal.name}")
+
+    produced = {item for recipe in recipes for item in recipe.products}
+    items = sorted(
+        {item for recipe in recipes for item in (*recipe.inputs, *recipe.products)},
+        key=lambda item: item.class_name,
+    )
+    raw_items = frozenset(
+        item
+        for item in items
+        if item != goal and (item.is_resource or item not in produced)
+    )
+    weights = raw_weights or {}
+    costs = [
+        _recipe_cost(recipe, objective=objective, raw_items=raw_items, weights=weights)
+        for recipe in recipes
+    ]
+
+    # Goal row: net goal == rate. Other rows: -net + surplus == 0, so the
+    # surplus variable starts basic and only the goal row needs an artificial.
+    rows: list[dict[int, fr.Fraction]] = []
+    rhs: list[fr.Fraction] = []
+    basis: list[int | None] = []
+    for item in items:
+        if item in raw_items:
+            continue
+        net = {
+            column: rate_per_min
+            for column, recipe in enumerate(recipes)
+            if (
+                rate_per_min := recipe.products_per_min.get(item, fr.Fraction(0))
+                - recipe.inputs_per_min.get(item, fr.Fraction(0))
+            )
+        }
+        if item == goal:
+            rows.append(net)
+            rhs.append(rate)
+            basis.append(None)
+            continue
+
+        surplus = len(costs)
+        costs.append(fr.Fraction(0))
+        row = {column: -value for column, value in net.items()}
+        row[surplus] = fr.Fraction(1)
+        rows.append(row)
+        rhs.append(fr.Fraction(0))
+        basis.append(surplus)
+
+    solution = _minimize(costs, rows, rhs, basis)
+    return pc.ProductionChain(
+        goal=goal,
+        recipes=sc.ScalableCounter[ic.Recipe](
+            (recipe, count) for recipe, count in zip(recipes, solution) if count
+        ),
+    )
+
+
+def _candidate_recipes(game_data: ic.GameData, goal: ic.Item) -> list[ic.Recipe]:
+    """Automated recipes that make the goal or, transitively, any of their inputs."""
+    needed = [goal]
+    seen_items = {goal}
+    chosen: dict[str, ic.Recipe] = {}
+    while needed:
+        item = needed.pop()
+        for recipe in game_data.get_recipes_producing(item):
+            if recipe.class_name in chosen:
+                continue
+            chosen[recipe.class_name] = recipe
+            for ingredient in recipe.inputs:
+                if ingredient not in seen_items:
+                    seen_items.add(ingredient)
+                    needed.append(ingredient)
+
+    return [chosen[class_name] for class_name in sorted(chosen)]
+
+
+def _recipe_cost(
+    recipe: ic.Recipe,
+    *,
+    objective: Objective,
+    raw_items: frozenset[ic.Item],
+    weights: cabc.Mapping[ic.Item, fr.Fraction],
+) -> fr.Fraction:
+    match objective:
+        case Objective.RAW_RESOURCES:
+            intake = recipe.inputs_per_min - recipe.products_per_min
+            return sum(
+                (
+                    weights.get(item, fr.Fraction(1)) * amount
+                    for item, amount in intake.items()
+                    if item in raw_items
+                ),
+                start=fr.Fraction(0),
+            )
+        case Objective.POWER:
+            return recipe.power_profile.mean_draw
+        case Objective.BUILDINGS:
+            return fr.Fraction(1)
+
+
+def _minimize(
+    costs: list[fr.Fraction],
+    rows: list[dict[int, fr.Fraction]],
+    rhs: list[fr.Fraction],
+    basis: list[int | None],
+) -> list[fr.Fraction]:
+    """
+    Minimize costs @ x subject to rows @ x == rhs and x >= 0.
+
+    rhs must be non-negative. A row whose basis entry names a variable must
+    contain it with coefficient 1, and that variable must appear in no other
+    row; rows marked None get an artificial variable for phase one.
+
+    The simplex first runs in floats, which is fast but may pick a wrong basis
+    through rounding. That basis is then checked exactly: it must be feasible
+    and leave no negative reduced cost. Only if the check fails, or the float
+    simplex gives up, does the simplex run again in Fractions.
+    """
+    float_rows = [
+        {column: float(value) for column, value in row.items()} for row in rows
+    ]
+    try:
+        float_basis = _simplex(
+            [float(cost) for cost in costs],
+            float_rows,
+            [float(value) for value in rhs],
+            basis,
+            tolerance=_FLOAT_TOLERANCE,
+            pivot_tolerance=_FLOAT_PIVOT_TOLERANCE,
+        ).basis
+    except OptimizationError:
+        # Rounding can fake an infeasible or unbounded problem, so only the
+        # exact simplex may raise.
+        float_basis = []
+    if len(float_basis) == len(rows):
+        solution = _verified_solution(costs, rows, rhs, float_basis)
+        if solution is not None:
+            return solution
+
+    tableau = _simplex(
+        costs,
+        rows,
+        rhs,
+        basis,
+        tolerance=fr.Fraction(0),
+        pivot_tolerance=fr.Fraction(0),
+    )
+    solution = [fr.Fraction(0)] * len(costs)
+    for row_index, variable in enumerate(tableau.basis):
+        solution[variable] = tableau.rhs[row_index]
+    return solution
+
+
+def _simplex[N: (fr.Fraction, float)](
+    costs: list[N],
+    rows: list[dict[int, N]],
+    rhs: list[N],
+    basis: list[int | None],
+    *,
+    tolerance: N,
+    pivot_tolerance: N,
+) -> _Tableau[N]:
+    """Run both simplex phases and return the optimal tableau."""
+    one = tolerance * 0 + 1
+    rows = [dict(row) for row in rows]
+    rhs = list(rhs)
+    variable_count = len(costs)
+    start_basis: list[int] = []
+    artificials: set[int] = set()
+    for row_index, basic in enumerate(basis):
+        if basic is None:
+            basic = variable_count + len(artificials)
+            artificials.add(basic)
+            rows[row_index][basic] = one
+        start_basis.append(basic)
+
+    tableau = _Tableau(
+        rows=rows,
+        rhs=rhs,
+        basis=start_basis,
+        tolerance=tolerance,
+        pivot_tolerance=pivot_tolerance,
+    )
+    if artificials:
+        tableau.set_costs({variable: one for variable in artificials})
+        tableau.run()
+        if tableau.objective_value > tolerance * len(rows):
+            raise OptimizationError("Goal cannot be produced from available recipes")
+        tableau.drop_variables(artificials)
+
+    tableau.set_costs(
+        {variable: cost for variable, cost in enumerate(costs) if abs(cost) > tolerance}
+    )
+    tableau.run()
+    return tableau
+
+
+def _verified_solution(
+    costs: list[fr.Fraction],
+    rows: list[dict[int, fr.Fraction]],
+    rhs: list[fr.Fraction],
+    basis: list[int],
+) -> list[fr.Fraction] | None:
+    """
+    Exact solution for basis, or None if it is not optimal.
+
+    Solves B x = rhs for the basic values and B^T y = c_B for the duals, then
+    requires x >= 0 and c_j - y @ A_j >= 0 for every variable.
+    """
+    column_of = {variable: column for column, variable in enumerate(basis)}
+    basic_rows = [
+        {
+            column_of[variable]: value
+            for variable, value in row.items()
+            if variable in column_of
+        }
+        for row in rows
+    ]
+    dual_rows: list[dict[int, fr.Fraction]] = [{} for _variable in basis]
+    for row_index, row in enumerate(basic_rows):
+        for column, value in row.items():
+            dual_rows[column][row_index] = value
+
+    try:
+        values = linear_algebra.solve_sparse(basic_rows, rhs)
+        duals = linear_algebra.solve_sparse(
+            dual_rows,
+            [costs[variable] for variable in basis],
+        )
+    except ValueError:
+        return None
+    if any(value < 0 for value in values):
+        return None
+
+    priced = list(costs)
+    for dual, row in zip(duals, rows):
+        if not dual:
+            continue
+        for variable, value in row.items():
+            priced[variable] -= dual * value
+    if any(reduced_cost < 0 for reduced_cost in priced):
+        return None
+
+    solution = [fr.Fraction(0)] * len(costs)
+    for variable, value in zip(basis, values):
+        solution[variable] = value
+    return solution
+
+
+class _Tableau[N: (fr.Fraction, float)]:
+    """
+    Sparse simplex tableau with row dicts.
+
+    Entries within tolerance of zero are treated as zero, and entries below
+    pivot_tolerance times their column's largest never pivot. Fraction tableaus
+    use zero for both, so they are exact.
+    """
+
+    def __init__(
+        self,
+        *,
+        rows: list[dict[int, N]],
+        rhs: list[N],
+        basis: list[int],
+        tolerance: N,
+        pivot_tolerance: N,
+    ) -> None:
+        self.rows: list[dict[int, N]] = rows
+        self.rhs: list[N] = rhs
+        self.basis = basis
+        self.tolerance: N = tolerance
+        self.pivot_tolerance: N = pivot_tolerance
+        self.reduced_costs: dict[int, N] = {}
+        self.objective_value: N = tolerance * 0
+
+    def set_costs(self, costs: cabc.Mapping[int, N]) -> None:
+        """Price out the current basis so basic variables have zero reduced cost."""
+        reduced = dict(costs)
+        objective_value = self.tolerance * 0
+        for row_index, variable in enumerate(self.basis):
+            cost = costs.get(variable)
+            if cost is None:
+                continue
+            objective_value += cost * self.rhs[row_index]
+            self._subtract_scaled(reduced, self.rows[row_index], cost)
+        self.reduced_costs = reduced
+        self.objective_value = objective_value
+
+    def run(self) -> None:
+        # Every row but the goal's starts at zero, so most pivots are
+        # degenerate. Breaking ratio ties lexicographically against the
+        # starting basis makes each pivot strictly increase the rows'
+        # lexicographic values, so no basis repeats and the simplex ends.
+        reference = list(self.basis)
+        while True:
+            entering = self._entering_variable()
+            if entering is None:
+                return
+            leaving_row = self._leaving_row(entering, reference)
+            if leaving_row is None:
+                raise OptimizationError("Objective is unbounded below")
+            self._pivot(leaving_row, entering)
+
+    def drop_variables(self, variables: set[int]) -> None:
+        """Remove phase-one artificials, pivoting out any left basic at zero."""
+        for row_index in reversed(range(len(self.rows))):
+            if self.basis[row_index] not in variables:
+                continue
+            replacement = next(
+                (column for column in self.rows[row_index] if column not in variables),
+                None,
+            )
+            if replacement is None:
+                # Redundant equality; nothing else constrains this row.
+                del self.rows[row_index]
+                del self.rhs[row_index]
+                del self.basis[row_index]
+                continue
+            self._pivot(row_index, replacement)
+
+        for row in self.rows:
+            for variable in variables:
+                row.pop(variable, None)
+
+    def _entering_variable(self) -> int | None:
+        """
+        Steepest edge: the most negative reduced cost per unit column length.
+
+        Plain most-negative pricing wanders through long runs of degenerate
+        pivots on these tableaus. Lengths only steer the choice, so they are
+        floats even in an exact tableau.
+        """
+        candidates = {
+            column: float(value)
+            for column, value in self.reduced_costs.items()
+            if value < -self.tolerance
+        }
+        if not candidates:
+            return None
+        squared_lengths = dict.fromkeys(candidates, 1.0)
+        for row in self.rows:
+            for column, value in row.items():
+                if column in squared_lengths:
+                    squared_lengths[column] += (entry := float(value)) * entry
+        return max(
+            candidates,
+            key=lambda column: (
+                candidates[column] * candidates[column] / squared_lengths[column],
+                -column,
+            ),
+        )
+
+    def _leaving_row(self, entering: int, reference: list[int]) -> int | None:
+        """
+        Row with the least ratio rhs / entry, ties broken lexicographically.
+
+        Tied rows are compared by their entries in the reference columns,
+        each divided by the row's entering entry, one column at a time.
+        """
+        entries = [
+            (row_index, value)
+            for row_index, row in enumerate(self.rows)
+            if (value := row.get(entering, self.tolerance * 0)) > self.tolerance
+        ]
+        if not entries:
+            return None
+        # Dividing by an entry much smaller than the column's largest magnifies
+        # float rounding until values blow up, so such entries never pivot.
+        smallest_pivot = self.pivot_tolerance * max(value for _row, value in entries)
+        ratios = [
+            (self.rhs[row_index] / value, row_index, value)
+            for row_index, value in entries
+            if value >= smallest_pivot
+        ]
+        least = min(ratio for ratio, _row_index, _value in ratios)
+        tied = [
+            (row_index, value)
+            for ratio, row_index, value in ratios
+            if ratio - least <= self.tolerance
+        ]
+        zero = self.tolerance * 0
+        for column in reference:
+            if len(tied) == 1:
+                break
+            scaled = [
+                (self.rows[row_index].get(column, zero) / value, row_index, value)
+                for row_index, value in tied
+            ]
+            least = min(entry for entry, _row_index, _value in scaled)
+            tied = [
+                (row_index, value)
+                for entry, row_index, value in scaled
+                if entry - least <= self.tolerance
+            ]
+        return tied[0][0]
+
+    def _pivot(self, row_index: int, column: int) -> None:
+        pivot_row = self.rows[row_index]
+        pivot = pivot_row[column]
+        if pivot != 1:
+            for key in pivot_row:
+                pivot_row[key] /= pivot
+            self.rhs[row_index] /= pivot
+
+        for other_index, other in enumerate(self.rows):
+            if other_index == row_index or column not in other:
+                continue
+            factor = other[column]
+            self._subtract_scaled(other, pivot_row, factor)
+            # Rounding must not push a basic value below zero.
+            self.rhs[other_index] = max(
+                self.rhs[other_index] - factor * self.rhs[row_index],
+                self.tolerance * 0,
+            )
+
+        reduced_cost = self.reduced_costs.get(column)
+        if reduced_cost is not None:
+            self._subtract_scaled(self.reduced_costs, pivot_row, reduced_cost)
+            self.objective_value += reduced_cost * self.rhs[row_index]
+        self.basis[row_index] = column
+
+    def _subtract_scaled(
+        self,
+        target: dict[int, N],
+        source: dict[int, N],
+        factor: N,
+    ) -> None:
+        for column, value in source.items():
+            updated = target.get(column, self.tolerance * 0) - factor * value
+            if abs(updated) > self.tolerance:
+                target[column] = updated
+            else:
+                target.pop(column, None)
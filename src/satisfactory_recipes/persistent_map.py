@@ -0,0 +1,163 @@
+"""Immutable mapping whose updated copies share structure with the original."""
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import typing as ty
+
+# Each branch splits on this many bits of the key's hash.
+BRANCH_BITS = 5
+# A leaf holding more than this many keys is split into a branch.
+LEAF_SIZE = 16
+
+_BRANCH_MASK = (1 << BRANCH_BITS) - 1
+# Deeper than this the hash bits run out, so leaves just grow.
+_MAX_SHIFT = 60
+
+# Leaves are dicts and branches are tuples of child nodes. Neither is ever
+# mutated once built, which is what lets maps share them.
+type _Node = dict[ty.Any, ty.Any] | tuple[_Node, ...]
+
+
+def _build(entries: list[tuple[int, ty.Any, ty.Any]], shift: int) -> _Node:
+    if len(entries) <= LEAF_SIZE or shift > _MAX_SHIFT:
+        return {key: value for _key_hash, key, value in entries}
+    return _branch(entries, shift)
+
+
+def _branch(entries: list[tuple[int, ty.Any, ty.Any]], shift: int) -> _Node:
+    buckets: list[list[tuple[int, ty.Any, ty.Any]]] = [
+        [] for _ in range(_BRANCH_MASK + 1)
+    ]
+    for entry in entries:
+        buckets[(entry[0] >> shift) & _BRANCH_MASK].append(entry)
+    return tuple(_build(bucket, shift + BRANCH_BITS) for bucket in buckets)
+
+
+def _leaf_for(node: _Node, key_hash: int) -> dict[ty.Any, ty.Any]:
+    """The leaf under node where a key with key_hash is, or would be, stored."""
+    shift = 0
+    while isinstance(node, tuple):
+        node = node[(key_hash >> shift) & _BRANCH_MASK]
+        shift += BRANCH_BITS
+    return node
+
+
+def _with(node: _Node, key: object, value: object, key_hash: int, shift: int) -> _Node:
+    if isinstance(node, tuple):
+        index = (key_hash >> shift) & _BRANCH_MASK
+        child = _with(node[index], key, value, key_hash, shift + BRANCH_BITS)
+        return (*node[:index], child, *node[index + 1 :])
+    if key in node or len(node) < LEAF_SIZE or shift > _MAX_SHIFT:
+        leaf = dict(node)
+        leaf[key] = value
+        return leaf
+    split = _branch([(hash(key), key, value) for key, value in node.items()], shift)
+    return _with(split, key, value, key_hash, shift)
+
+
+def _without(node: _Node, key: object, key_hash: int, shift: int) -> _Node:
+    if isinstance(node, tuple):
+        index = (key_hash >> shift) & _BRANCH_MASK
+        child = _without(node[index], key, key_hash, shift + BRANCH_BITS)
+        if child is node[index]:
+            return node
+        return (*node[:index], child, *node[index + 1 :])
+    if key not in node:
+        return node
+    leaf = dict(node)
+    del leaf[key]
+    return leaf
+
+
+def _iter_leaves(node: _Node) -> cabc.Iterator[dict[ty.Any, ty.Any]]:
+    if isinstance(node, tuple):
+        for child in node:
+            yield from _iter_leaves(child)
+    else:
+        yield node
+
+
+def _changed_keys(old: _Node, new: _Node) -> cabc.Iterator[ty.Any]:
+    if old is new:
+        return
+    if isinstance(old, tuple) and isinstance(new, tuple):
+        for old_child, new_child in zip(old, new, strict=True):
+            yield from _changed_keys(old_child, new_child)
+        return
+
+    old_items = {
+        key: value for leaf in _iter_leaves(old) for key, value in leaf.items()
+    }
+    new_items = {
+        key: value for leaf in _iter_leaves(new) for key, value in leaf.items()
+    }
+    for key, value in old_items.items():
+        if key not in new_items or new_items[key] != value:
+            yield key
+    for key in new_items:
+        if key not in old_items:
+            yield key
+
+
+class PersistentMap[K, V](cabc.Mapping[K, V]):
+    """
+    Read-only mapping with cheap modified copies.
+
+    Keys live in a hash trie. set and discard copy only the path to the one
+    leaf they change, so a long run of edited versions costs little more than
+    one version, and changed_keys skips every part two versions share.
+    """
+
+    __slots__ = ("_length", "_root")
+
+    def __init__(
+        self,
+        mapping: cabc.Mapping[K, V] | cabc.Iterable[tuple[K, V]] = (),
+        /,
+    ) -> None:
+        items = dict(mapping)
+        self._root: _Node = _build(
+            [(hash(key), key, value) for key, value in items.items()], 0
+        )
+        self._length = len(items)
+
+    @classmethod
+    def _from_root(cls, root: _Node, length: int) -> PersistentMap[K, V]:
+        new = cls.__new__(cls)
+        new._root = root
+        new._length = length
+        return new
+
+    def __getitem__(self, key: K) -> V:
+        return ty.cast("V", _leaf_for(self._root, hash(key))[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in _leaf_for(self._root, hash(key))
+
+    def __iter__(self) -> cabc.Iterator[K]:
+        for leaf in _iter_leaves(self._root):
+            yield from leaf
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def set(self, key: K, value: V) -> PersistentMap[K, V]:
+        """Copy of this map with key set to value."""
+        length = self._length if key in self else self._length + 1
+        return self._from_root(_with(self._root, key, value, hash(key), 0), length)
+
+    def discard(self, key: K) -> PersistentMap[K, V]:
+        """Copy of this map without key; this map itself if key is absent."""
+        if key not in self:
+            return self
+        return self._from_root(
+            _without(self._root, key, hash(key), 0), self._length - 1
+        )
+
+    def changed_keys(self, other: PersistentMap[K, V]) -> cabc.Iterator[K]:
+        """Keys whose presence or value differs between this map and other."""
+        return _changed_keys(self._root, other._root)
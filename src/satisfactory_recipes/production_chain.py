@@ -4,6 +4,7 @@ Actual production chain logic
 
 from __future__ import annotations
 
+import collections.abc as cabc
 import dataclasses
 import fractions as fr
 import pathlib
@@ -13,16 +14,193 @@ import typing as ty
 import pydantic
 
 from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import item_counter
+from satisfactory_recipes import linear_algebra
+from satisfactory_recipes import stoichiometry
 from satisfactory_recipes import stupid_classes as sc
 
+# Recompute net rates from scratch on every read and compare them to the
+# incrementally maintained ledger. Slow; only meant for debugging and tests.
+CHECK_NET_LEDGER = False
+
+# Recipe counts whose denominators need more bits than this are flagged as
+# large. Long runs of rescaling by arbitrary fractions can get there, and
+# every operation on the chain then slows down.
+DENOMINATOR_WARNING_BITS = 64
+# round_goal_rate rounds the goal rate to a denominator no larger than this.
+SIMPLE_RATE_MAX_DENOMINATOR = 1000
+
+
+def simple_rate(
+    rate: fr.Fraction, max_denominator: int = SIMPLE_RATE_MAX_DENOMINATOR
+) -> fr.Fraction:
+    """The nearest positive rate to rate with a denominator of at most max_denominator."""
+    return max(rate.limit_denominator(max_denominator), fr.Fraction(1, max_denominator))
+
+
+class _RecipeCounter(sc.ScalableCounter[ic.Recipe]):
+    """
+    Recipe counts that keep a live ledger of net item rates.
+
+    Changing one count only touches the items of that recipe, and scaling the
+    whole counter scales the ledger, so the net never needs a full rebuild.
+    The ledger holds integers over one chain-wide denominator, so those
+    updates are integer adds; Fractions are only made when it is read.
+    """
+
+    def __init__(
+        self,
+        mapping: cabc.Mapping[ic.Recipe, fr.Fraction]
+        | cabc.Iterable[tuple[ic.Recipe, fr.Fraction]] = (),
+        /,
+        *,
+        frozen: bool = False,
+        **kwargs: fr.Fraction,
+    ) -> None:
+        self._net = item_counter.RateTotals()
+        # None means anything may have changed; see take_changed_recipes.
+        self._changed_recipes: set[ic.Recipe] | None = None
+        super().__init__(mapping, frozen=frozen, **kwargs)
+
+        # dict.update does not go through __setitem__, so build the ledger here.
+        self._net.clear()
+        for recipe, count in self.items():
+            self._adjust_net(recipe, count)
+
+    def _copy_with_ledger(self, *, frozen: bool) -> ty.Self:
+        # The ledger is already right, so copy it instead of rebuilding it.
+        copied = type(self)()
+        dict[ic.Recipe, fr.Fraction].update(copied, self)
+        copied._net = self._net.copy()
+        copied._frozen = frozen
+        return copied
+
+    def frozen_copy(self) -> ty.Self:
+        return self._copy_with_ledger(frozen=True)
+
+    def unfrozen_copy(self) -> ty.Self:
+        return self._copy_with_ledger(frozen=False)
+
+    def copy(self) -> ty.Self:
+        return self._copy_with_ledger(frozen=self._frozen)
+
+    @property
+    def net_per_min(self) -> item_counter.ItemCounter:
+        """Net rates, as a new counter. See ProductionChain.get_net_per_min."""
+        # Reading is rare next to adjusting, so shrink the ledger's
+        # denominator here to keep later adjustments on small integers.
+        self._net.reduce()
+        return self._net.to_counter()
+
+    def take_changed_recipes(self) -> set[ic.Recipe] | None:
+        """Recipes changed since the last call, or None if that is unknown."""
+        changed = self._changed_recipes
+        self._changed_recipes = set()
+        return changed
+
+    def _adjust_net(self, recipe: ic.Recipe, count_change: fr.Fraction) -> None:
+        if self._changed_recipes is not None:
+            self._changed_recipes.add(recipe)
+        if not count_change:
+            return
+        self._net.add_scaled(recipe.products_per_min, count_change)
+        self._net.add_scaled(recipe.inputs_per_min, -count_change)
+
+    def __setitem__(self, key: ic.Recipe, value: fr.Fraction) -> None:
+        previous = self.get(key, fr.Fraction(0))
+        super().__setitem__(key, value)
+        self._adjust_net(key, value - previous)
+
+    def __delitem__(self, key: ic.Recipe) -> None:
+        previous = self.get(key, fr.Fraction(0))
+        super().__delitem__(key)
+        self._adjust_net(key, -previous)
+
+    def clear(self) -> None:
+        super().clear()
+        self._net.clear()
+        self._changed_recipes = None
+
+    def pop(
+        self, key: ic.Recipe, default: object = ty.cast(object, ...)
+    ) -> fr.Fraction:
+        previous = self.get(key, fr.Fraction(0))
+        value = super().pop(key, default)
+        self._adjust_net(key, -previous)
+        return value
+
+    def popitem(self) -> tuple[ic.Recipe, fr.Fraction]:
+        key, value = super().popitem()
+        self._adjust_net(key, -value)
+        return key, value
+
+    def setdefault(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        key: ic.Recipe,
+        default: fr.Fraction = fr.Fraction(0, 1),
+    ) -> fr.Fraction:  # type: ignore
+        if key not in self:
+            self[key] = default
+        return super().setdefault(key, default)
+
+    def update(  # type: ignore[override]
+        self,
+        mapping: cabc.Mapping[ic.Recipe, fr.Fraction]
+        | cabc.Iterable[tuple[ic.Recipe, fr.Fraction]] = (),
+        /,
+        **kwargs: fr.Fraction,
+    ) -> None:
+        self._check_mutable_for_inplace()
+        if kwargs:
+            raise TypeError("Recipe counts must be keyed by Recipe, not by keyword")
+        for key, value in dict[ic.Recipe, fr.Fraction](mapping).items():
+            self[key] = value
+
+    def __imul__(self, scale: fr.Fraction) -> ty.Self:
+        self._check_mutable_for_inplace()
+        for key, value in tuple(self.items()):
+            super().__setitem__(key, value * scale)
+        self._net.scale(scale)
+        self._changed_recipes = None
+        return self
+
+    def __itruediv__(self, scale: fr.Fraction) -> ty.Self:
+        self._check_mutable_for_inplace()
+        for key, value in tuple(self.items()):
+            super().__setitem__(key, value / scale)
+        self._net.scale(1 / fr.Fraction(scale))
+        self._changed_recipes = None
+        return self
+
 
 @dataclasses.dataclass(kw_only=True, slots=True)
 class ProductionChain:
     goal: ic.Item
     recipes: sc.ScalableCounter[ic.Recipe] = dataclasses.field(
-        default_factory=sc.ScalableCounter[ic.Recipe]
+        default_factory=_RecipeCounter
     )
 
+    def __setattr__(self, name: str, value: object) -> None:
+        # Any counter handed to the chain is re-wrapped so the net ledger stays valid.
+        if name == "recipes" and not isinstance(value, _RecipeCounter):
+            value = _RecipeCounter(ty.cast(sc.ScalableCounter[ic.Recipe], value))
+        object.__setattr__(self, name, value)
+
+    def snapshot(self) -> ProductionChain:
+        """Frozen copy of this chain that later edits to it do not affect."""
+        return ProductionChain(goal=self.goal, recipes=self.recipes.frozen_copy())
+
+    def take_changed_recipes(self) -> set[ic.Recipe] | None:
+        """
+        Recipes whose counts changed since the last call, or None if unknown.
+
+        Whole-chain edits, like scaling or clearing, and reassigning recipes
+        make the answer unknown. Used to record history without a full diff.
+        """
+        recipes = self.recipes
+        assert isinstance(recipes, _RecipeCounter)
+        return recipes.take_changed_recipes()
+
     def make_pretty_str(self) -> str:
         desc = (
             "============================================\n"
@@ -76,7 +254,68 @@ class ProductionChain:
             item for item, amount in self.get_net_per_min().items() if amount != 0
         )
 
-    def get_net_per_min(self) -> sc.ScalableCounter[ic.Item]:
+    def count_denominator_bits(self, scale: fr.Fraction = fr.Fraction(1)) -> int:
+        """
+        Bit length of the largest recipe count denominator; 0 if no recipes.
+
+        With scale, of the counts as they would be after multiplying by it.
+        """
+        return max(
+            (
+                (count * scale).denominator.bit_length()
+                for count in self.recipes.values()
+            ),
+            default=0,
+        )
+
+    def has_large_denominators(self) -> bool:
+        return self.count_denominator_bits() > DENOMINATOR_WARNING_BITS
+
+    def round_goal_rate(
+        self, max_denominator: int = SIMPLE_RATE_MAX_DENOMINATOR
+    ) -> bool:
+        """
+        Scale the chain so the goal rate has a denominator of at most max_denominator.
+
+        Every count is scaled by the same factor, so the chain keeps its exact
+        proportions, but every net rate changes along with the goal rate. This
+        only shrinks the count denominators as far as they come from the goal
+        rate; see count_denominator_bits. Returns whether anything changed.
+        """
+        goal_rate = self.get_net_per_min()[self.goal]
+        if goal_rate <= 0:
+            raise ValueError(
+                f"Cannot round the goal rate; chain makes no net {self.goal.name}"
+            )
+
+        rounded_rate = simple_rate(goal_rate, max_denominator)
+        if rounded_rate == goal_rate:
+            return False
+        self.recipes *= rounded_rate / goal_rate
+        return True
+
+    def get_net_per_min(self) -> item_counter.ItemCounter:
+        recipes = self.recipes
+        assert isinstance(recipes, _RecipeCounter)
+        net = recipes.net_per_min
+        if CHECK_NET_LEDGER:
+            expected = self._compute_net_per_min()
+            if net != expected:
+                raise RuntimeError(
+                    f"Net rate ledger drifted from recomputed net rates:\n"
+                    f"ledger={dict(net)}\nexpected={dict(expected)}"
+                )
+        return net
+
+    def get_net_per_min_from_matrix(
+        self,
+        matrix: stoichiometry.StoichiometryMatrix,
+    ) -> sc.ScalableCounter[ic.Item]:
+        """Same result as get_net_per_min, evaluated with integer matrix rows."""
+        return matrix.net_per_min(self.recipes)
+
+    def _compute_net_per_min(self) -> sc.ScalableCounter[ic.Item]:
+        """Recompute net rates by walking every recipe; used to check the ledger."""
         net = sc.ScalableCounter[ic.Item]()
         for recipe, count in self.recipes.items():
             net += recipe.products_per_min * count
@@ -90,36 +329,31 @@ class ProductionChain:
 
     def get_produced_per_min(
         self, consume_byproducts: bool
-    ) -> sc.ScalableCounter[ic.Item]:
-        produced = sum(
-            (
-                recipe.products_per_min * recipe_count
-                for recipe, recipe_count in self.recipes.items()
-            ),
-            start=sc.ScalableCounter[ic.Item](),
-        )
+    ) -> item_counter.ItemCounter:
+        totals = item_counter.RateTotals()
+        for recipe, recipe_count in self.recipes.items():
+            totals.add_scaled(recipe.products_per_min, recipe_count)
+        produced = totals.to_counter()
 
         if consume_byproducts:
             consumed = self.get_consumed_per_min(consume_byproducts=False)
-            for item in produced:
-                produced[item] -= consumed[item]
+            # Only items that are produced at all are offset, all in one pass.
+            produced -= consumed.restricted_to(produced)
 
         return produced
 
     def get_consumed_per_min(
         self, consume_byproducts: bool
-    ) -> sc.ScalableCounter[ic.Item]:
-        consumed = sum(
-            (
-                recipe.inputs_per_min * recipe_count
-                for recipe, recipe_count in self.recipes.items()
-            ),
-            start=sc.ScalableCounter[ic.Item](),
-        )
+    ) -> item_counter.ItemCounter:
+        totals = item_counter.RateTotals()
+        for recipe, recipe_count in self.recipes.items():
+            totals.add_scaled(recipe.inputs_per_min, recipe_count)
+        consumed = totals.to_counter()
+
         if consume_byproducts:
             produced = self.get_produced_per_min(consume_byproducts=False)
-            for item in consumed:
-                consumed[item] -= produced[item]
+            # Only items that are consumed at all are offset, all in one pass.
+            consumed -= produced.restricted_to(consumed)
 
         return consumed
 
@@ -186,6 +420,62 @@ class ProductionChain:
 
         self.recipes *= count / current_count
 
+    def solve(
+        self,
+        goal_rate: fr.Fraction,
+        recipe_choice: cabc.Mapping[ic.Item, ic.Recipe],
+    ) -> None:
+        """
+        Replace all recipe counts by solving the item balance in one step.
+
+        recipe_choice maps every item the chain should make, including the goal,
+        to the recipe that makes it. The goal nets goal_rate per minute and every
+        other chosen item nets exactly zero; items without a chosen recipe are
+        left as raw inputs or byproducts. Cycles are solved like anything else.
+        """
+        if goal_rate <= 0:
+            raise ValueError("Goal rate must be positive")
+        if self.goal not in recipe_choice:
+            raise ValueError(f"No recipe chosen for goal item {self.goal.name}")
+
+        items = tuple(recipe_choice)
+        recipes = tuple(recipe_choice.values())
+        for item, recipe in recipe_choice.items():
+            if item not in recipe.products:
+                raise ValueError(f"Cannot use {recipe.name} to produce {item.name}")
+        if len(set(recipes)) != len(recipes):
+            raise ValueError("Each chosen item needs its own recipe")
+
+        # One equation per chosen item, one unknown count per chosen recipe.
+        item_rows = {item: row for row, item in enumerate(items)}
+        rows: list[dict[int, fr.Fraction]] = [{} for _item in items]
+        for column, recipe in enumerate(recipes):
+            net = recipe.products_per_min - recipe.inputs_per_min
+            for item, rate in net.items():
+                row = item_rows.get(item)
+                if row is not None and rate:
+                    rows[row][column] = rate
+        rhs = [goal_rate if item == self.goal else fr.Fraction(0) for item in items]
+
+        try:
+            counts = linear_algebra.solve_sparse(rows, rhs)
+        except ValueError as exc:
+            raise ValueError(
+                "Chosen recipes do not determine a unique balanced chain"
+            ) from exc
+
+        negative = [recipe.name for recipe, count in zip(recipes, counts) if count < 0]
+        if negative:
+            raise ValueError(
+                "Chosen recipes cannot balance without negative counts for: "
+                + ", ".join(sorted(negative))
+            )
+
+        self.recipes.clear()
+        self.recipes.update(
+            (recipe, count) for recipe, count in zip(recipes, counts) if count
+        )
+
     def to_saveable(self, scale: fr.Fraction) -> "_ProductionChainSavable":
         """Convert to a saveable format. It is the caller's responsibility to ensure scale is correct."""
         return _ProductionChainSavable(
@@ -201,6 +491,34 @@ class ProductionChain:
         game_data: ic.GameData,
     ) -> ty.Self:
         """Load from saved state. MUTATES game_data TO CORRECT SCALE"""
+        cls._check_saveable(saveable, game_data)
+
+        # DO THIS BEFORE converting dictionaries, so that the recipes are correct.
+        game_data.scale_recipes(saveable.recipe_input_scale / game_data.scale)
+
+        return cls._from_checked_saveable(saveable, game_data)
+
+    @classmethod
+    def from_saveable_at_scale(
+        cls,
+        saveable: _ProductionChainSavable,
+        game_data: ic.GameData,
+    ) -> tuple[ty.Self, ic.GameData]:
+        """
+        Load from saved state without modifying game_data.
+
+        Returns the chain along with the game data variant at the saved scale,
+        which its recipes come from.
+        """
+        cls._check_saveable(saveable, game_data)
+        scaled = game_data.at_scale(saveable.recipe_input_scale)
+        return cls._from_checked_saveable(saveable, scaled), scaled
+
+    @staticmethod
+    def _check_saveable(
+        saveable: _ProductionChainSavable,
+        game_data: ic.GameData,
+    ) -> None:
         if saveable.save_file_version != 1:
             raise ValueError(
                 f"Unsupported production chain save version: "
@@ -219,12 +537,15 @@ class ProductionChain:
                     f"{recipe_class_name}"
                 )
 
-        # DO THIS BEFORE converting dictionaries, so that the recipes are correct.
-        game_data.scale_recipes(saveable.recipe_input_scale / game_data.scale)
-
+    @classmethod
+    def _from_checked_saveable(
+        cls,
+        saveable: _ProductionChainSavable,
+        game_data: ic.GameData,
+    ) -> ty.Self:
         return cls(
             goal=game_data.items_d[saveable.goal_class_name],
-            recipes=sc.ScalableCounter(
+            recipes=_RecipeCounter(
                 {
                     game_data.recipes_d[recipe]: count
                     for recipe, count in saveable.recipes.items()
@@ -242,6 +563,16 @@ class ProductionChain:
         saveable = _ProductionChainSavable.model_validate_json(filename.read_text())
         return cls.from_saveable(saveable, game_data)
 
+    @classmethod
+    def load_at_scale(
+        cls,
+        filename: pathlib.Path,
+        game_data: ic.GameData,
+    ) -> tuple[ty.Self, ic.GameData]:
+        """Load from saved file without modifying game_data. See from_saveable_at_scale."""
+        saveable = _ProductionChainSavable.model_validate_json(filename.read_text())
+        return cls.from_saveable_at_scale(saveable, game_data)
+
 
 class _ProductionChainSavable(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(extra="forbid")
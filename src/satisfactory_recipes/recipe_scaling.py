@@ -0,0 +1,201 @@
+"""
+Scale the inputs of many recipes in one pass, building each Recipe on demand.
+
+Scaling every recipe one at a time makes Fractions for every input and a new
+Recipe for every recipe, even though most are never looked at. Here all
+inputs are rounded together as plain integers, and a scaled Recipe is only
+built, exactly as Recipe.create_scaled would build it, when first accessed.
+"""
+
+from __future__ import annotations
+
+import array
+import collections.abc as cabc
+import copy
+import dataclasses
+import fractions as fr
+import typing as ty
+
+from satisfactory_recipes import item_counter
+
+if ty.TYPE_CHECKING:
+    from satisfactory_recipes import info_classes as ic
+
+# Fluids round in raw units, 1000 to one displayed unit; see scale_one_input.
+FLUID_UNITS = 1000
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class InputLayout:
+    """
+    Every input of a set of recipes, flattened into parallel arrays.
+
+    The inputs of the recipe at position p in templates are entries
+    offsets[p] to offsets[p + 1]. Scaling never adds or drops an input, so
+    one layout serves every scale of the same templates.
+    """
+
+    templates: cabc.Mapping[str, ic.Recipe]
+    positions: dict[str, int]
+    offsets: array.array[int]
+    item_indices: array.array[int]
+    # Raw units per displayed unit of each input: FLUID_UNITS for fluids, else 1.
+    units: array.array[int]
+    # The templates' own input amounts, in raw units.
+    numerators: list[int]
+    denominators: list[int]
+
+    @classmethod
+    def from_recipes(cls, recipes: cabc.Mapping[str, ic.Recipe]) -> InputLayout:
+        offsets = array.array("I", [0])
+        item_indices = array.array("I")
+        units = array.array("I")
+        numerators: list[int] = []
+        denominators: list[int] = []
+        for recipe in recipes.values():
+            for item, amount in recipe.inputs.items():
+                unit = FLUID_UNITS if item.is_fluid else 1
+                raw_amount = amount * unit
+                item_indices.append(item_counter.ITEM_TABLE.index(item))
+                units.append(unit)
+                numerators.append(raw_amount.numerator)
+                denominators.append(raw_amount.denominator)
+            offsets.append(len(numerators))
+        return cls(
+            templates=recipes,
+            positions={name: position for position, name in enumerate(recipes)},
+            offsets=offsets,
+            item_indices=item_indices,
+            units=units,
+            numerators=numerators,
+            denominators=denominators,
+        )
+
+
+def round_scaled_inputs(
+    numerators: cabc.Sequence[int],
+    denominators: cabc.Sequence[int] | None,
+    factor: fr.Fraction,
+) -> list[int]:
+    """
+    Scale raw amounts by factor, rounding half up to at least 1, all at once.
+
+    Same result as Recipe.scale_one_input on each amount, in integers. Without
+    denominators every amount is a whole number of raw units.
+    """
+    factor_numerator = factor.numerator
+    factor_denominator = factor.denominator
+    # round_half_up(p / q) == (2p + q) // 2q for positive q.
+    if denominators is None:
+        twice_denominator = 2 * factor_denominator
+        return [
+            max(
+                (2 * numerator * factor_numerator + factor_denominator)
+                // twice_denominator,
+                1,
+            )
+            for numerator in numerators
+        ]
+    return [
+        max(
+            (2 * numerator * factor_numerator + denominator * factor_denominator)
+            // (2 * denominator * factor_denominator),
+            1,
+        )
+        for numerator, denominator in zip(numerators, denominators, strict=True)
+    ]
+
+
+class ScaledRecipes(cabc.Mapping[str, "ic.Recipe"]):
+    """
+    Read-only recipes by class name, with inputs scaled from a layout's templates.
+
+    All scaled amounts are computed up front; each Recipe is built on first
+    access and then kept. Built recipes are interned, so they are the very
+    objects create_scaled would return.
+    """
+
+    __slots__ = ("_built", "_layout", "_raw_amounts", "_scale")
+
+    def __init__(self, layout: InputLayout, factor: fr.Fraction) -> None:
+        self._set(
+            layout,
+            round_scaled_inputs(layout.numerators, layout.denominators, factor),
+            fr.Fraction(factor),
+        )
+
+    def _set(
+        self,
+        layout: InputLayout,
+        raw_amounts: list[int],
+        scale: fr.Fraction,
+    ) -> None:
+        self._layout = layout
+        self._raw_amounts = raw_amounts
+        # Relative to the templates, which may themselves be scaled.
+        self._scale = scale
+        self._built: dict[str, ic.Recipe] = {}
+
+    @property
+    def templates(self) -> cabc.Mapping[str, ic.Recipe]:
+        """The recipes these were scaled from, with the same names and items."""
+        return self._layout.templates
+
+    def rescaled(self, factor: fr.Fraction) -> ScaledRecipes:
+        """These recipes scaled by factor, rounding from their current inputs."""
+        rescaled = ScaledRecipes.__new__(ScaledRecipes)
+        rescaled._set(
+            self._layout,
+            round_scaled_inputs(self._raw_amounts, None, factor),
+            self._scale * factor,
+        )
+        return rescaled
+
+    def __getitem__(self, name: str) -> ic.Recipe:
+        recipe = self._built.get(name)
+        if recipe is None:
+            # Racing builds produce the same interned recipe.
+            recipe = self._built.setdefault(name, self._build(name))
+        return recipe
+
+    def _build(self, name: str) -> ic.Recipe:
+        layout = self._layout
+        template = layout.templates[name]
+        position = layout.positions[name]
+        start = layout.offsets[position]
+        end = layout.offsets[position + 1]
+
+        units = layout.units[start:end]
+        denominator = max(units, default=1)
+        inputs = item_counter.ItemCounter.from_numerators(
+            layout.item_indices[start:end],
+            (
+                raw_amount * (denominator // unit)
+                for raw_amount, unit in zip(
+                    self._raw_amounts[start:end], units, strict=True
+                )
+            ),
+            denominator,
+            frozen=True,
+        )
+        return copy.replace(
+            template,
+            inputs=inputs,
+            inputs_per_min=(inputs / fr.Fraction(template.craft_time, 60)).freeze(),
+            scale=template.scale * self._scale,
+        )
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._layout.positions
+
+    def __iter__(self) -> cabc.Iterator[str]:
+        return iter(self._layout.templates)
+
+    def __len__(self) -> int:
+        return len(self._layout.templates)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({len(self)} recipes, "
+            f"{len(self._built)} built, scale={self._scale})"
+        )
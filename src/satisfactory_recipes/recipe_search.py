@@ -0,0 +1,99 @@
+"""Search recipes by name or by what they use, make, or are made in."""
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import enum
+
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import search
+
+
+class RecipeField(enum.StrEnum):
+    """Recipe contents that can be searched with a "<field>: <name>" query."""
+
+    USES = enum.auto()
+    MAKES = enum.auto()
+    IN = enum.auto()
+
+
+def parse_recipe_query(entry: str) -> tuple[RecipeField | None, str]:
+    """
+    Split entry into the field it searches and the name to look for.
+
+    Queries without a known field prefix, such as "Alternate: Iron Rod",
+    search recipe names and are returned whole.
+    """
+    prefix, separator, name = entry.partition(":")
+    if separator:
+        try:
+            return RecipeField(prefix.strip().lower()), name.strip()
+        except ValueError:
+            pass
+    return None, entry
+
+
+def recipe_field_names(recipe: ic.Recipe, field: RecipeField) -> list[str]:
+    match field:
+        case RecipeField.USES:
+            return [item.name for item in recipe.inputs]
+        case RecipeField.MAKES:
+            return [item.name for item in recipe.products]
+        case RecipeField.IN:
+            return [] if recipe.produced_in is None else [recipe.produced_in.name]
+
+
+class RecipeSearchIndex[T]:
+    """
+    Inverted index from the names in each RecipeField to the options using them.
+
+    Plain queries rank options by recipe name, like search.SearchIndex. Field
+    queries rank the names in that field with the same scoring, keep those
+    matching the whole query, and return their options in that order.
+    """
+
+    def __init__(
+        self,
+        options: cabc.Iterable[T],
+        *,
+        recipe: cabc.Callable[[T], ic.Recipe],
+    ) -> None:
+        self._options = tuple(options)
+        self._name_index = search.SearchIndex(
+            self._options,
+            label=lambda option: recipe(option).name,
+        )
+
+        self._options_by_name: dict[RecipeField, dict[str, list[T]]] = {
+            field: {} for field in RecipeField
+        }
+        for option in self._options:
+            for field, options_by_name in self._options_by_name.items():
+                for name in dict.fromkeys(recipe_field_names(recipe(option), field)):
+                    options_by_name.setdefault(name, []).append(option)
+
+        self._field_indexes = {
+            field: search.SearchIndex(options_by_name, label=str)
+            for field, options_by_name in self._options_by_name.items()
+        }
+
+    def best_matches(
+        self,
+        entry: str,
+        *,
+        limit: int = search.FUZZY_RESULT_LIMIT,
+    ) -> list[T]:
+        field, name = parse_recipe_query(entry)
+        if field is None:
+            return self._name_index.best_matches(entry, limit=limit)
+        return self.search_field(field, name)[:limit]
+
+    def search_field(self, field: RecipeField, name: str) -> list[T]:
+        """Options whose field has a name matching all of name, best match first."""
+        matches: dict[int, T] = {}
+        for matched_name in self._field_indexes[field].search(name):
+            if search.match_score(matched_name, name) < len(name):
+                continue
+            for option in self._options_by_name[field][matched_name]:
+                matches.setdefault(id(option), option)
+        return list(matches.values())
@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
+import collections
 import collections.abc as cabc
+import dataclasses
+import heapq
+import typing as ty
+
+FUZZY_RESULT_LIMIT = 50
+MAX_EDIT_DISTANCE = 3
+NGRAM_SIZE = 3
+
+
+class Searcher[T](ty.Protocol):
+    """Anything that can rank its options against a query, like SearchIndex."""
+
+    def best_matches(self, entry: str, *, limit: int = ...) -> list[T]: ...
 
 
 def match_score(target: str, key: str) -> int:
@@ -23,22 +37,275 @@ def match_score(target: str, key: str) -> int:
     return max(scores)
 
 
-def _sort_key(option: str, entry: str) -> tuple[bool, bool, int, str]:
-    return (
-        not (option.lower() == entry.lower()),
-        not option.lower().startswith(entry.lower()),
-        -match_score(option, entry),
-        option,
-    )
+def _common_prefix_length(text: str, start: int, key: str) -> int:
+    if text.startswith(key, start):
+        return len(key)
+    length = 0
+    for c1, c2 in zip(text[start : start + len(key)], key):
+        if c1 != c2:
+            break
+        length += 1
+    return length
+
+
+def max_edit_distance(key: str) -> int:
+    """How many typos a fuzzy query of this length may contain."""
+    return min(MAX_EDIT_DISTANCE, len(key) // 4)
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[start : start + NGRAM_SIZE] for start in range(len(text) - 2)}
+
+
+def _prefix_edit_distance(text: str, key: str, bound: int) -> int:
+    """
+    Levenshtein distance from key to the closest prefix of text.
+
+    Returns bound + 1 if that is more than bound. Only alignments within bound
+    of the diagonal are computed, since the others already cost too much.
+    """
+    segment = text[: len(key) + bound]
+    too_far = bound + 1
+    previous = [min(column, too_far) for column in range(len(segment) + 1)]
+    for row, key_char in enumerate(key, start=1):
+        current = [too_far] * (len(segment) + 1)
+        if row <= bound:
+            current[0] = row
+        for column in range(max(1, row - bound), min(len(segment), row + bound) + 1):
+            cost = previous[column - 1] + (key_char != segment[column - 1])
+            if previous[column] < cost:
+                cost = previous[column] + 1
+            if current[column - 1] < cost:
+                cost = current[column - 1] + 1
+            current[column] = cost
+        if min(current) > bound:
+            return too_far
+        previous = current
+    return min(min(previous), too_far)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _IndexedLabel:
+    label: str
+    lowered: str
+    # match_score compares key against the label itself and then against the
+    # whitespace-normalized suffix starting at each later word.
+    normalized: str
+    word_starts: tuple[int, ...]
+
+    @classmethod
+    def from_label(cls, label: str) -> _IndexedLabel:
+        lowered = label.lower()
+        words = lowered.split()
+        word_starts: list[int] = []
+        offset = 0
+        for word in words[:-1]:
+            offset += len(word) + 1
+            word_starts.append(offset)
+        return cls(
+            label=label,
+            lowered=lowered,
+            normalized=" ".join(words),
+            word_starts=tuple(word_starts),
+        )
+
+    @property
+    def initials(self) -> set[str]:
+        initials = {self.normalized[start] for start in self.word_starts}
+        if self.lowered:
+            initials.add(self.lowered[0])
+        return initials
+
+    def score(self, key: str) -> int:
+        """match_score(self.label, key) for an already lowercased key."""
+        best = _common_prefix_length(self.lowered, 0, key)
+        for start in self.word_starts:
+            if best == len(key):
+                break
+            best = max(best, _common_prefix_length(self.normalized, start, key))
+        return best
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _FuzzyKey:
+    text: str
+    max_edits: int
+    ngrams: set[str]
+    # Each edit breaks at most NGRAM_SIZE of the key's n-grams, so a text
+    # sharing fewer than this many cannot be within max_edits.
+    min_shared_ngrams: int
+
+    @classmethod
+    def from_key(cls, key: str) -> _FuzzyKey:
+        max_edits = max_edit_distance(key)
+        ngrams = _ngrams(key)
+        return cls(
+            text=key,
+            max_edits=max_edits,
+            ngrams=ngrams,
+            min_shared_ngrams=max(1, len(ngrams) - NGRAM_SIZE * max_edits),
+        )
+
+    def distance(self, indexed: _IndexedLabel) -> int:
+        """
+        Fewest edits making the key a prefix of a string that score compares.
+
+        Returns max_edits + 1 if that takes more than max_edits edits.
+        """
+        best = self.max_edits + 1
+        starts = [(indexed.lowered, 0)]
+        starts.extend((indexed.normalized, start) for start in indexed.word_starts)
+        for text, start in starts:
+            segment = text[start : start + len(self.text) + self.max_edits]
+            if len(self.ngrams & _ngrams(segment)) < self.min_shared_ngrams:
+                continue
+            best = min(best, _prefix_edit_distance(segment, self.text, best - 1))
+            if not best:
+                break
+        return best
+
+
+class SearchIndex[T]:
+    """
+    Options preprocessed once, so each query only ranks plausible matches.
+
+    Ranks exactly like sort_objects. An option matches a query iff one of its
+    words starts with the query's first character, so candidates are looked
+    up by that character, and a query extending the last one narrows its
+    ranking instead; see search.
+    """
+
+    def __init__(
+        self,
+        options: cabc.Iterable[T],
+        *,
+        label: cabc.Callable[[T], str],
+    ) -> None:
+        self._options = tuple(options)
+        self._labels = tuple(
+            _IndexedLabel.from_label(label(option)) for option in self._options
+        )
+        self._by_initial: dict[str, list[int]] = {}
+        for index, indexed in enumerate(self._labels):
+            for initial in indexed.initials:
+                self._by_initial.setdefault(initial, []).append(index)
+
+        # Only fuzzy queries need this, so it is built on first use.
+        self._by_ngram: dict[str, list[int]] | None = None
+
+        # The last query, its ranking and how many of those matched all of it.
+        self._last_key = ""
+        self._last_ranked: list[int] = []
+        self._last_full_matches = 0
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def search(self, entry: str) -> list[T]:
+        """
+        Options matching entry, best match first.
+
+        When entry extends the last query, only the options that matched all of
+        the last query are ranked again. The others score the same against
+        entry as before, and still rank after those, in the same order.
+        """
+        key = entry.lower()
+        last_key = self._last_key
+        if key != last_key or not last_key:
+            if last_key and key.startswith(last_key):
+                candidates = self._last_ranked[: self._last_full_matches]
+                rest = self._last_ranked[self._last_full_matches :]
+            else:
+                candidates = self._by_initial.get(key[:1], [])
+                rest = []
+            sort_keys = {
+                index: self._sort_key(self._labels[index], key) for index in candidates
+            }
+            # Ties keep option order, as sorted() over all options would.
+            ranked = sorted(candidates, key=lambda index: (sort_keys[index], index))
+            self._last_full_matches = sum(
+                -sort_key[2] == len(key) for sort_key in sort_keys.values()
+            )
+            self._last_key = key
+            self._last_ranked = ranked + rest
+
+        return [self._options[index] for index in self._last_ranked]
+
+    def best_matches(
+        self,
+        entry: str,
+        *,
+        limit: int = FUZZY_RESULT_LIMIT,
+    ) -> list[T]:
+        """
+        Up to limit options closest to entry, tolerating a few typos.
+
+        Options within max_edit_distance(entry) edits of matching come first,
+        fewest edits first and then ranked as by search. Any remaining options
+        search would return follow. Only the returned options are sorted.
+        """
+        key = entry.lower()
+        if not key or limit <= 0:
+            return []
+
+        prefix_candidates = self._by_initial.get(key[0], [])
+        distances = {
+            index: 0
+            for index in prefix_candidates
+            if self._labels[index].score(key) == len(key)
+        }
+
+        fuzzy_key = _FuzzyKey.from_key(key)
+        if len(distances) < limit and fuzzy_key.max_edits:
+            shared_counts = self._count_shared_ngrams(fuzzy_key.ngrams)
+            for index, shared in shared_counts.items():
+                if shared < fuzzy_key.min_shared_ngrams or index in distances:
+                    continue
+                distance = fuzzy_key.distance(self._labels[index])
+                if distance <= fuzzy_key.max_edits:
+                    distances[index] = distance
+
+        for index in prefix_candidates:
+            distances.setdefault(index, fuzzy_key.max_edits + 1)
+
+        return [
+            self._options[index]
+            for index in heapq.nsmallest(
+                limit,
+                distances,
+                key=lambda index: (
+                    distances[index],
+                    self._sort_key(self._labels[index], key),
+                    index,
+                ),
+            )
+        ]
+
+    def _count_shared_ngrams(self, key_ngrams: set[str]) -> collections.Counter[int]:
+        if self._by_ngram is None:
+            self._by_ngram = {}
+            for index, indexed in enumerate(self._labels):
+                for ngram in _ngrams(indexed.normalized):
+                    self._by_ngram.setdefault(ngram, []).append(index)
+
+        shared: collections.Counter[int] = collections.Counter()
+        for ngram in key_ngrams:
+            shared.update(self._by_ngram.get(ngram, ()))
+        return shared
+
+    @staticmethod
+    def _sort_key(indexed: _IndexedLabel, key: str) -> tuple[bool, bool, int, str]:
+        return (
+            indexed.lowered != key,
+            not indexed.lowered.startswith(key),
+            -indexed.score(key),
+            indexed.label,
+        )
 
 
 def sort_options(options: cabc.Iterable[str], entry: str) -> list[str]:
     """Sort options by how well they match entry."""
-    return [
-        option
-        for option in sorted(options, key=lambda option: _sort_key(option, entry))
-        if match_score(option, entry)
-    ]
+    return SearchIndex(options, label=str).search(entry)
 
 
 def sort_objects[T](
@@ -48,11 +315,4 @@ def sort_objects[T](
     label: cabc.Callable[[T], str],
 ) -> list[T]:
     """Sort arbitrary objects using their display labels without losing identity."""
-    return [
-        option
-        for option in sorted(
-            options,
-            key=lambda option: _sort_key(label(option), entry),
-        )
-        if match_score(label(option), entry)
-    ]
+    return SearchIndex(options, label=label).search(entry)
@@ -0,0 +1,155 @@
+"""
+Integer recipe x item rate matrix for bulk net-rate questions.
+
+Each recipe row stores its per-minute rates as integer numerators over one
+per-recipe denominator, so evaluating many recipe counts is integer
+multiply-adds with a single Fraction built per item at the end.
+"""
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import dataclasses
+import fractions as fr
+import math
+
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import stupid_classes as sc
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class StoichiometryMatrix:
+    """Sparse recipe x item net rate matrix with index tables for both axes."""
+
+    items: tuple[ic.Item, ...]
+    recipes: tuple[ic.Recipe, ...]
+    item_index: dict[ic.Item, int]
+    recipe_index: dict[str, int]  # keyed by recipe class name
+    row_items: tuple[tuple[int, ...], ...]
+    row_numerators: tuple[tuple[int, ...], ...]
+    row_denominators: tuple[int, ...]
+    column_recipes: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def from_recipes(
+        cls,
+        recipes: cabc.Iterable[ic.Recipe],
+        items: cabc.Iterable[ic.Item] = (),
+    ) -> StoichiometryMatrix:
+        recipes = tuple(recipes)
+        all_items = set(items)
+        for recipe in recipes:
+            all_items.update(recipe.products_per_min)
+            all_items.update(recipe.inputs_per_min)
+        ordered_items = tuple(sorted(all_items, key=lambda item: item.class_name))
+        item_index = {item: index for index, item in enumerate(ordered_items)}
+
+        row_items: list[tuple[int, ...]] = []
+        row_numerators: list[tuple[int, ...]] = []
+        row_denominators: list[int] = []
+        column_recipes: list[list[int]] = [[] for _item in ordered_items]
+        for recipe_index, recipe in enumerate(recipes):
+            net = recipe.products_per_min - recipe.inputs_per_min
+            rates = sorted(
+                (item_index[item], rate) for item, rate in net.items() if rate
+            )
+            denominator = math.lcm(*(rate.denominator for _index, rate in rates))
+            row_items.append(tuple(index for index, _rate in rates))
+            row_numerators.append(
+                tuple(
+                    rate.numerator * (denominator // rate.denominator)
+                    for _index, rate in rates
+                )
+            )
+            row_denominators.append(denominator)
+            for index, _rate in rates:
+                column_recipes[index].append(recipe_index)
+
+        return cls(
+            items=ordered_items,
+            recipes=recipes,
+            item_index=item_index,
+            recipe_index={
+                recipe.class_name: index for index, recipe in enumerate(recipes)
+            },
+            row_items=tuple(row_items),
+            row_numerators=tuple(row_numerators),
+            row_denominators=tuple(row_denominators),
+            column_recipes=tuple(tuple(column) for column in column_recipes),
+        )
+
+    @classmethod
+    def from_game_data(cls, game_data: ic.GameData) -> StoichiometryMatrix:
+        return cls.from_recipes(
+            game_data.recipes_d.values(),
+            items=game_data.items_d.values(),
+        )
+
+    def recipes_touching(self, item: ic.Item) -> tuple[ic.Recipe, ...]:
+        """Recipes that produce or consume item on net."""
+        index = self.item_index.get(item)
+        if index is None:
+            return ()
+        return tuple(self.recipes[recipe] for recipe in self.column_recipes[index])
+
+    def counts_vector(
+        self,
+        recipe_counts: cabc.Mapping[ic.Recipe, fr.Fraction],
+    ) -> list[fr.Fraction]:
+        """Lay out recipe counts along the recipe axis of this matrix."""
+        counts = [fr.Fraction(0)] * len(self.recipes)
+        for recipe, count in recipe_counts.items():
+            index = self.recipe_index.get(recipe.class_name)
+            if index is None:
+                raise ValueError(
+                    f"Recipe is not in stoichiometry matrix: {recipe.name}"
+                )
+            indexed_recipe = self.recipes[index]
+            if indexed_recipe is not recipe and indexed_recipe != recipe:
+                raise ValueError(
+                    f"Recipe {recipe.name} differs from the matrix version; "
+                    "was the game data rescaled?"
+                )
+            counts[index] = count
+        return counts
+
+    def net_rates(
+        self,
+        counts_vector: cabc.Sequence[fr.Fraction],
+    ) -> list[fr.Fraction]:
+        """Net per-minute rate of every item for the given recipe counts."""
+        if len(counts_vector) != len(self.recipes):
+            raise ValueError(
+                f"Expected {len(self.recipes)} recipe counts, got {len(counts_vector)}"
+            )
+
+        used = [
+            (index, fr.Fraction(count))
+            for index, count in enumerate(counts_vector)
+            if count
+        ]
+        common = math.lcm(
+            *(count.denominator * self.row_denominators[index] for index, count in used)
+        )
+        totals = [0] * len(self.items)
+        for index, count in used:
+            factor = count.numerator * (
+                common // (count.denominator * self.row_denominators[index])
+            )
+            for item_index, numerator in zip(
+                self.row_items[index],
+                self.row_numerators[index],
+            ):
+                totals[item_index] += factor * numerator
+
+        return [fr.Fraction(total, common) for total in totals]
+
+    def net_per_min(
+        self,
+        recipe_counts: cabc.Mapping[ic.Recipe, fr.Fraction],
+    ) -> sc.ScalableCounter[ic.Item]:
+        """Net rates keyed by item, omitting zeros like ProductionChain does."""
+        rates = self.net_rates(self.counts_vector(recipe_counts))
+        return sc.ScalableCounter[ic.Item](
+            (self.items[index], rate) for index, rate in enumerate(rates) if rate
+        )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import collections
 import collections.abc as cabc
 import fractions
+import functools
 import typing as ty
 
 
@@ -88,6 +89,14 @@ class ScalableCounter[T](collections.defaultdict[T, fractions.Fraction]):
     def __copy__(self) -> ty.Self:
         return self.copy()
 
+    def __reduce__(self) -> tuple[ty.Any, ...]:
+        # defaultdict pickles its default factory as the first positional
+        # argument, which __init__ would take as the mapping.
+        return (
+            functools.partial(type(self), frozen=self._frozen),
+            (dict(self),),
+        )
+
     def __setattr__(self, name: str, value: object) -> None:
         if getattr(self, "_frozen", False) and name != "_hash":
             raise TypeError(f"Called __setattr__ from frozen {type(self).__name__}")
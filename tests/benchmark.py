@@ -0,0 +1,251 @@
+"""
+Benchmarks for load and refresh hot paths on generated docs files.
+
+Run from the repository root, e.g.:
+
+    python -m tests.benchmark --recipes 1000 10000 --output bench.json
+
+Results are JSON, so runs on different commits can be diffed or plotted.
+"""
+
+import argparse
+import collections.abc as cabc
+import dataclasses
+import datetime
+import fractions as fr
+import json
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from satisfactory_recipes import docs_parser
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import optimizer
+from satisfactory_recipes import production_chain as pc
+from satisfactory_recipes import search
+from satisfactory_recipes import stupid_classes as sc
+from satisfactory_recipes.gui import view_state
+from tests import synthetic_docs
+
+SEARCH_QUERIES = ("synthetic part 1", "part", "ore 3", "zzz")
+FUZZY_QUERIES = ("synthetc part 12", "sythnetic ore", "prat 7", "zzzzzzzz")
+
+# Synthetic cycles pull nearly every recipe into each goal's linear program,
+# and the dense simplex tableau takes minutes past the game's own size.
+OPTIMIZE_MAX_RECIPES = 300
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class BenchmarkResult:
+    name: str
+    recipe_count: int
+    repeats: int
+    best_seconds: float
+    median_seconds: float
+    mean_seconds: float
+
+
+def _time(
+    name: str,
+    function: cabc.Callable[[], object],
+    *,
+    recipe_count: int,
+    repeats: int,
+) -> BenchmarkResult:
+    timings: list[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return BenchmarkResult(
+        name=name,
+        recipe_count=recipe_count,
+        repeats=repeats,
+        best_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        mean_seconds=statistics.fmean(timings),
+    )
+
+
+def _make_chain(game_data: ic.GameData) -> pc.ProductionChain:
+    """A chain using every loaded recipe, the worst case for refreshes."""
+    recipes = sorted(game_data.recipes_d.values(), key=lambda recipe: recipe.class_name)
+    return pc.ProductionChain(
+        goal=next(iter(recipes[0].products)),
+        recipes=sc.ScalableCounter[ic.Recipe](
+            (recipe, fr.Fraction(index % 7 + 1, index % 3 + 1))
+            for index, recipe in enumerate(recipes)
+        ),
+    )
+
+
+def run_benchmarks(
+    spec: synthetic_docs.SyntheticDocsSpec,
+    *,
+    repeats: int,
+    work_dir: pathlib.Path,
+) -> list[BenchmarkResult]:
+    docs_path = synthetic_docs.write_docs(
+        work_dir / f"en-US-{spec.recipe_count}.json", spec
+    )
+    results = [
+        _time(
+            "parse_game_data",
+            lambda: docs_parser.parse_game_data(docs_path),
+            recipe_count=spec.recipe_count,
+            repeats=repeats,
+        )
+    ]
+
+    game_data = docs_parser.load_game_data(docs_path)
+    scales = iter(
+        [fr.Fraction(1, 2), fr.Fraction(2)] * repeats
+    )  # Alternate so recipes stay near their original amounts.
+    results.append(
+        _time(
+            "GameData.scale_recipes",
+            lambda: game_data.scale_recipes(next(scales)),
+            recipe_count=spec.recipe_count,
+            repeats=repeats,
+        )
+    )
+
+    chain = _make_chain(game_data)
+    results.append(
+        _time(
+            "ProductionChain.get_net_per_min",
+            chain.get_net_per_min,
+            recipe_count=spec.recipe_count,
+            repeats=repeats,
+        )
+    )
+
+    items = list(game_data.items_d.values())
+    results.append(
+        _time(
+            "search.sort_objects",
+            lambda: [
+                search.sort_objects(items, query, label=lambda item: item.name)
+                for query in SEARCH_QUERIES
+            ],
+            recipe_count=spec.recipe_count,
+            repeats=repeats,
+        )
+    )
+    item_index = search.SearchIndex(items, label=lambda item: item.name)
+    results.append(
+        _time(
+            "SearchIndex.search",
+            lambda: [item_index.search(query) for query in SEARCH_QUERIES],
+            recipe_count=spec.recipe_count,
+            repeats=repeats,
+        )
+    )
+    results.append(
+        _time(
+            "SearchIndex.best_matches",
+            lambda: [item_index.best_matches(query) for query in FUZZY_QUERIES],
+            recipe_count=spec.recipe_count,
+            repeats=repeats,
+        )
+    )
+
+    results.append(
+        _time(
+            "build_main_window_view_state",
+            lambda: view_state.build_main_window_view_state(
+                chain=chain,
+                game_data=game_data,
+                filename=None,
+                has_unsaved_changes=False,
+            ),
+            recipe_count=spec.recipe_count,
+            repeats=repeats,
+        )
+    )
+
+    if spec.recipe_count <= OPTIMIZE_MAX_RECIPES:
+        goal = min(game_data.producible_items, key=lambda item: item.class_name)
+        results.append(
+            _time(
+                "optimize_chain",
+                lambda: optimizer.optimize_chain(game_data, goal, fr.Fraction(10)),
+                recipe_count=spec.recipe_count,
+                repeats=repeats,
+            )
+        )
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+    except OSError:
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip()
+
+
+def make_report(results: cabc.Iterable[BenchmarkResult]) -> dict[str, object]:
+    return {
+        "commit": _git_commit(),
+        "created": datetime.datetime.now(datetime.UTC).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": [dataclasses.asdict(result) for result in results],
+    }
+
+
+def main(argv: cabc.Sequence[str] | None = None) -> None:
+    # Docstrings are stripped under python -OO.
+    description = __doc__.splitlines()[1] if __doc__ is not None else None
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--recipes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000],
+        help="Recipe counts to generate docs files for",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        type=pathlib.Path,
+        help="Write JSON results here instead of stdout",
+    )
+    args = parser.parse_args(argv)
+
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for recipe_count in args.recipes:
+            results.extend(
+                run_benchmarks(
+                    synthetic_docs.SyntheticDocsSpec(
+                        recipe_count=recipe_count,
+                        seed=args.seed,
+                    ),
+                    repeats=args.repeats,
+                    work_dir=pathlib.Path(work_dir),
+                )
+            )
+
+    report = json.dumps(make_report(results), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        args.output.write_text(report)
+
+
+if __name__ == "__main__":
+    main()
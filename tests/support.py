@@ -3,7 +3,7 @@ import json
 import pathlib
 
 from satisfactory_recipes import info_classes as ic
-from satisfactory_recipes import stupid_classes as sc
+from satisfactory_recipes import item_counter
 
 
 def make_fake_item(
@@ -54,16 +54,16 @@ def make_fake_recipe(
         class_name=class_name,
         source_native_class="test.recipe",
         name=name,
-        inputs=sc.ScalableCounter[ic.Item](inputs, frozen=True),
-        inputs_per_min=sc.ScalableCounter[ic.Item](
+        inputs=item_counter.ItemCounter(inputs, frozen=True),
+        inputs_per_min=item_counter.ItemCounter(
             {
                 item: amount * fr.Fraction(60) / craft_time
                 for item, amount in inputs.items()
             },
             frozen=True,
         ),
-        products=sc.ScalableCounter[ic.Item](products, frozen=True),
-        products_per_min=sc.ScalableCounter[ic.Item](
+        products=item_counter.ItemCounter(products, frozen=True),
+        products_per_min=item_counter.ItemCounter(
             {
                 item: amount * fr.Fraction(60) / craft_time
                 for item, amount in products.items()
@@ -0,0 +1,241 @@
+"""Deterministic generator for large docs files in the real Satisfactory shape."""
+
+import dataclasses
+import json
+import pathlib
+import random
+
+from satisfactory_recipes import docs_parser
+from satisfactory_recipes import info_classes as ic
+
+RESOURCE_NATIVE_CLASS = next(
+    native_class
+    for native_class, kind in docs_parser.ITEM_KINDS_BY_NATIVE_CLASS.items()
+    if kind is ic.ItemKind.RESOURCE
+)
+STANDARD_NATIVE_CLASS = next(
+    native_class
+    for native_class, kind in docs_parser.ITEM_KINDS_BY_NATIVE_CLASS.items()
+    if kind is ic.ItemKind.STANDARD
+)
+UNUSED_NATIVE_CLASS_PREFIX = "/Script/CoreUObject.Class'/Script/FactoryGame.FGSynthetic"
+
+FIXED_BUILDINGS = ("Constructor", "Assembler", "Manufacturer", "Refinery")
+VARIABLE_BUILDINGS = ("ParticleAccelerator", "Converter")
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class SyntheticDocsSpec:
+    """Shape of a generated docs file. The same spec always yields the same file."""
+
+    recipe_count: int = 1000
+    recipes_per_item: int = 3
+    resource_count: int = 20
+    max_ingredients: int = 4
+    # Ingredients come from the next ingredient_window items, so chains run
+    # roughly recipe_count / (recipes_per_item * ingredient_window) deep.
+    ingredient_window: int = 40
+    # Fraction of recipes that also use an earlier item, closing a cycle.
+    cycle_fraction: float = 0.05
+    fluid_fraction: float = 0.1
+    handcraft_fraction: float = 0.05
+    unused_section_count: int = 20
+    unused_records_per_section: int = 50
+    seed: int = 0
+
+    @property
+    def item_count(self) -> int:
+        return max(1, self.recipe_count // self.recipes_per_item)
+
+
+def _item_class(index: int) -> str:
+    return f"Desc_Synthetic{index}_C"
+
+
+def _resource_class(index: int) -> str:
+    return f"Desc_SyntheticOre{index}_C"
+
+
+def _class_path(class_name: str, folder: str) -> str:
+    stem = class_name.removesuffix("_C")
+    return f"/Game/FactoryGame/{folder}/{stem}/{stem}.{class_name}"
+
+
+def _item_amounts(amounts: dict[str, int]) -> str:
+    parts = (
+        "(ItemClass=/Script/Engine.BlueprintGeneratedClass'"
+        f'"{_class_path(class_name, "Resource/Parts")}"\',Amount={amount})'
+        for class_name, amount in amounts.items()
+    )
+    return f"({','.join(parts)})"
+
+
+def _item_record(class_name: str, *, display_name: str, form: str) -> dict[str, str]:
+    return {
+        "ClassName": class_name,
+        "mDisplayName": display_name,
+        "mDescription": f"Synthetic item {display_name} used for benchmarks.",
+        "mForm": form,
+        "mStackSize": "SS_HUGE",
+        "mCachedStackSize": "500" if form == "RF_SOLID" else "0",
+        "mResourceSinkPoints": "12",
+        "mEnergyValue": "0.000000",
+    }
+
+
+def _building_record(class_name: str, *, variable: bool) -> dict[str, str]:
+    record = {
+        "ClassName": class_name,
+        "mDisplayName": class_name.removeprefix("Build_").removesuffix("_C"),
+        "mDescription": "Synthetic building.",
+        "mPowerConsumption": "0.000000" if variable else "15.000000",
+        "mPowerConsumptionExponent": "1.321929",
+    }
+    if variable:
+        record["mEstimatedMininumPowerConsumption"] = "250.000000"
+        record["mEstimatedMaximumPowerConsumption"] = "750.000000"
+    return record
+
+
+def make_docs_sections(spec: SyntheticDocsSpec) -> list[dict[str, object]]:
+    """Build the docs JSON value for spec, as parsed from en-US.json."""
+    rng = random.Random(spec.seed)
+    item_count = spec.item_count
+    fluids = {
+        index for index in range(item_count) if rng.random() < spec.fluid_fraction
+    }
+
+    resources = [
+        _item_record(
+            _resource_class(index),
+            display_name=f"Synthetic Ore {index}",
+            form="RF_LIQUID" if index % 5 == 4 else "RF_SOLID",
+        )
+        for index in range(spec.resource_count)
+    ]
+    items = [
+        _item_record(
+            _item_class(index),
+            display_name=f"Synthetic Part {index}",
+            form="RF_LIQUID" if index in fluids else "RF_SOLID",
+        )
+        for index in range(item_count)
+    ]
+    fixed_buildings = [f"Build_{name}_C" for name in FIXED_BUILDINGS]
+    variable_buildings = [f"Build_{name}_C" for name in VARIABLE_BUILDINGS]
+
+    recipes: list[dict[str, str]] = []
+    for recipe_index in range(spec.recipe_count):
+        product_index = recipe_index % item_count
+        alternate = recipe_index // item_count
+        ingredients: dict[str, int] = {}
+        for _ in range(rng.randint(1, spec.max_ingredients)):
+            source = rng.randint(
+                product_index + 1, product_index + spec.ingredient_window
+            )
+            if source < item_count:
+                ingredients[_item_class(source)] = rng.randint(1, 12)
+            else:
+                ingredients[_resource_class(source % spec.resource_count)] = (
+                    rng.randint(1, 12)
+                )
+        if product_index > 0 and rng.random() < spec.cycle_fraction:
+            ingredients[_item_class(rng.randrange(product_index))] = rng.randint(1, 3)
+
+        products = {_item_class(product_index): rng.randint(1, 6)}
+        if rng.random() < 0.1:
+            products[_item_class(rng.randrange(item_count))] = rng.randint(1, 3)
+
+        if rng.random() < spec.handcraft_fraction:
+            produced_in = ["BP_WorkBenchComponent_C"]
+        elif rng.random() < 0.1:
+            produced_in = [rng.choice(variable_buildings), "BP_BuildGun_C"]
+        else:
+            produced_in = [rng.choice(fixed_buildings)]
+
+        variable = produced_in[0] in variable_buildings
+        class_name = (
+            f"Recipe_Alternate_Synthetic{product_index}_{alternate}_C"
+            if alternate
+            else f"Recipe_Synthetic{product_index}_C"
+        )
+        recipes.append(
+            {
+                "ClassName": class_name,
+                "FullName": f"BlueprintGeneratedClass {class_name}",
+                "mDisplayName": (
+                    f"Alternate: Synthetic Part {product_index} {alternate}"
+                    if alternate
+                    else f"Synthetic Part {product_index}"
+                ),
+                "mIngredients": _item_amounts(ingredients),
+                "mProduct": _item_amounts(products),
+                "mManufacturingMenuPriority": "0.000000",
+                "mManufactoringDuration": f"{rng.choice((2, 4, 6, 8, 12, 24, 60))}.000000",
+                "mManualManufacturingMultiplier": "1.000000",
+                "mProducedIn": "("
+                + ",".join(
+                    f'"{_class_path(building, "Buildable/Factory")}"'
+                    for building in produced_in
+                )
+                + ")",
+                "mRelevantEvents": "",
+                "mVariablePowerConsumptionConstant": (
+                    f"{rng.randint(0, 500)}.000000" if variable else "0.000000"
+                ),
+                "mVariablePowerConsumptionFactor": (
+                    f"{rng.randint(1, 1000)}.000000" if variable else "1.000000"
+                ),
+            }
+        )
+
+    unused_sections: list[dict[str, object]] = [
+        {
+            "NativeClass": f"{UNUSED_NATIVE_CLASS_PREFIX}{section}'",
+            "Classes": [
+                {
+                    "ClassName": f"Synthetic{section}_{record}_C",
+                    "mDisplayName": f"Unused {section} {record}",
+                    "mUnlocks": [
+                        {"Class": "BP_UnlockRecipe_C", "mRecipes": "(Recipe_A_C)"}
+                    ],
+                    "mSchematicDependencies": [],
+                    "mCost": _item_amounts({_resource_class(0): record + 1}),
+                }
+                for record in range(spec.unused_records_per_section)
+            ],
+        }
+        for section in range(spec.unused_section_count)
+    ]
+
+    sections: list[dict[str, object]] = [
+        {"NativeClass": RESOURCE_NATIVE_CLASS, "Classes": resources},
+        {"NativeClass": STANDARD_NATIVE_CLASS, "Classes": items},
+        {
+            "NativeClass": docs_parser.FIXED_MANUFACTURER_NATIVE_CLASS,
+            "Classes": [
+                _building_record(building, variable=False)
+                for building in fixed_buildings
+            ],
+        },
+        {
+            "NativeClass": docs_parser.VARIABLE_MANUFACTURER_NATIVE_CLASS,
+            "Classes": [
+                _building_record(building, variable=True)
+                for building in variable_buildings
+            ],
+        },
+        {"NativeClass": docs_parser.RECIPE_NATIVE_CLASS, "Classes": recipes},
+    ]
+    # Interleave unused sections as the real file does.
+    for offset, section in enumerate(unused_sections):
+        sections.insert((offset * 7) % (len(sections) + 1), section)
+    return sections
+
+
+def write_docs(path: pathlib.Path, spec: SyntheticDocsSpec) -> pathlib.Path:
+    """Write docs for spec to path in UTF-16, like the shipped en-US.json."""
+    path.write_text(
+        json.dumps(make_docs_sections(spec), indent="\t"), encoding="utf-16"
+    )
+    return path
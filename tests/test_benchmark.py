@@ -0,0 +1,63 @@
+import json
+import pathlib
+
+from satisfactory_recipes import docs_parser
+from tests import benchmark
+from tests import synthetic_docs
+
+
+def test_synthetic_docs_are_deterministic_and_parse_like_real_docs(
+    tmp_path: pathlib.Path,
+) -> None:
+    spec = synthetic_docs.SyntheticDocsSpec(recipe_count=300, cycle_fraction=0.2)
+
+    assert synthetic_docs.make_docs_sections(spec) == (
+        synthetic_docs.make_docs_sections(spec)
+    )
+    result = docs_parser.parse_game_data(
+        synthetic_docs.write_docs(tmp_path / "en-US.json", spec)
+    )
+
+    report = result.report
+    game_data = result.game_data
+    assert report.raw_recipe_count == spec.recipe_count
+    assert report.ignored_recipe_count > 0
+    assert report.loaded_recipe_count == report.automated_recipe_count
+    assert report.skipped_section_count == spec.unused_section_count
+    assert len(game_data.items_d) == spec.item_count + spec.resource_count
+
+    # Some recipe consumes an item that one of its own inputs depends on.
+    depth = {
+        item.class_name: int(item.class_name.removeprefix("Desc_Synthetic")[:-2])
+        for item in game_data.items_d.values()
+        if "Ore" not in item.class_name
+    }
+    assert any(
+        depth.get(ingredient.class_name, -1) < depth[product.class_name]
+        for recipe in game_data.recipes_d.values()
+        for product in recipe.products
+        for ingredient in recipe.inputs
+        if ingredient.class_name in depth
+    )
+
+
+def test_benchmarks_report_every_hot_path_as_json(tmp_path: pathlib.Path) -> None:
+    results = benchmark.run_benchmarks(
+        synthetic_docs.SyntheticDocsSpec(recipe_count=60, unused_section_count=2),
+        repeats=1,
+        work_dir=tmp_path,
+    )
+
+    report = json.loads(json.dumps(benchmark.make_report(results)))
+
+    assert [result["name"] for result in report["results"]] == [
+        "parse_game_data",
+        "GameData.scale_recipes",
+        "ProductionChain.get_net_per_min",
+        "search.sort_objects",
+        "SearchIndex.search",
+        "SearchIndex.best_matches",
+        "build_main_window_view_state",
+        "optimize_chain",
+    ]
+    assert all(result["best_seconds"] >= 0 for result in report["results"])
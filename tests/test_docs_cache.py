@@ -0,0 +1,109 @@
+import json
+import os
+import pathlib
+import typing as ty
+
+import pytest
+
+from satisfactory_recipes import docs_cache
+from satisfactory_recipes import docs_parser
+
+ITEM_NATIVE_CLASS = "/Script/CoreUObject.Class'/Script/FactoryGame.FGItemDescriptor'"
+
+
+def _write_docs(docs_path: pathlib.Path, item_names: list[str]) -> None:
+    docs_path.write_text(
+        json.dumps(
+            [
+                {
+                    "NativeClass": ITEM_NATIVE_CLASS,
+                    "Classes": [
+                        {
+                            "ClassName": name,
+                            "mDisplayName": name,
+                            "mForm": "RF_SOLID",
+                            "mCachedStackSize": "100",
+                            "mResourceSinkPoints": "1",
+                        }
+                        for name in item_names
+                    ],
+                }
+            ]
+        )
+    )
+
+
+def _count_parses(monkeypatch: pytest.MonkeyPatch) -> list[pathlib.Path]:
+    parsed: list[pathlib.Path] = []
+    real_parse = docs_parser.parse_game_data
+
+    def counting_parse(
+        docs_json: pathlib.Path, **kwargs: ty.Any
+    ) -> docs_parser.ParseResult:
+        parsed.append(docs_json)
+        return real_parse(docs_json, **kwargs)
+
+    monkeypatch.setattr(docs_parser, "parse_game_data", counting_parse)
+    return parsed
+
+
+def test_docs_cache_reuses_parsed_data_until_docs_change(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    docs_path = tmp_path / "en-us.json"
+    cache_path = tmp_path / "cache.pickle"
+    _write_docs(docs_path, ["Desc_A_C"])
+    parsed = _count_parses(monkeypatch)
+
+    first = docs_cache.parse_game_data(docs_path, cache_path=cache_path)
+    second = docs_cache.parse_game_data(docs_path, cache_path=cache_path)
+
+    assert parsed == [docs_path]
+    assert second.game_data.items_d == first.game_data.items_d
+    assert second.report == first.report
+
+    # Same size and mtime, different contents.
+    stat = docs_path.stat()
+    _write_docs(docs_path, ["Desc_B_C"])
+    os.utime(docs_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    third = docs_cache.parse_game_data(docs_path, cache_path=cache_path)
+
+    assert len(parsed) == 2
+    assert set(third.game_data.items_d) == {"Desc_B_C"}
+
+
+def test_docs_cache_is_invalidated_by_parser_version(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    docs_path = tmp_path / "en-us.json"
+    cache_path = tmp_path / "cache.pickle"
+    _write_docs(docs_path, ["Desc_A_C"])
+    parsed = _count_parses(monkeypatch)
+
+    docs_cache.parse_game_data(docs_path, cache_path=cache_path)
+    monkeypatch.setattr(docs_parser, "PARSER_VERSION", docs_parser.PARSER_VERSION + 1)
+    docs_cache.parse_game_data(docs_path, cache_path=cache_path)
+
+    assert len(parsed) == 2
+
+
+def test_docs_cache_ignores_corrupt_cache_file(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    docs_path = tmp_path / "en-us.json"
+    cache_path = tmp_path / "cache.pickle"
+    _write_docs(docs_path, ["Desc_A_C"])
+    cache_path.write_bytes(b"not a pickle")
+    parsed = _count_parses(monkeypatch)
+
+    result = docs_cache.parse_game_data(docs_path, cache_path=cache_path)
+
+    assert parsed == [docs_path]
+    assert set(result.game_data.items_d) == {"Desc_A_C"}
+    assert "Ignoring unreadable docs cache" in capsys.readouterr().err
+    docs_cache.parse_game_data(docs_path, cache_path=cache_path)
+    assert len(parsed) == 1
@@ -1,7 +1,10 @@
 import fractions as fr
+import itertools
 import json
 import pathlib
 
+import pytest
+
 from satisfactory_recipes import docs_parser
 from satisfactory_recipes import info_classes as ic
 
@@ -201,4 +204,118 @@ def test_power_source_comes_from_building_provenance_not_recipe_defaults(
         recipe_power_recipes_with_default_parameters=frozenset(
             {"Recipe_VariableDefault_C"}
         ),
+        loaded_section_count=4,
+        skipped_section_count=0,
+    )
+
+
+def test_unused_sections_are_skipped_in_any_layout(tmp_path: pathlib.Path) -> None:
+    item_native_class = next(iter(docs_parser.ITEM_KINDS_BY_NATIVE_CLASS))
+    sections: list[dict[str, object]] = [
+        {
+            "NativeClass": "/Script/CoreUObject.Class'/Script/FactoryGame.FGSchematic'",
+            "Classes": [{"ClassName": "Schematic_C", "mUnlocks": [{"x": [1, 2]}]}],
+        },
+        {"NativeClass": item_native_class, "Classes": [_item_record("Desc_A_C")]},
+        {"NativeClass": "Unused", "Classes": [{"ClassName": 'Odd \\" [ { C'}]},
+    ]
+    docs_path = tmp_path / "en-us.json"
+    docs_path.write_text(json.dumps(sections), encoding="utf-16")
+
+    report = docs_parser.parse_game_data(docs_path).report
+
+    assert (report.loaded_section_count, report.skipped_section_count) == (1, 2)
+    assert report.docs_load_peak_bytes is None
+
+    # Sections that do not lead with NativeClass still load, decoded to check.
+    reordered = [
+        {"Classes": s["Classes"], "NativeClass": s["NativeClass"]} for s in sections
+    ]
+    game_data = docs_parser.load_game_data(_write_docs(tmp_path, reordered))
+
+    assert set(game_data.items_d) == {"Desc_A_C"}
+
+
+def test_sections_split_across_read_chunks_load_the_same(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    item_native_class = next(iter(docs_parser.ITEM_KINDS_BY_NATIVE_CLASS))
+    sections: list[dict[str, object]] = [
+        {"NativeClass": "Unused", "Classes": [{"ClassName": 'Odd \\" ] } C'}]},
+        {
+            "NativeClass": item_native_class,
+            "Classes": [_item_record("Desc_A_C"), _item_record('Desc_"B"_C')],
+        },
+    ]
+    docs_path = _write_docs(tmp_path, sections)
+    expected = docs_parser.parse_game_data(docs_path)
+
+    for chunk_chars in (1, 2, 3, 7):
+        monkeypatch.setattr(docs_parser, "_READ_CHUNK_CHARS", chunk_chars)
+        result = docs_parser.parse_game_data(docs_path)
+        assert result.game_data.items_d == expected.game_data.items_d
+        assert result.report.skipped_section_count == 1
+
+
+def test_profiled_parse_reports_cost_of_each_phase(tmp_path: pathlib.Path) -> None:
+    sections: list[dict[str, object]] = [
+        {
+            "NativeClass": next(iter(docs_parser.ITEM_KINDS_BY_NATIVE_CLASS)),
+            "Classes": [_item_record("Desc_A_C")],
+        },
+        {
+            "NativeClass": docs_parser.FIXED_MANUFACTURER_NATIVE_CLASS,
+            "Classes": [_building_record("Build_A_C", power_draw="4")],
+        },
+        {
+            "NativeClass": docs_parser.RECIPE_NATIVE_CLASS,
+            "Classes": [
+                _recipe_record(
+                    "Recipe_A_C",
+                    product_class="Desc_A_C",
+                    producer_class="Build_A_C",
+                )
+            ],
+        },
+    ]
+
+    report = docs_parser.parse_game_data(
+        _write_docs(tmp_path, sections), profile=True
+    ).report
+
+    assert set(report.phase_costs) == set(docs_parser.LoadPhase)
+    assert all(cost.peak_bytes > 0 for cost in report.phase_costs.values())
+    assert report.docs_load_peak_bytes == max(
+        report.phase_costs[phase].peak_bytes
+        for phase in (
+            docs_parser.LoadPhase.READ_FILE,
+            docs_parser.LoadPhase.DECODE_JSON,
+            docs_parser.LoadPhase.VALIDATE_SECTIONS,
+        )
+    )
+    table = docs_parser.format_phase_costs(report)
+    assert "parse_recipes" in table
+    assert "total" in table
+
+
+def test_parse_reports_each_phase_as_it_is_entered(tmp_path: pathlib.Path) -> None:
+    item_native_class = next(iter(docs_parser.ITEM_KINDS_BY_NATIVE_CLASS))
+    sections: list[dict[str, object]] = [
+        {"NativeClass": item_native_class, "Classes": [_item_record("Desc_A_C")]},
+        {"NativeClass": item_native_class, "Classes": [_item_record("Desc_B_C")]},
+    ]
+    reported: list[docs_parser.LoadPhase] = []
+
+    docs_parser.parse_game_data(
+        _write_docs(tmp_path, sections), on_phase=reported.append
+    )
+
+    assert reported[0] is docs_parser.LoadPhase.READ_FILE
+    assert reported[-1] is docs_parser.LoadPhase.BUILD_REPORT
+    assert set(reported) == set(docs_parser.LoadPhase) - {
+        docs_parser.LoadPhase.PARSE_BUILDINGS,
+        docs_parser.LoadPhase.PARSE_RECIPES,
+    }
+    assert all(
+        phase is not previous for previous, phase in itertools.pairwise(reported)
     )
@@ -7,6 +7,13 @@ import pytestqt.qtbot
 from satisfactory_recipes.gui import dialog_components
 
 
+def _shown_labels(
+    selector: dialog_components.SearchableSelectionList[object],
+) -> list[str]:
+    model = selector.proxy_model
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
 def test_searchable_selection_filters_selects_and_emits_activation(
     qtbot: pytestqt.qtbot.QtBot,
 ) -> None:
@@ -30,14 +37,13 @@ def test_searchable_selection_filters_selects_and_emits_activation(
     selector.selection_changed.connect(selections.append)
     selector.search_edit.setText("rod")
 
-    assert selector.list_widget.count() == 1
-    assert selector.list_widget.item(0).text() == "Iron Rod"
+    assert _shown_labels(selector) == ["Iron Rod"]
     assert selector.selected_object is iron_rod
     assert selections[-1] is iron_rod
 
     activated: list[object] = []
     selector.selection_activated.connect(activated.append)
-    selector.list_widget.itemDoubleClicked.emit(selector.list_widget.item(0))
+    selector.list_view.doubleClicked.emit(selector.proxy_model.index(0, 0))
     assert activated == [iron_rod]
 
 
@@ -57,13 +63,43 @@ def test_searchable_selection_preserves_duplicate_labels(
 
     selector.search_edit.setText("alternate")
 
-    assert selector.list_widget.count() == 2
-    selector.list_widget.setCurrentRow(0)
+    assert _shown_labels(selector) == ["Alternate Recipe", "Alternate Recipe"]
+    selector.list_view.setCurrentIndex(selector.proxy_model.index(0, 0))
     assert selector.selected_object is first
-    selector.list_widget.setCurrentRow(1)
+    selector.list_view.setCurrentIndex(selector.proxy_model.index(1, 0))
     assert selector.selected_object is second
 
 
+def test_searchable_selection_ranks_large_option_sets_in_the_background(
+    qtbot: pytestqt.qtbot.QtBot,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        dialog_components.SearchableSelectionList, "background_search_threshold", 2
+    )
+    monkeypatch.setattr(
+        dialog_components.SearchableSelectionList, "debounce_interval_ms", 10
+    )
+    iron_rod = object()
+    selector = dialog_components.SearchableSelectionList(
+        options=[
+            dialog_components.SelectionOption("Iron Plate", object()),
+            dialog_components.SelectionOption("Iron Rod", iron_rod),
+            dialog_components.SelectionOption("Copper Sheet", object()),
+        ],
+        search_placeholder="Search items",
+    )
+    qtbot.addWidget(selector)
+    assert selector.searches_in_background
+
+    selector.search_edit.setText("iron")
+    selector.search_edit.setText("rod")
+    assert _shown_labels(selector) == ["Copper Sheet", "Iron Plate", "Iron Rod"]
+
+    qtbot.waitUntil(lambda: _shown_labels(selector) == ["Iron Rod"])
+    assert selector.selected_object is iron_rod
+
+
 def test_positive_fraction_input_returns_an_exact_value(
     qtbot: pytestqt.qtbot.QtBot,
 ) -> None:
@@ -9,6 +9,11 @@ from satisfactory_recipes.gui import dialogs
 from tests import support
 
 
+def _shown_labels(view: QtWidgets.QListView) -> list[str]:
+    model = view.model()
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
 def test_item_search_filters_and_returns_exact_amount(
     qtbot: pytestqt.qtbot.QtBot,
 ) -> None:
@@ -24,8 +29,7 @@ def test_item_search_filters_and_returns_exact_amount(
 
     dialog.search_edit.setText("plate")
 
-    assert dialog.item_list.count() == 1
-    assert dialog.item_list.item(0).text() == "Iron Plate"
+    assert _shown_labels(dialog.item_list) == ["Iron Plate"]
     assert dialog.amount_edit is not None
     dialog.amount_edit.setText("1/3")
     buttons = dialog.findChild(QtWidgets.QDialogButtonBox)
@@ -102,9 +106,7 @@ def test_recipe_search_lists_standard_recipes_before_alternates(
     dialog = dialogs.RecipeSearchDialog(recipes=recipes, title="Choose Recipe")
     qtbot.addWidget(dialog)
 
-    assert [
-        dialog.recipe_list.item(row).text() for row in range(dialog.recipe_list.count())
-    ] == [
+    assert _shown_labels(dialog.recipe_list) == [
         "Iron Plate",
         "Steel Beam",
         "Alternate: Adhered Iron Plate",
@@ -112,6 +114,34 @@ def test_recipe_search_lists_standard_recipes_before_alternates(
     ]
 
 
+def test_recipe_search_filters_on_recipe_contents(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    acid = support.make_fake_item("Sulfuric Acid", ic.MatterState.LIQUID)
+    resin = support.make_fake_item("Polymer Resin")
+    battery_recipe = support.make_fake_recipe(
+        class_name="Recipe_Battery_C",
+        name="Battery",
+        inputs={acid: fr.Fraction(5), resin: fr.Fraction(1)},
+    )
+    rubber_recipe = support.make_fake_recipe(
+        class_name="Recipe_Rubber_C",
+        name="Rubber",
+        inputs={resin: fr.Fraction(4)},
+    )
+    dialog = dialogs.RecipeSearchDialog(
+        recipes=[battery_recipe, rubber_recipe],
+        title="Choose Recipe",
+    )
+    qtbot.addWidget(dialog)
+
+    dialog.search_edit.setText("uses: sulfuric acid")
+    assert _shown_labels(dialog.recipe_list) == ["Battery"]
+
+    dialog.search_edit.setText("uses: polymer")
+    assert _shown_labels(dialog.recipe_list) == ["Battery", "Rubber"]
+
+
 def test_item_search_double_click_accepts_current_item(
     qtbot: pytestqt.qtbot.QtBot,
 ) -> None:
@@ -119,7 +149,7 @@ def test_item_search_double_click_accepts_current_item(
     dialog = dialogs.ItemSearchDialog(items=[iron_plate], title="Choose Item")
     qtbot.addWidget(dialog)
 
-    dialog.item_list.itemDoubleClicked.emit(dialog.item_list.item(0))
+    dialog.item_list.doubleClicked.emit(dialog.item_list.model().index(0, 0))
 
     assert dialog.result() == QtWidgets.QDialog.DialogCode.Accepted
     assert dialog.selected_item is iron_plate
@@ -1,18 +1,26 @@
 import collections.abc as cabc
+import concurrent.futures
 import dataclasses
 import fractions as fr
 import pathlib
+import threading
+import typing as ty
 
 import pytest
 from PySide6 import QtGui, QtWidgets
 import pytestqt.qtbot
 
 from satisfactory_recipes import config as sr_config
+from satisfactory_recipes import docs_cache
+from satisfactory_recipes import docs_parser
 from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import item_counter
 from satisfactory_recipes import production_chain as pc
 from satisfactory_recipes import stupid_classes as sc
 from satisfactory_recipes.gui import dialogs
 from satisfactory_recipes.gui import main_window
+from satisfactory_recipes.gui import view_state
+from satisfactory_recipes.gui import widgets
 from tests import support
 
 
@@ -180,11 +188,10 @@ def test_window_renders_representative_chain(
     )
     assert get_table_item(window.chain_details.outputs_table, 0, 1).text() == "3.000"
 
+    details_model = window.chain_details.recipe_details.details_model
     detail_text = " ".join(
-        label.text()
-        for label in window.chain_details.recipe_details.content_widget.findChildren(
-            QtWidgets.QLabel
-        )
+        str(details_model.data(details_model.index(row), widgets.CARD_HTML_ROLE))
+        for row in range(details_model.rowCount())
     )
     assert "Iron Plate" in detail_text
     assert "Produced in <b>Constructor</b>" in detail_text
@@ -195,11 +202,8 @@ def test_window_renders_representative_chain(
     assert window.chain_details.currentWidget() is window.chain_details.inputs_table
     assert get_table_item(window.chain_details.inputs_table, 0, 0).font().bold()
     assert get_table_item(window.chain_details.outputs_table, 0, 0).font().bold()
-    assert any(
-        card.property("selectedRecipe")
-        for card in window.chain_details.recipe_details.content_widget.findChildren(
-            QtWidgets.QGroupBox
-        )
+    assert (
+        window.chain_details.recipe_details.selected_recipe is gui_scenario.plate_recipe
     )
 
     count_item = get_table_item(window.recipes_panel.table, 0, 2)
@@ -261,7 +265,7 @@ def test_refresh_computes_chain_view_state_once(
 
     def count_net_calculation(
         chain: pc.ProductionChain,
-    ) -> sc.ScalableCounter[ic.Item]:
+    ) -> item_counter.ItemCounter:
         nonlocal net_calculations
         net_calculations += 1
         return original_get_net_per_min(chain)
@@ -279,6 +283,76 @@ def test_refresh_computes_chain_view_state_once(
     assert net_calculations == 2
 
 
+def test_background_refresh_applies_only_the_latest_chain(
+    qtbot: pytestqt.qtbot.QtBot,
+    gui_scenario: GuiScenario,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(main_window.MainWindow, "background_refresh_threshold", 0)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(main_window.MainWindow, "view_state_executor", executor)
+    window = make_window(qtbot, gui_scenario, chain=gui_scenario.chain)
+    qtbot.waitUntil(lambda: not window.refresh_pending)
+    assert get_table_item(window.recipes_panel.table, 0, 2).text() == "3.000"
+
+    original_build = view_state.build_main_window_view_state
+    built_counts: list[fr.Fraction] = []
+
+    def record_build(
+        *, chain: pc.ProductionChain | None, **kwargs: object
+    ) -> view_state.MainWindowViewState:
+        assert chain is not None and chain.recipes.frozen
+        built_counts.append(chain.recipes[gui_scenario.plate_recipe])
+        return original_build(chain=chain, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(view_state, "build_main_window_view_state", record_build)
+
+    # Hold the worker so both refreshes queue up behind it.
+    release_worker = threading.Event()
+    executor.submit(release_worker.wait)
+    gui_scenario.chain.recipes[gui_scenario.plate_recipe] = fr.Fraction(5)
+    window.refresh()
+    gui_scenario.chain.recipes[gui_scenario.plate_recipe] = fr.Fraction(7)
+    window.refresh()
+    assert window.refresh_pending
+    release_worker.set()
+
+    qtbot.waitUntil(lambda: not window.refresh_pending)
+    assert built_counts == [fr.Fraction(7)]
+    assert get_table_item(window.recipes_panel.table, 0, 2).text() == "7.000"
+    executor.shutdown()
+
+
+def test_background_refresh_failure_is_reported(
+    qtbot: pytestqt.qtbot.QtBot,
+    gui_scenario: GuiScenario,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(main_window.MainWindow, "background_refresh_threshold", 0)
+    window = make_window(qtbot, gui_scenario, chain=gui_scenario.chain)
+    qtbot.waitUntil(lambda: not window.refresh_pending)
+    errors: list[tuple[str, str]] = []
+
+    def fail_build(**_kwargs: object) -> view_state.MainWindowViewState:
+        raise ZeroDivisionError("no rate")
+
+    def record_error(
+        _parent: QtWidgets.QWidget,
+        title: str,
+        message: str,
+    ) -> object:
+        errors.append((title, message))
+        return QtWidgets.QMessageBox.StandardButton.Ok
+
+    monkeypatch.setattr(view_state, "build_main_window_view_state", fail_build)
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", record_error)
+    window.refresh()
+
+    qtbot.waitUntil(lambda: not window.refresh_pending)
+    assert errors == [("Refresh Failed", "no rate")]
+    assert get_table_item(window.recipes_panel.table, 0, 2).text() == "3.000"
+
+
 def test_remove_recipe_button_updates_chain_and_dirty_state(
     qtbot: pytestqt.qtbot.QtBot,
     gui_scenario: GuiScenario,
@@ -297,6 +371,83 @@ def test_remove_recipe_button_updates_chain_and_dirty_state(
     assert window.status_label.text() == "File: Unsaved *"
 
 
+def test_undo_and_redo_actions_restore_removed_recipe(
+    qtbot: pytestqt.qtbot.QtBot,
+    gui_scenario: GuiScenario,
+) -> None:
+    window = make_window(qtbot, gui_scenario, chain=gui_scenario.chain)
+    assert not window.undo_action.isEnabled()
+    assert window.undo_action.shortcut() == QtGui.QKeySequence(
+        QtGui.QKeySequence.StandardKey.Undo
+    )
+    window.remove_recipe(gui_scenario.plate_recipe)
+    assert window.recipes_panel.table.rowCount() == 0
+
+    window.undo_action.trigger()
+
+    assert gui_scenario.chain.recipes == {gui_scenario.plate_recipe: fr.Fraction(3)}
+    assert window.recipes_panel.table.rowCount() == 1
+    assert not window.undo_action.isEnabled()
+    assert window.redo_action.isEnabled()
+
+    window.redo_action.trigger()
+
+    assert gui_scenario.plate_recipe not in gui_scenario.chain.recipes
+    assert window.recipes_panel.table.rowCount() == 0
+    assert window.undo_action.isEnabled()
+
+
+def test_large_denominators_are_flagged_and_goal_rate_rounded(
+    qtbot: pytestqt.qtbot.QtBot,
+    gui_scenario: GuiScenario,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    reports: list[tuple[str, str]] = []
+
+    def record_information(
+        _parent: QtWidgets.QWidget, title: str, text: str
+    ) -> QtWidgets.QMessageBox.StandardButton:
+        reports.append((title, text))
+        return QtWidgets.QMessageBox.StandardButton.Ok
+
+    monkeypatch.setattr(QtWidgets.QMessageBox, "information", record_information)
+    window = make_window(qtbot, gui_scenario, chain=gui_scenario.chain)
+    assert window.status_label.text() == "File: Unsaved"
+    assert not window.round_goal_rate_action.isEnabled()
+
+    gui_scenario.chain.scale_item(gui_scenario.plate, fr.Fraction(2**70 + 1, 2**70))
+    window.refresh()
+    assert "Edit > Round Goal Rate can shrink them" in window.status_label.text()
+    assert window.round_goal_rate_action.isEnabled()
+
+    assert "every net rate changes" in window.round_goal_rate_action.statusTip()
+    window.round_goal_rate_action.trigger()
+
+    # The user is told that rounding rescaled every net rate, not just the goal.
+    old_rate = fr.Fraction(2**70 + 1, 2**70)
+    assert reports == [
+        (
+            "Goal Rate Rounded",
+            f"Scaled the whole chain by {1 / old_rate}: "
+            f"{gui_scenario.plate.name} went from {old_rate}/min to 1/min, "
+            "and every other net rate changed by the same factor.",
+        )
+    ]
+    assert window.status_label.text() == "File: Unsaved *"
+    assert gui_scenario.chain.get_net_per_min()[gui_scenario.plate] == 1
+    assert window.undo_action.isEnabled()
+    assert not window.round_goal_rate_action.isEnabled()
+
+    # Large denominators that do not come from the goal rate are only flagged.
+    gui_scenario.chain.recipes[gui_scenario.ingot_recipe] = fr.Fraction(1, 3**45)
+    window.refresh()
+    status = window.status_label.text()
+    assert status.endswith(
+        f"Recipe counts have fractions over {pc.DENOMINATOR_WARNING_BITS} bits"
+    )
+    assert not window.round_goal_rate_action.isEnabled()
+
+
 def test_editing_net_rate_scales_chain_exactly(
     qtbot: pytestqt.qtbot.QtBot,
     gui_scenario: GuiScenario,
@@ -521,6 +672,128 @@ def test_save_as_failure_does_not_replace_filename(
     assert window.has_unsaved_changes
 
 
+def test_selected_docs_load_in_background_with_progress(
+    qtbot: pytestqt.qtbot.QtBot,
+    gui_scenario: GuiScenario,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    window = make_window(qtbot, gui_scenario, chain=gui_scenario.chain)
+    new_docs_path = pathlib.Path("other-en-us.json")
+    loaded_game_data = support.make_fake_game_data(items=[gui_scenario.ore], recipes=[])
+    release_loader = threading.Event()
+
+    def load_slowly(
+        docs_path: pathlib.Path,
+        *,
+        on_phase: cabc.Callable[[docs_parser.LoadPhase], None],
+        **_kwargs: object,
+    ) -> ic.GameData:
+        assert docs_path == new_docs_path
+        on_phase(docs_parser.LoadPhase.PARSE_RECIPES)
+        release_loader.wait()
+        return loaded_game_data
+
+    def choose_new_docs(**_kwargs: object) -> dialogs.DocsPathSelection:
+        return dialogs.DocsPathSelection(docs_path=new_docs_path)
+
+    def skip_save_config(_configuration: sr_config.Configuration) -> None:
+        pass
+
+    monkeypatch.setattr(docs_cache, "load_game_data", load_slowly)
+    monkeypatch.setattr(dialogs, "choose_docs_path", choose_new_docs)
+    monkeypatch.setattr(sr_config, "save_config", skip_save_config)
+
+    window.select_docs_file()
+
+    qtbot.waitUntil(lambda: "parse recipes" in window.load_progress.format())
+    assert window.loading_game_data
+    assert not window.new_action.isEnabled()
+    assert not window.add_goal_recipe_action.isEnabled()
+    assert not window.recipes_panel.isEnabled()
+    assert window.production_chain is gui_scenario.chain
+
+    release_loader.set()
+    qtbot.waitUntil(lambda: not window.loading_game_data)
+    assert window.game_data is loaded_game_data
+    assert window.docs_path == new_docs_path
+    assert window.production_chain is None
+    assert window.new_action.isEnabled()
+    assert window.recipes_panel.isEnabled()
+    assert window.load_progress.isHidden()
+
+
+def test_startup_docs_load_failure_is_reported_and_controls_return(
+    qtbot: pytestqt.qtbot.QtBot,
+    gui_scenario: GuiScenario,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    window = make_window(qtbot, gui_scenario, chain=None)
+    errors: list[tuple[str, str]] = []
+
+    def fail_load(*_args: object, **_kwargs: object) -> ty.NoReturn:
+        raise TypeError("Expected Satisfactory docs root to be a list")
+
+    def record_error(
+        _parent: QtWidgets.QWidget,
+        title: str,
+        message: str,
+    ) -> object:
+        errors.append((title, message))
+        return QtWidgets.QMessageBox.StandardButton.Ok
+
+    monkeypatch.setattr(docs_cache, "load_game_data", fail_load)
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", record_error)
+
+    window.load_startup_data(filename=None, initial_scale=fr.Fraction(1))
+
+    qtbot.waitUntil(lambda: not window.loading_game_data)
+    assert errors == [
+        ("Game Data Load Failed", "Expected Satisfactory docs root to be a list")
+    ]
+    assert window.select_docs_action.isEnabled()
+    assert window.load_progress.isHidden()
+
+
+def test_startup_open_failure_is_reported(
+    qtbot: pytestqt.qtbot.QtBot,
+    gui_scenario: GuiScenario,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    window = make_window(qtbot, gui_scenario, chain=None)
+    errors: list[str] = []
+    prompted: list[bool] = []
+
+    def load_game_data(*_args: object, **_kwargs: object) -> ic.GameData:
+        return gui_scenario.game_data
+
+    def record_error(
+        _parent: QtWidgets.QWidget,
+        title: str,
+        _message: str,
+    ) -> object:
+        errors.append(title)
+        return QtWidgets.QMessageBox.StandardButton.Ok
+
+    def record_prompt(_window: main_window.MainWindow) -> None:
+        prompted.append(True)
+
+    monkeypatch.setattr(docs_cache, "load_game_data", load_game_data)
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", record_error)
+    monkeypatch.setattr(
+        main_window.MainWindow, "prompt_for_goal_if_needed", record_prompt
+    )
+
+    window.load_startup_data(
+        filename=tmp_path / "missing.json", initial_scale=fr.Fraction(1)
+    )
+
+    qtbot.waitUntil(lambda: not window.loading_game_data)
+    assert errors == ["Open Failed"]
+    assert window.filename is None
+    assert prompted == [True]
+
+
 def test_successful_save_as_updates_filename_and_clears_dirty_state(
     qtbot: pytestqt.qtbot.QtBot,
     gui_scenario: GuiScenario,
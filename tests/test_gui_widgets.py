@@ -1,12 +1,13 @@
 import fractions as fr
 
+import pytest
 from PySide6 import QtCore, QtGui, QtWidgets
 import pytestqt.qtbot
 
 from satisfactory_recipes import info_classes as ic
 from satisfactory_recipes import production_chain as pc
 from satisfactory_recipes import stupid_classes as sc
-from satisfactory_recipes.gui import widgets
+from satisfactory_recipes.gui import recipe_format, widgets
 from tests import support
 
 
@@ -149,6 +150,66 @@ def test_recipes_panel_renders_and_emits_recipe_actions(
     assert recipe in chain.recipes
 
 
+def test_recipes_panel_updates_only_changed_rows_and_keeps_selection(
+    qtbot: pytestqt.qtbot.QtBot,
+) -> None:
+    _ore, ingot, recipe, _chain = make_widget_scenario()
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        name="Iron Plate",
+        inputs={ingot: fr.Fraction(3)},
+    )
+    rod_recipe = support.make_fake_recipe(
+        class_name="Recipe_Rod_C",
+        name="Iron Rod",
+        inputs={ingot: fr.Fraction(1)},
+    )
+    panel = widgets.RecipesPanel()
+    qtbot.addWidget(panel)
+
+    def show(recipes: widgets.RecipeCounts) -> None:
+        panel.set_view(
+            recipes=recipes,
+            can_add_goal_recipe=True,
+            can_add_shortage_recipe=True,
+            selected_recipe=plate_recipe,
+        )
+
+    show(((recipe, fr.Fraction(3)), (plate_recipe, fr.Fraction(1))))
+    ingot_name = panel.table.item(0, 1)
+    plate_button = panel.table.cellWidget(1, 0)
+    changed_cells: list[tuple[int, int]] = []
+    table_model = panel.table.model()
+
+    def record_changed(
+        top_left: QtCore.QModelIndex,
+        _bottom_right: QtCore.QModelIndex,
+        _roles: list[int] | None = None,
+    ) -> None:
+        changed_cells.append((top_left.row(), top_left.column()))
+
+    table_model.dataChanged.connect(record_changed)
+
+    show(((recipe, fr.Fraction(4)), (plate_recipe, fr.Fraction(1))))
+
+    assert panel.table.item(0, 1) is ingot_name
+    assert panel.table.cellWidget(1, 0) is plate_button
+    assert {row for row, _column in changed_cells} == {0}
+    count_cell = panel.table.item(0, 2)
+    assert count_cell is not None
+    assert count_cell.text() == "4.000"
+    assert panel.table.selectionModel().isRowSelected(1)
+
+    show(((rod_recipe, fr.Fraction(2)), (plate_recipe, fr.Fraction(1))))
+
+    assert panel.table.rowCount() == 2
+    name_cell = panel.table.item(0, 1)
+    assert name_cell is not None
+    assert name_cell.text() == "Iron Rod"
+    assert panel.table.cellWidget(1, 0) is plate_button
+    assert panel.table.selectionModel().isRowSelected(1)
+
+
 def test_net_items_table_renders_without_edit_signal_and_emits_exact_amount(
     qtbot: pytestqt.qtbot.QtBot,
 ) -> None:
@@ -218,7 +279,7 @@ def test_chain_details_tabs_renders_all_views_and_forwards_shortage_request(
     assert output_name.text() == ingot.name
     assert "add a recipe" in input_name.toolTip()
     assert "Double-click" in tabs.tabToolTip(0)
-    assert tabs.recipe_details.content_layout.count() == 2
+    assert tabs.recipe_details.details_model.rowCount() == 1
 
     tabs.focus_recipe(recipe)
 
@@ -228,14 +289,77 @@ def test_chain_details_tabs_renders_all_views_and_forwards_shortage_request(
     assert input_name.background().color() == tabs.inputs_table.palette().color(
         QtGui.QPalette.ColorRole.Highlight
     )
-    selected_cards = [
-        card
-        for card in tabs.recipe_details.content_widget.findChildren(QtWidgets.QGroupBox)
-        if card.property("selectedRecipe")
-    ]
+    assert tabs.recipe_details.selected_recipe is recipe
+    selected_cards = tabs.recipe_details.selectionModel().selectedIndexes()
     assert len(selected_cards) == 1
-    assert selected_cards[0].title().startswith(recipe.name)
+    assert str(selected_cards[0].data()).startswith(recipe.name)
 
     tabs.inputs_table.itemDoubleClicked.emit(input_name)
 
     assert shortages == [ore]
+
+
+def test_recipe_details_only_formats_cards_that_changed(
+    qtbot: pytestqt.qtbot.QtBot,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _ore, ingot, recipe, _chain = make_widget_scenario()
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        name="Iron Plate",
+        inputs={ingot: fr.Fraction(3)},
+    )
+    details = widgets.RecipeDetailsView()
+    qtbot.addWidget(details)
+    formatted: list[tuple[str, fr.Fraction]] = []
+    real_details_html = recipe_format.recipe_details_html
+
+    def counting_details_html(card_recipe: ic.Recipe, count: fr.Fraction) -> str:
+        formatted.append((card_recipe.name, count))
+        return real_details_html(card_recipe, count)
+
+    monkeypatch.setattr(recipe_format, "recipe_details_html", counting_details_html)
+
+    def card_html(row: int) -> str:
+        model = details.details_model
+        return str(model.data(model.index(row), widgets.CARD_HTML_ROLE))
+
+    details.set_view(((recipe, fr.Fraction(3)), (plate_recipe, fr.Fraction(1))))
+    assert "Iron Ingot x 3.000" in card_html(0)
+    assert "Iron Plate x 1.000" in card_html(1)
+    formatted.clear()
+
+    details.set_view(((recipe, fr.Fraction(3)), (plate_recipe, fr.Fraction(2))))
+    card_html(0)
+    assert "Iron Plate x 2.000" in card_html(1)
+    assert formatted == [("Iron Plate", fr.Fraction(2))]
+
+    details.focus_recipe(plate_recipe)
+    details.set_view(((plate_recipe, fr.Fraction(2)),))
+    assert details.details_model.rowCount() == 1
+    assert details.selected_recipe is plate_recipe
+
+
+def test_recipe_cards_can_be_copied_as_text(qtbot: pytestqt.qtbot.QtBot) -> None:
+    _ore, ingot, recipe, _chain = make_widget_scenario()
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        name="Iron Plate",
+        inputs={ingot: fr.Fraction(3)},
+    )
+    details = widgets.RecipeDetailsView()
+    qtbot.addWidget(details)
+    clipboard = QtGui.QGuiApplication.clipboard()
+
+    assert not details.copy_all_cards_action.isEnabled()
+    details.set_view(((recipe, fr.Fraction(3)), (plate_recipe, fr.Fraction(1))))
+    assert details.copy_all_cards_action.isEnabled()
+    assert not details.copy_card_action.isEnabled()
+
+    details.focus_recipe(plate_recipe, scroll=False)
+    details.copy_card_action.trigger()
+    assert clipboard.text() == details.card_text(1)
+    assert clipboard.text().startswith("Iron Plate x 1.000")
+
+    details.copy_all_cards_action.trigger()
+    assert clipboard.text() == f"{details.card_text(0)}\n\n{details.card_text(1)}"
@@ -0,0 +1,77 @@
+import fractions as fr
+
+from satisfactory_recipes import history
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import production_chain as pc
+from satisfactory_recipes import stupid_classes as sc
+from tests import support
+
+
+def _make_chain() -> tuple[pc.ProductionChain, ic.Recipe, ic.Recipe]:
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    plate = support.make_fake_item("Plate")
+    ingot_recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(1)},
+        products={ingot: fr.Fraction(1)},
+    )
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        inputs={ingot: fr.Fraction(2)},
+        products={plate: fr.Fraction(1)},
+    )
+    chain = pc.ProductionChain(
+        goal=plate,
+        recipes=sc.ScalableCounter[ic.Recipe]({plate_recipe: fr.Fraction(1)}),
+    )
+    return chain, ingot_recipe, plate_recipe
+
+
+def test_undo_and_redo_walk_recorded_edits() -> None:
+    chain, ingot_recipe, plate_recipe = _make_chain()
+    chain_history = history.ChainHistory(chain)
+
+    chain.add_scaled_recipe(ingot_recipe, next(iter(ingot_recipe.products)))
+    assert chain_history.record()
+    chain.scale_recipe_count(plate_recipe, fr.Fraction(3))
+    assert chain_history.record()
+    del chain.recipes[ingot_recipe]
+    assert chain_history.record()
+    assert not chain_history.record()
+
+    assert chain_history.undo()
+    assert chain.recipes == {plate_recipe: 3, ingot_recipe: 6}
+    assert chain_history.undo()
+    assert chain.recipes == {plate_recipe: 1, ingot_recipe: 2}
+    assert chain_history.undo()
+    assert chain.recipes == {plate_recipe: 1}
+    assert not chain_history.undo()
+
+    assert chain_history.redo()
+    assert chain.recipes == {plate_recipe: 1, ingot_recipe: 2}
+    # A fresh chain builds its net rates from scratch.
+    rebuilt = pc.ProductionChain(
+        goal=chain.goal,
+        recipes=sc.ScalableCounter[ic.Recipe](chain.recipes),
+    )
+    assert chain.get_net_per_min() == rebuilt.get_net_per_min()
+
+    # A new edit drops the steps that could still be redone.
+    chain.recipes[plate_recipe] = fr.Fraction(5)
+    assert not chain_history.redo()
+    assert chain_history.undo()
+    assert chain.recipes == {plate_recipe: 1, ingot_recipe: 2}
+
+
+def test_history_keeps_only_the_latest_steps() -> None:
+    chain, _ingot_recipe, plate_recipe = _make_chain()
+    chain_history = history.ChainHistory(chain, limit=3)
+
+    for count in range(2, 10):
+        chain.recipes[plate_recipe] = fr.Fraction(count)
+        chain_history.record()
+
+    while chain_history.undo():
+        pass
+    assert chain.recipes == {plate_recipe: 6}
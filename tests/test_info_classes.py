@@ -1,6 +1,7 @@
 import fractions as fr
 import json
 import pathlib
+import pickle
 
 import pytest
 
@@ -153,6 +154,57 @@ def test_game_data_scale_recipes_replaces_recipes_and_updates_scale() -> None:
     assert new_recipe.inputs[ore] == fr.Fraction(2)
 
 
+def test_game_data_indexes_producers_and_consumers_and_reindexes_on_scale() -> None:
+    ore = support.make_fake_item("Desc_Ore_C")
+    ingot = support.make_fake_item("Desc_Ingot_C")
+    plate = support.make_fake_item("Desc_Plate_C")
+    building = ic.Building(
+        class_name="Build_Smelter_C",
+        source_native_class="test.fixed_manufacturer",
+        name="Smelter",
+        kind=ic.BuildingKind.MANUFACTURER,
+        power_mode=ic.BuildingPowerMode.CONSTANT,
+        power_draw=fr.Fraction(4),
+    )
+    game_data = support.make_fake_game_data(
+        items=[ore, ingot, plate],
+        recipes=[
+            support.make_fake_recipe(
+                class_name="Recipe_Ingot_C",
+                inputs={ore: fr.Fraction(8)},
+                products={ingot: fr.Fraction(1)},
+                produced_in=building,
+            ),
+            support.make_fake_recipe(
+                class_name="Recipe_Plate_C",
+                inputs={ingot: fr.Fraction(3)},
+                products={plate: fr.Fraction(2)},
+                produced_in=building,
+            ),
+            support.make_fake_recipe(
+                class_name="Recipe_HandcraftedIngot_C",
+                inputs={ore: fr.Fraction(1)},
+                products={ingot: fr.Fraction(1)},
+            ),
+        ],
+    )
+
+    assert game_data.get_recipes_producing(ingot) == [
+        game_data.recipes_d["Recipe_Ingot_C"]
+    ]
+    assert game_data.get_recipes_consuming(ingot) == [
+        game_data.recipes_d["Recipe_Plate_C"]
+    ]
+    assert game_data.get_recipes_producing(ore) == []
+    assert game_data.producible_items == {ingot, plate}
+
+    game_data.scale_recipes(fr.Fraction(1, 4))
+
+    (consumer,) = game_data.get_recipes_consuming(ore)
+    assert consumer is game_data.recipes_d["Recipe_Ingot_C"]
+    assert consumer.inputs[ore] == fr.Fraction(2)
+
+
 def test_game_data_reports_recipes_skipped_for_missing_items(
     tmp_path: pathlib.Path,
 ) -> None:
@@ -229,4 +281,128 @@ def test_game_data_reports_recipes_skipped_for_missing_items(
         },
         fixed_power_recipes_with_nondefault_parameters={},
         recipe_power_recipes_with_default_parameters=frozenset(),
+        loaded_section_count=3,
+        skipped_section_count=0,
+    )
+
+
+def test_game_data_derived_views_are_cached_until_recipes_change() -> None:
+    ore = support.make_fake_item("Desc_Ore_C")
+    ingot = support.make_fake_item("Desc_Ingot_C")
+    game_data = support.make_fake_game_data(
+        items=[ore, ingot],
+        recipes=[
+            support.make_fake_recipe(
+                class_name="Recipe_Ingot_C",
+                inputs={ore: fr.Fraction(8)},
+                products={ingot: fr.Fraction(1)},
+            )
+        ],
+    )
+
+    item_name_d = game_data.item_name_d
+    producible_items = game_data.producible_items
+    assert game_data.item_name_d is item_name_d
+    assert game_data.producible_items is producible_items
+    assert game_data.generation == 0
+
+    game_data.scale_recipes(fr.Fraction(1, 2))
+
+    assert game_data.generation == 1
+    assert game_data.item_name_d is not item_name_d
+    assert game_data.item_name_d == item_name_d
+
+
+def test_game_data_at_scale_caches_variants_without_touching_the_base() -> None:
+    ore = support.make_fake_item("Desc_Ore_C")
+    ingot = support.make_fake_item("Desc_Ingot_C")
+    game_data = support.make_fake_game_data(
+        items=[ore, ingot],
+        recipes=[
+            support.make_fake_recipe(
+                class_name="Recipe_Ingot_C",
+                inputs={ore: fr.Fraction(6)},
+                products={ingot: fr.Fraction(1)},
+            )
+        ],
+    )
+    base_recipe = game_data.recipes_d["Recipe_Ingot_C"]
+
+    quarter = game_data.at_scale(fr.Fraction(1, 4))
+    double = quarter.at_scale(fr.Fraction(2))
+
+    assert game_data.scale == fr.Fraction(1)
+    assert game_data.recipes_d["Recipe_Ingot_C"] is base_recipe
+    assert quarter.recipes_d["Recipe_Ingot_C"].inputs[ore] == fr.Fraction(2)
+    # Scaled from the base, not from the rounded quarter-scale recipes.
+    assert double.recipes_d["Recipe_Ingot_C"].inputs[ore] == fr.Fraction(12)
+    assert double.at_scale(fr.Fraction(1)) is game_data
+    assert game_data.at_scale(fr.Fraction(1, 4)) is quarter
+
+    for numerator in range(3, 3 + ic.SCALED_VARIANT_CACHE_SIZE):
+        game_data.at_scale(fr.Fraction(numerator))
+    assert game_data.at_scale(fr.Fraction(1, 4)) is not quarter
+
+
+def test_equal_info_objects_are_interned() -> None:
+    ore = support.make_fake_item("Desc_Ore_C")
+    assert support.make_fake_item("Desc_Ore_C") is ore
+    assert support.make_fake_item("Desc_Ore_C", ic.MatterState.LIQUID) is not ore
+
+    recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C", inputs={ore: fr.Fraction(3)}
+    )
+    assert (
+        support.make_fake_recipe(
+            class_name="Recipe_Ingot_C", inputs={ore: fr.Fraction(3)}
+        )
+        is recipe
+    )
+    assert recipe.create_scaled(fr.Fraction(1)) is recipe
+    assert pickle.loads(pickle.dumps(recipe)) is recipe
+
+
+def test_interning_is_by_content_not_by_identity_key() -> None:
+    solid = support.make_fake_item("Desc_Ore_C")
+    liquid = support.make_fake_item("Desc_Ore_C", ic.MatterState.LIQUID)
+
+    assert solid.identity_key() == liquid.identity_key()
+    assert hash(solid) == hash(liquid)
+    assert solid != liquid
+
+
+def test_recipes_from_differently_scaled_game_data_never_collide() -> None:
+    ore = support.make_fake_item("Desc_Ore_C")
+    ingot = support.make_fake_item("Desc_Ingot_C")
+    game_data = support.make_fake_game_data(
+        items=[ore, ingot],
+        recipes=[
+            support.make_fake_recipe(
+                class_name="Recipe_Ingot_C",
+                inputs={ore: fr.Fraction(1)},
+                products={ingot: fr.Fraction(1)},
+            )
+        ],
+    )
+    scales = [fr.Fraction(1), fr.Fraction(1, 4), fr.Fraction(1, 2), fr.Fraction(3, 4)]
+    recipes = [
+        game_data.at_scale(scale).recipes_d["Recipe_Ingot_C"] for scale in scales
+    ]
+
+    # Every scale rounds the single input back up to 1, so only the scale differs.
+    assert {recipe.inputs[ore] for recipe in recipes} == {fr.Fraction(1)}
+    assert [recipe.scale for recipe in recipes] == scales
+    assert len(set(recipes)) == len(scales)
+    assert len({hash(recipe) for recipe in recipes}) == len(scales)
+    for recipe in recipes[1:]:
+        assert recipe != recipes[0]
+
+    counts = {recipe: fr.Fraction(index) for index, recipe in enumerate(recipes)}
+    assert [counts[recipe] for recipe in recipes] == [0, 1, 2, 3]
+
+    # The same scale reached another way gives back the same recipe.
+    rescaled = support.make_fake_game_data(
+        items=[ore, ingot], recipes=[game_data.recipes_d["Recipe_Ingot_C"]]
     )
+    rescaled.scale_recipes(fr.Fraction(1, 2))
+    assert rescaled.recipes_d["Recipe_Ingot_C"] is recipes[2]
@@ -89,3 +89,58 @@ def test_interactive_save_cancel_does_not_save(
     runner.save()
 
     assert not called
+
+
+def test_choose_named_searches_names_for_an_index(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    items = [
+        support.make_fake_item("Iron Plate"),
+        support.make_fake_item("Heavy Modular Frame"),
+    ]
+    entries = iter(["heavy modlar", "7", "zzzz", "1"])
+
+    def answer(_prompt: str) -> str:
+        return next(entries)
+
+    monkeypatch.setattr("builtins.input", answer)
+
+    assert im.choose_named(items) is items[1]
+    output = capsys.readouterr().out
+    assert "Did you mean:\n    1 - Heavy Modular Frame" in output
+    assert "Index 7 out of range 0-1\n" in output
+    assert "No match for 'zzzz'\n" in output
+
+
+def test_u_and_r_undo_and_redo_chain_edits(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(1)},
+        products={ingot: fr.Fraction(1)},
+    )
+    production_chain = pc.ProductionChain(goal=ingot)
+    production_chain.recipes[recipe] = fr.Fraction(2)
+    runner = im.InteractiveRunner(
+        game_data=support.make_fake_game_data(items=[ore, ingot], recipes=[recipe]),
+        production_chain=production_chain,
+    )
+    entries = iter(["remove-recipe", "0", "u", "r", "r", "u", "quit"])
+
+    def answer(_prompt: str) -> str:
+        return next(entries)
+
+    monkeypatch.setattr("builtins.input", answer)
+
+    runner.mainloop()
+
+    assert production_chain.recipes == {recipe: fr.Fraction(2)}
+    output = capsys.readouterr().out
+    assert output.count("Undid last change") == 2
+    assert output.count("Redid last undone change") == 1
+    assert "Nothing to redo" in output
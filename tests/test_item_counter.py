@@ -0,0 +1,232 @@
+import fractions as fr
+import pickle
+import random
+
+import pytest
+
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import item_counter
+from satisfactory_recipes import stupid_classes as sc
+from tests import support
+
+
+@pytest.fixture
+def items() -> tuple[ic.Item, ic.Item, ic.Item]:
+    return (
+        support.make_fake_item("Desc_Ore_C"),
+        support.make_fake_item("Desc_Ingot_C"),
+        support.make_fake_item("Desc_Plate_C"),
+    )
+
+
+def test_missing_items_read_as_zero_without_being_stored(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    ore, ingot, _plate = items
+    counter = item_counter.ItemCounter({ore: fr.Fraction(3, 2)})
+
+    assert counter[ingot] == 0
+    assert ingot not in counter
+    assert counter.get(ingot) is None
+    assert counter.get(ingot, fr.Fraction(5)) == 5
+    assert counter.get(ore) == fr.Fraction(3, 2)
+    assert len(counter) == 1
+
+
+def test_zero_amounts_are_dropped(items: tuple[ic.Item, ic.Item, ic.Item]) -> None:
+    ore, ingot, _plate = items
+    counter = item_counter.ItemCounter({ore: fr.Fraction(1), ingot: fr.Fraction(0)})
+    assert list(counter) == [ore]
+
+    counter[ore] -= 1
+    assert not counter
+    assert counter == {}
+    assert counter == {ore: fr.Fraction(0)}
+
+
+def test_arithmetic_matches_scalable_counter(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    ore, ingot, plate = items
+    left = {ore: fr.Fraction(7, 3), ingot: fr.Fraction(-1, 6)}
+    right = {ingot: fr.Fraction(1, 6), plate: fr.Fraction(22, 7)}
+    scale = fr.Fraction(-9, 14)
+
+    counter = item_counter.ItemCounter(left)
+    expected = sc.ScalableCounter[ic.Item](left)
+
+    assert counter + right == expected + right
+    assert counter - right == {
+        ore: fr.Fraction(7, 3),
+        ingot: fr.Fraction(-1, 3),
+        plate: fr.Fraction(-22, 7),
+    }
+    assert counter * scale == expected * scale
+    assert counter / scale == expected / scale
+
+    counter.add_scaled(right, scale)
+    assert counter == {
+        ore: fr.Fraction(7, 3),
+        ingot: fr.Fraction(-1, 6) + fr.Fraction(1, 6) * scale,
+        plate: fr.Fraction(22, 7) * scale,
+    }
+
+
+def test_amounts_share_one_denominator_in_lowest_terms(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    ore, ingot, _plate = items
+    counter = item_counter.ItemCounter(
+        {ore: fr.Fraction(1, 4), ingot: fr.Fraction(1, 6)}
+    )
+    assert counter.denominator == 12
+
+    counter *= fr.Fraction(12)
+    assert counter.denominator == 1
+    assert counter == {ore: fr.Fraction(3), ingot: fr.Fraction(2)}
+
+
+def test_single_key_writes_match_a_rebuilt_counter(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    ore, ingot, plate = items
+    counter = item_counter.ItemCounter({ore: fr.Fraction(1, 4)})
+    original = counter.frozen_copy()
+
+    counter[plate] = fr.Fraction(1, 6)
+    counter[ingot] = fr.Fraction(2, 3)
+    counter[ore] = fr.Fraction(1, 2)
+    del counter[plate]
+    counter.update({ingot: fr.Fraction(5)})
+
+    expected = {ore: fr.Fraction(1, 2), ingot: fr.Fraction(5)}
+    assert counter == expected
+    assert counter == item_counter.ItemCounter(expected)
+    assert counter.denominator == 2
+    assert list(counter) == [ore, ingot]
+    assert hash(counter.freeze()) == hash(item_counter.ItemCounter(expected).freeze())
+    # Copies share buffers, so writing to one must never show through the other.
+    assert original == {ore: fr.Fraction(1, 4)}
+
+    counter = original.unfrozen_copy()
+    counter[ore] = fr.Fraction(2**80, 3)
+    assert original == {ore: fr.Fraction(1, 4)}
+    assert counter[ore] == fr.Fraction(2**80, 3)
+
+
+def test_huge_numerators_stay_exact(items: tuple[ic.Item, ic.Item, ic.Item]) -> None:
+    ore, ingot, _plate = items
+    counter = item_counter.ItemCounter({ore: fr.Fraction(1), ingot: fr.Fraction(1, 3)})
+    huge = fr.Fraction(2**80 + 1, 7)
+
+    counter *= huge
+    counter /= huge
+
+    assert counter == {ore: fr.Fraction(1), ingot: fr.Fraction(1, 3)}
+    assert counter * huge == {ore: huge, ingot: huge / 3}
+
+
+def test_frozen_counters_hash_and_reject_mutation(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    ore, ingot, _plate = items
+    counter = item_counter.ItemCounter({ore: fr.Fraction(2)}, frozen=True)
+
+    assert hash(counter) == hash(counter.copy())
+    assert counter == item_counter.ItemCounter({ore: fr.Fraction(4, 2)})
+    with pytest.raises(TypeError):
+        counter[ingot] = fr.Fraction(1)
+    with pytest.raises(TypeError):
+        counter += {ingot: fr.Fraction(1)}
+    with pytest.raises(TypeError):
+        hash(counter.unfrozen_copy())
+
+    # Binary operations return new, unfrozen counters.
+    assert not (counter * fr.Fraction(2)).frozen
+
+
+def test_pickles_by_item(items: tuple[ic.Item, ic.Item, ic.Item]) -> None:
+    ore, _ingot, plate = items
+    counter = item_counter.ItemCounter(
+        {plate: fr.Fraction(5, 3), ore: fr.Fraction(-2)}, frozen=True
+    )
+
+    loaded = pickle.loads(pickle.dumps(counter))
+
+    assert loaded == counter
+    assert loaded.frozen
+    assert dict(loaded.items()) == {plate: fr.Fraction(5, 3), ore: fr.Fraction(-2)}
+
+
+def test_rate_totals_match_fraction_sums_exactly(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    rng = random.Random(3)
+    totals = item_counter.RateTotals()
+    expected: dict[ic.Item, fr.Fraction] = {}
+
+    for _ in range(300):
+        counter = item_counter.ItemCounter(
+            {
+                item: fr.Fraction(rng.randint(-50, 50), rng.choice((1, 3, 7, 1000)))
+                for item in rng.sample(items, rng.randint(1, len(items)))
+            }
+        )
+        factor = fr.Fraction(rng.randint(-9, 9), rng.randint(1, 12))
+        if rng.random() < 0.1:
+            totals.scale(factor)
+            expected = {item: amount * factor for item, amount in expected.items()}
+        else:
+            totals.add_scaled(counter, factor)
+            for item, amount in counter.items():
+                expected[item] = expected.get(item, fr.Fraction(0)) + amount * factor
+
+        if rng.random() < 0.2:
+            assert totals.to_counter() == expected
+
+    assert totals.to_counter() == expected
+
+
+def test_rate_totals_only_reduce_when_asked(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    ore, ingot, _plate = items
+    totals = item_counter.RateTotals()
+    per_min = item_counter.ItemCounter({ore: fr.Fraction(1, 3), ingot: fr.Fraction(2)})
+
+    totals.add_scaled(per_min, fr.Fraction(3, 4))
+    totals.add_scaled(per_min, fr.Fraction(1, 4))
+    assert totals.denominator == 12
+
+    counter = totals.to_counter()
+    assert counter == {ore: fr.Fraction(1, 3), ingot: fr.Fraction(2)}
+    assert counter.denominator == 3
+    assert totals.denominator == 12
+
+    totals.reduce()
+    assert totals.denominator == 3
+    assert totals.to_counter() == counter
+
+    totals.add_scaled(per_min, fr.Fraction(-1))
+    assert len(totals) == 0
+    assert totals.to_counter() == {}
+
+
+def test_restricted_to_keeps_only_the_given_items(
+    items: tuple[ic.Item, ic.Item, ic.Item],
+) -> None:
+    ore, ingot, plate = items
+    counter = item_counter.ItemCounter(
+        {ore: fr.Fraction(1, 6), ingot: fr.Fraction(1, 3), plate: fr.Fraction(2)}
+    )
+
+    restricted = counter.restricted_to(
+        item_counter.ItemCounter({ingot: fr.Fraction(5)})
+    )
+    assert restricted == {ingot: fr.Fraction(1, 3)}
+    assert restricted.denominator == 3
+    assert counter.restricted_to([plate, ore]) == {
+        ore: fr.Fraction(1, 6),
+        plate: fr.Fraction(2),
+    }
+    assert counter.restricted_to([support.make_fake_item("Desc_Unseen_C")]) == {}
@@ -36,6 +36,23 @@ def test_parser_supports_gui_options_without_subcommand() -> None:
     assert args.docs_path == pathlib.Path("en-us.json")
 
 
+def test_parser_supports_disabling_docs_cache() -> None:
+    parser = main.make_parser()
+
+    assert parser.parse_args([]).use_docs_cache
+    assert not parser.parse_args(["--no-docs-cache"]).use_docs_cache
+    assert not parser.parse_args(["cli", "--no-docs-cache"]).use_docs_cache
+    assert parser.parse_args(["cli"]).use_docs_cache
+
+
+def test_parser_supports_profiling_docs_load() -> None:
+    parser = main.make_parser()
+
+    assert not parser.parse_args([]).profile_load
+    assert parser.parse_args(["--profile-load"]).profile_load
+    assert parser.parse_args(["cli", "--profile-load"]).profile_load
+
+
 def test_parser_supports_cli_subcommand() -> None:
     args = main.make_parser().parse_args(
         [
@@ -149,8 +166,12 @@ def test_run_gui_defers_docs_resolution_to_gui_app(
         game_path: pathlib.Path | None = None,
         filename: pathlib.Path | None = None,
         initial_scale: fr.Fraction = fr.Fraction(1, 1),
+        use_docs_cache: bool = True,
+        profile_load: bool = False,
     ) -> int:
         assert initial_scale == fr.Fraction(1, 2)
+        assert use_docs_cache
+        assert not profile_load
         calls.append((docs_path, game_path, filename))
         return 0
 
@@ -0,0 +1,157 @@
+import dataclasses
+import fractions as fr
+import pathlib
+
+import pytest
+
+from satisfactory_recipes import docs_parser
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import optimizer
+from tests import support
+from tests import synthetic_docs
+
+
+def _make_building(class_name: str, power_draw: fr.Fraction) -> ic.Building:
+    return ic.Building(
+        class_name=class_name,
+        source_native_class="test.fixed_manufacturer",
+        name=class_name,
+        kind=ic.BuildingKind.MANUFACTURER,
+        power_mode=ic.BuildingPowerMode.CONSTANT,
+        power_draw=power_draw,
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PlateScenario:
+    ore: ic.Item
+    plate: ic.Item
+    ingot_recipe: ic.Recipe
+    plate_recipe: ic.Recipe
+    alternate_plate_recipe: ic.Recipe
+    game_data: ic.GameData
+
+
+@pytest.fixture
+def plate_scenario() -> PlateScenario:
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot", kind=ic.ItemKind.STANDARD)
+    plate = support.make_fake_item("Plate", kind=ic.ItemKind.STANDARD)
+    constructor = _make_building("Build_Constructor_C", fr.Fraction(4))
+    power_hog = _make_building("Build_PowerHog_C", fr.Fraction(100))
+
+    ingot_recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(1)},
+        products={ingot: fr.Fraction(1)},
+        produced_in=constructor,
+    )
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        inputs={ingot: fr.Fraction(3)},
+        products={plate: fr.Fraction(2)},
+        produced_in=constructor,
+    )
+    alternate_plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Alternate_Plate_C",
+        inputs={ingot: fr.Fraction(2)},
+        products={plate: fr.Fraction(2)},
+        produced_in=power_hog,
+    )
+    return PlateScenario(
+        ore=ore,
+        plate=plate,
+        ingot_recipe=ingot_recipe,
+        plate_recipe=plate_recipe,
+        alternate_plate_recipe=alternate_plate_recipe,
+        game_data=support.make_fake_game_data(
+            items=[ore, ingot, plate],
+            recipes=[ingot_recipe, plate_recipe, alternate_plate_recipe],
+        ),
+    )
+
+
+def test_raw_resource_objective_picks_the_thrifty_alternate(
+    plate_scenario: PlateScenario,
+) -> None:
+    chain = optimizer.optimize_chain(
+        plate_scenario.game_data,
+        plate_scenario.plate,
+        fr.Fraction(10),
+    )
+
+    assert chain.recipes == {
+        plate_scenario.alternate_plate_recipe: fr.Fraction(5),
+        plate_scenario.ingot_recipe: fr.Fraction(10),
+    }
+    assert chain.get_net_per_min() == {
+        plate_scenario.plate: fr.Fraction(10),
+        plate_scenario.ore: fr.Fraction(-10),
+    }
+
+
+def test_power_objective_avoids_the_power_hungry_alternate(
+    plate_scenario: PlateScenario,
+) -> None:
+    chain = optimizer.optimize_chain(
+        plate_scenario.game_data,
+        plate_scenario.plate,
+        fr.Fraction(10),
+        objective=optimizer.Objective.POWER,
+    )
+
+    assert chain.recipes == {
+        plate_scenario.plate_recipe: fr.Fraction(5),
+        plate_scenario.ingot_recipe: fr.Fraction(15),
+    }
+
+
+def test_building_objective_minimizes_recipe_count(
+    plate_scenario: PlateScenario,
+) -> None:
+    chain = optimizer.optimize_chain(
+        plate_scenario.game_data,
+        plate_scenario.plate,
+        fr.Fraction(10),
+        objective=optimizer.Objective.BUILDINGS,
+    )
+
+    assert chain.recipes == {
+        plate_scenario.alternate_plate_recipe: fr.Fraction(5),
+        plate_scenario.ingot_recipe: fr.Fraction(10),
+    }
+
+
+def test_optimizer_rejects_goal_without_recipes(plate_scenario: PlateScenario) -> None:
+    with pytest.raises(optimizer.OptimizationError, match="No recipe can produce"):
+        optimizer.optimize_chain(
+            plate_scenario.game_data,
+            plate_scenario.ore,
+            fr.Fraction(1),
+        )
+
+
+def test_optimizer_solves_synthetic_docs_of_realistic_size(
+    tmp_path: pathlib.Path,
+) -> None:
+    # Hundreds of recipes with cycles and byproducts leave almost every row
+    # degenerate, which is where a simplex can stall or cycle.
+    spec = synthetic_docs.SyntheticDocsSpec(recipe_count=300, cycle_fraction=0.2)
+    game_data = docs_parser.load_game_data(
+        synthetic_docs.write_docs(tmp_path / "en-US.json", spec)
+    )
+    goals = sorted(game_data.producible_items, key=lambda item: item.class_name)
+
+    surplus_items: set[ic.Item] = set()
+    for goal in goals[:3]:
+        chain = optimizer.optimize_chain(game_data, goal, fr.Fraction(10))
+
+        net = chain.get_net_per_min()
+        assert net[goal] == 10
+        made = {item for recipe in chain.recipes for item in recipe.products}
+        for item in made - {goal}:
+            if not item.is_resource:
+                assert net[item] >= 0
+                if net[item] > 0:
+                    surplus_items.add(item)
+    assert surplus_items
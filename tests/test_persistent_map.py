@@ -0,0 +1,44 @@
+import random
+
+from satisfactory_recipes import persistent_map as pm
+
+
+def test_persistent_map_matches_dict_through_random_edits() -> None:
+    rng = random.Random(0)
+    expected: dict[int, int] = {}
+    current = pm.PersistentMap[int, int]()
+    versions = [(current, dict(expected))]
+    for step in range(3000):
+        key = rng.randrange(400)
+        if rng.random() < 0.3:
+            expected.pop(key, None)
+            current = current.discard(key)
+        else:
+            expected[key] = step
+            current = current.set(key, step)
+        versions.append((current, dict(expected)))
+
+    # Every older version is still intact.
+    for version, contents in versions[::100]:
+        assert len(version) == len(contents)
+        assert dict(version.items()) == contents
+        assert all(key in version for key in contents)
+    assert 1000 not in current
+
+
+def test_changed_keys_reports_only_differences() -> None:
+    base = pm.PersistentMap((key, key) for key in range(1000))
+    edited = base.set(3, -3).discard(500).set(2000, 1).set(7, 7)
+
+    assert sorted(base.changed_keys(edited)) == [3, 500, 2000]
+    assert list(edited.changed_keys(edited)) == []
+    assert base.discard(1234) is base
+
+
+def test_set_shares_untouched_structure() -> None:
+    base = pm.PersistentMap((key, key) for key in range(10_000))
+    edited = base.set(42, 0)
+
+    base_branches = set(map(id, base._root))  # type: ignore[arg-type]
+    shared = [child for child in edited._root if id(child) in base_branches]  # type: ignore[union-attr]
+    assert len(shared) == len(edited._root) - 1  # type: ignore[arg-type]
@@ -1,6 +1,7 @@
 import fractions as fr
 import json
 import pathlib
+import random
 
 import pytest
 
@@ -125,6 +126,33 @@ def test_load_uses_scaled_recipe_objects(tmp_path: pathlib.Path) -> None:
     assert game_data.recipes_d["Recipe_Ingot_C"].inputs[ore] == fr.Fraction(2)
 
 
+def test_load_at_scale_leaves_game_data_untouched(tmp_path: pathlib.Path) -> None:
+    ore = support.make_fake_item("Desc_Ore_C")
+    ingot = support.make_fake_item("Desc_Ingot_C")
+    recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(8)},
+        products={ingot: fr.Fraction(1)},
+    )
+    game_data = support.make_fake_game_data(items=[ore, ingot], recipes=[recipe])
+
+    filename = tmp_path / "chain.json"
+    support.write_chain_json(
+        filename,
+        recipes={"Recipe_Ingot_C": "2"},
+        recipe_input_scale="1/4",
+    )
+
+    loaded, scaled_game_data = pc.ProductionChain.load_at_scale(filename, game_data)
+
+    assert scaled_game_data.scale == fr.Fraction(1, 4)
+    assert loaded.recipes == {
+        scaled_game_data.recipes_d["Recipe_Ingot_C"]: fr.Fraction(2)
+    }
+    assert game_data.scale == fr.Fraction(1)
+    assert game_data.recipes_d["Recipe_Ingot_C"] is recipe
+
+
 def test_load_rejects_unsupported_save_version_without_scaling(
     tmp_path: pathlib.Path,
 ) -> None:
@@ -291,3 +319,285 @@ def test_scale_recipe_count_scales_the_entire_chain() -> None:
 
     assert chain.recipes[plate_recipe] == fr.Fraction(7, 2)
     assert chain.recipes[ingot_recipe] == fr.Fraction(7)
+
+
+def test_net_ledger_tracks_every_kind_of_recipe_edit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pc, "CHECK_NET_LEDGER", True)
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    plate = support.make_fake_item("Plate")
+    ingot_recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(3)},
+        products={ingot: fr.Fraction(1)},
+    )
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        inputs={ingot: fr.Fraction(2)},
+        products={plate: fr.Fraction(1)},
+        craft_time=fr.Fraction(6),
+    )
+    chain = pc.ProductionChain(goal=plate)
+
+    chain.recipes[plate_recipe] = fr.Fraction(1)
+    assert chain.get_net_per_min() == {
+        ingot: fr.Fraction(-20),
+        plate: fr.Fraction(10),
+    }
+
+    chain.add_scaled_recipe(ingot_recipe, ingot)
+    assert chain.get_net_per_min() == {
+        ore: fr.Fraction(-60),
+        plate: fr.Fraction(10),
+    }
+
+    chain.scale_item(plate, fr.Fraction(5))
+    assert chain.get_net_per_min() == {
+        ore: fr.Fraction(-30),
+        plate: fr.Fraction(5),
+    }
+
+    chain.recipes[ingot_recipe] += fr.Fraction(1)
+    chain.recipes /= fr.Fraction(2)
+    chain.get_net_per_min()
+
+    del chain.recipes[ingot_recipe]
+    assert chain.get_net_per_min() == {
+        ingot: fr.Fraction(-5),
+        plate: fr.Fraction(5, 2),
+    }
+
+    chain.recipes.clear()
+    assert chain.get_net_per_min() == {}
+
+
+def test_net_ledger_stays_exact_over_many_random_edits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pc, "CHECK_NET_LEDGER", True)
+    rng = random.Random(11)
+    water = support.make_fake_item("Water", ic.MatterState.LIQUID)
+    items = [support.make_fake_item(f"Part{index}") for index in range(6)]
+    recipes = [
+        support.make_fake_recipe(
+            class_name=f"Recipe_Part{index}_C",
+            inputs={
+                items[index]: fr.Fraction(rng.randint(1, 9)),
+                water: fr.Fraction(rng.randint(1, 9999), 1000),
+            },
+            products={items[index + 1]: fr.Fraction(rng.randint(1, 4))},
+            craft_time=fr.Fraction(rng.choice((2, 3, 7, 45, 120))),
+        )
+        for index in range(len(items) - 1)
+    ]
+    chain = pc.ProductionChain(goal=items[-1])
+
+    for _ in range(200):
+        recipe = rng.choice(recipes)
+        if rng.random() < 0.1:
+            chain.recipes *= fr.Fraction(rng.randint(1, 9), rng.randint(1, 9))
+        elif recipe in chain.recipes and rng.random() < 0.2:
+            del chain.recipes[recipe]
+        else:
+            chain.recipes[recipe] = fr.Fraction(rng.randint(1, 99), rng.randint(1, 13))
+        # Compared with the Fraction-by-Fraction recomputation on every read.
+        chain.get_net_per_min()
+
+
+def test_byproduct_rates_offset_only_items_on_their_own_side() -> None:
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    slag = support.make_fake_item("Slag")
+    plate = support.make_fake_item("Plate")
+    ingot_recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(3)},
+        products={ingot: fr.Fraction(2), slag: fr.Fraction(1)},
+    )
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        inputs={ingot: fr.Fraction(3)},
+        products={plate: fr.Fraction(1)},
+    )
+    chain = pc.ProductionChain(
+        goal=plate,
+        recipes=sc.ScalableCounter[ic.Recipe](
+            {ingot_recipe: fr.Fraction(1), plate_recipe: fr.Fraction(1, 3)}
+        ),
+    )
+
+    assert chain.get_produced_per_min(consume_byproducts=True) == {
+        ingot: fr.Fraction(1),
+        slag: fr.Fraction(1),
+        plate: fr.Fraction(1, 3),
+    }
+    assert chain.get_consumed_per_min(consume_byproducts=True) == {
+        ore: fr.Fraction(3),
+        ingot: fr.Fraction(-1),
+    }
+
+
+def test_round_goal_rate_scales_every_count_alike() -> None:
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    plate = support.make_fake_item("Plate")
+    ingot_recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(3)},
+        products={ingot: fr.Fraction(1)},
+    )
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        inputs={ingot: fr.Fraction(2)},
+        products={plate: fr.Fraction(3)},
+    )
+    chain = pc.ProductionChain(
+        goal=plate,
+        recipes=sc.ScalableCounter[ic.Recipe](
+            {ingot_recipe: fr.Fraction(2), plate_recipe: fr.Fraction(1)}
+        ),
+    )
+    assert chain.count_denominator_bits() == 1
+    assert not chain.round_goal_rate()
+
+    chain.scale_item(plate, fr.Fraction(10**30 + 7, 3**50))
+    assert chain.count_denominator_bits() > pc.DENOMINATOR_WARNING_BITS
+    assert chain.has_large_denominators()
+    before = chain.get_net_per_min()
+
+    assert (
+        chain.count_denominator_bits(pc.simple_rate(before[plate]) / before[plate])
+        <= pc.DENOMINATOR_WARNING_BITS
+    )
+    assert chain.round_goal_rate()
+
+    after = chain.get_net_per_min()
+    assert after[plate] == before[plate].limit_denominator(
+        pc.SIMPLE_RATE_MAX_DENOMINATOR
+    )
+    assert {item: rate / after[plate] for item, rate in after.items()} == {
+        item: rate / before[plate] for item, rate in before.items()
+    }
+    assert not chain.has_large_denominators()
+    assert chain.recipes[ingot_recipe] == 2 * chain.recipes[plate_recipe]
+
+
+def test_round_goal_rate_needs_the_goal_to_be_made() -> None:
+    ore = support.make_fake_item("Ore")
+    chain = pc.ProductionChain(goal=ore)
+
+    with pytest.raises(ValueError, match="makes no net Ore"):
+        chain.round_goal_rate()
+
+
+def test_reassigned_recipes_rebuild_the_net_ledger() -> None:
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(2)},
+        products={ingot: fr.Fraction(1)},
+    )
+    chain = pc.ProductionChain(goal=ingot)
+
+    chain.recipes = sc.ScalableCounter[ic.Recipe]({recipe: fr.Fraction(3)})
+    chain.recipes[recipe] -= fr.Fraction(1)
+
+    assert chain.get_net_per_min() == {
+        ore: fr.Fraction(-4),
+        ingot: fr.Fraction(2),
+    }
+
+
+def test_snapshot_is_frozen_and_unaffected_by_later_edits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pc, "CHECK_NET_LEDGER", True)
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(2)},
+        products={ingot: fr.Fraction(1)},
+    )
+    chain = pc.ProductionChain(goal=ingot)
+    chain.recipes[recipe] = fr.Fraction(3)
+
+    snapshot = chain.snapshot()
+    chain.recipes[recipe] = fr.Fraction(5)
+
+    assert snapshot.recipes.frozen
+    assert snapshot.recipes == {recipe: fr.Fraction(3)}
+    assert snapshot.get_net_per_min() == {
+        ore: fr.Fraction(-6),
+        ingot: fr.Fraction(3),
+    }
+    with pytest.raises(TypeError):
+        snapshot.recipes[recipe] = fr.Fraction(1)
+    assert chain.get_net_per_min() == {
+        ore: fr.Fraction(-10),
+        ingot: fr.Fraction(5),
+    }
+
+
+def test_solve_balances_a_cyclic_chain_in_one_call() -> None:
+    water = support.make_fake_item("Water", ic.MatterState.LIQUID)
+    rubber = support.make_fake_item("Rubber")
+    plastic = support.make_fake_item("Plastic")
+    rubber_recipe = support.make_fake_recipe(
+        class_name="Recipe_RecycledRubber_C",
+        inputs={plastic: fr.Fraction(1), water: fr.Fraction(1)},
+        products={rubber: fr.Fraction(2)},
+    )
+    plastic_recipe = support.make_fake_recipe(
+        class_name="Recipe_RecycledPlastic_C",
+        inputs={rubber: fr.Fraction(1), water: fr.Fraction(1)},
+        products={plastic: fr.Fraction(2)},
+    )
+    chain = pc.ProductionChain(goal=plastic)
+
+    chain.solve(
+        fr.Fraction(10),
+        {plastic: plastic_recipe, rubber: rubber_recipe},
+    )
+
+    assert chain.recipes == {
+        plastic_recipe: fr.Fraction(20, 3),
+        rubber_recipe: fr.Fraction(10, 3),
+    }
+    assert chain.get_net_per_min() == {
+        plastic: fr.Fraction(10),
+        water: fr.Fraction(-10),
+    }
+
+
+def test_solve_rejects_choices_needing_negative_counts() -> None:
+    ore = support.make_fake_item("Ore")
+    ingot = support.make_fake_item("Ingot")
+    plate = support.make_fake_item("Plate")
+    ingot_recipe = support.make_fake_recipe(
+        class_name="Recipe_Ingot_C",
+        inputs={ore: fr.Fraction(1)},
+        products={ingot: fr.Fraction(1)},
+    )
+    # Makes far more spare ingots than it eats, so ingots can only balance if
+    # the ingot recipe runs backwards.
+    plate_recipe = support.make_fake_recipe(
+        class_name="Recipe_Plate_C",
+        inputs={ore: fr.Fraction(1)},
+        products={plate: fr.Fraction(1), ingot: fr.Fraction(5)},
+    )
+    chain = pc.ProductionChain(
+        goal=plate,
+        recipes=sc.ScalableCounter[ic.Recipe]({plate_recipe: fr.Fraction(1)}),
+    )
+
+    with pytest.raises(ValueError, match="negative counts for: Recipe_Ingot_C"):
+        chain.solve(fr.Fraction(1), {plate: plate_recipe, ingot: ingot_recipe})
+
+    assert chain.recipes == {plate_recipe: fr.Fraction(1)}
+
+    with pytest.raises(ValueError, match="Cannot use Recipe_Ingot_C"):
+        chain.solve(fr.Fraction(1), {plate: ingot_recipe})
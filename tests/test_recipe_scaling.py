@@ -0,0 +1,110 @@
+import fractions as fr
+import pathlib
+import random
+
+from satisfactory_recipes import docs_parser
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import recipe_scaling
+from tests import support
+from tests import synthetic_docs
+
+FACTORS = (fr.Fraction(1, 4), fr.Fraction(1, 3), fr.Fraction(5, 2), fr.Fraction(7, 9))
+
+
+def test_round_scaled_inputs_matches_scale_one_input() -> None:
+    rng = random.Random(5)
+    amounts = [
+        fr.Fraction(rng.randint(1, 5000), rng.choice((1, 2, 3, 1000)))
+        for _ in range(500)
+    ]
+    fluids = [rng.random() < 0.3 for _ in amounts]
+    raw_amounts = [
+        amount * (recipe_scaling.FLUID_UNITS if is_fluid else 1)
+        for amount, is_fluid in zip(amounts, fluids, strict=True)
+    ]
+
+    for factor in FACTORS:
+        rounded = recipe_scaling.round_scaled_inputs(
+            [amount.numerator for amount in raw_amounts],
+            [amount.denominator for amount in raw_amounts],
+            factor,
+        )
+        assert [
+            fr.Fraction(raw_amount, recipe_scaling.FLUID_UNITS if is_fluid else 1)
+            for raw_amount, is_fluid in zip(rounded, fluids, strict=True)
+        ] == [
+            ic.Recipe.scale_one_input(amount, factor, is_fluid)
+            for amount, is_fluid in zip(amounts, fluids, strict=True)
+        ]
+
+        whole = [int(amount) + 1 for amount in raw_amounts]
+        assert recipe_scaling.round_scaled_inputs(whole, None, factor) == (
+            recipe_scaling.round_scaled_inputs(whole, [1] * len(whole), factor)
+        )
+
+
+def test_scaled_recipes_are_the_recipes_create_scaled_makes(
+    tmp_path: pathlib.Path,
+) -> None:
+    game_data = docs_parser.parse_game_data(
+        synthetic_docs.write_docs(
+            tmp_path / "en-US.json",
+            synthetic_docs.SyntheticDocsSpec(
+                recipe_count=200, fluid_fraction=0.3, unused_section_count=0
+            ),
+        )
+    ).game_data
+    recipes = dict(game_data.recipes_d)
+    layout = recipe_scaling.InputLayout.from_recipes(recipes)
+
+    for factor in FACTORS:
+        scaled = recipe_scaling.ScaledRecipes(layout, factor)
+        rescaled = scaled.rescaled(fr.Fraction(3, 2))
+        assert list(scaled) == list(recipes)
+        for name, recipe in recipes.items():
+            expected = recipe.create_scaled(factor)
+            assert scaled[name] is expected
+            assert rescaled[name] is expected.create_scaled(fr.Fraction(3, 2))
+
+
+def test_game_data_builds_scaled_recipes_only_when_looked_up() -> None:
+    ore = support.make_fake_item("Desc_Ore_C")
+    water = support.make_fake_item("Desc_Water_C", ic.MatterState.LIQUID)
+    ingot = support.make_fake_item("Desc_Ingot_C")
+    building = ic.Building(
+        class_name="Build_Smelter_C",
+        source_native_class="test.fixed_manufacturer",
+        name="Smelter",
+        kind=ic.BuildingKind.MANUFACTURER,
+        power_mode=ic.BuildingPowerMode.CONSTANT,
+        power_draw=fr.Fraction(4),
+    )
+    game_data = support.make_fake_game_data(
+        items=[ore, water, ingot],
+        recipes=[
+            support.make_fake_recipe(
+                class_name=f"Recipe_Ingot{index}_C",
+                inputs={ore: fr.Fraction(index + 1), water: fr.Fraction(3, 2)},
+                products={ingot: fr.Fraction(1)},
+                produced_in=building,
+            )
+            for index in range(10)
+        ],
+    )
+
+    game_data.scale_recipes(fr.Fraction(1, 4))
+    recipes = game_data.recipes_d
+    assert isinstance(recipes, recipe_scaling.ScaledRecipes)
+    assert game_data.producible_items == {ingot}
+    assert "Recipe_Ingot9_C" in recipes
+    assert "0 built" in repr(recipes)
+
+    recipe = recipes["Recipe_Ingot9_C"]
+    assert "1 built" in repr(recipes)
+    assert recipe.inputs == {ore: fr.Fraction(3), water: fr.Fraction(3, 8)}
+    assert recipe.inputs_per_min == recipe.inputs
+    assert recipe.scale == fr.Fraction(1, 4)
+    assert recipes["Recipe_Ingot9_C"] is recipe
+
+    assert len(game_data.get_recipes_producing(ingot)) == 10
+    assert game_data.get_recipes_consuming(water)[9] is recipe
@@ -0,0 +1,68 @@
+import fractions as fr
+
+import pytest
+
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import recipe_search
+from tests import support
+
+
+def _make_building(name: str) -> ic.Building:
+    return ic.Building(
+        class_name=f"Build_{name}_C",
+        source_native_class="test.fixed_manufacturer",
+        name=name,
+        kind=ic.BuildingKind.MANUFACTURER,
+        power_mode=ic.BuildingPowerMode.CONSTANT,
+        power_draw=fr.Fraction(4),
+    )
+
+
+@pytest.mark.parametrize(
+    ("entry", "expected"),
+    [
+        ("uses: sulfuric acid", (recipe_search.RecipeField.USES, "sulfuric acid")),
+        ("IN:Blender", (recipe_search.RecipeField.IN, "Blender")),
+        ("Alternate: Iron Rod", (None, "Alternate: Iron Rod")),
+        ("iron rod", (None, "iron rod")),
+    ],
+)
+def test_parse_recipe_query(
+    entry: str,
+    expected: tuple[recipe_search.RecipeField | None, str],
+) -> None:
+    assert recipe_search.parse_recipe_query(entry) == expected
+
+
+def test_recipe_search_index_finds_recipes_by_contents() -> None:
+    acid = support.make_fake_item("Sulfuric Acid", ic.MatterState.LIQUID)
+    sulfur = support.make_fake_item("Sulfur")
+    battery = support.make_fake_item("Battery", kind=ic.ItemKind.STANDARD)
+    blender = _make_building("Blender")
+    refinery = _make_building("Refinery")
+    acid_recipe = support.make_fake_recipe(
+        class_name="Recipe_Acid_C",
+        name="Sulfuric Acid",
+        inputs={sulfur: fr.Fraction(5)},
+        products={acid: fr.Fraction(5)},
+        produced_in=refinery,
+    )
+    battery_recipe = support.make_fake_recipe(
+        class_name="Recipe_Battery_C",
+        name="Battery",
+        inputs={acid: fr.Fraction(5), sulfur: fr.Fraction(1)},
+        products={battery: fr.Fraction(1)},
+        produced_in=blender,
+    )
+    index = recipe_search.RecipeSearchIndex(
+        [acid_recipe, battery_recipe],
+        recipe=lambda recipe: recipe,
+    )
+
+    assert index.best_matches("uses: sulfuric acid") == [battery_recipe]
+    assert index.best_matches("uses: sulfur") == [acid_recipe, battery_recipe]
+    assert index.best_matches("uses: sulfur", limit=1) == [acid_recipe]
+    assert index.best_matches("makes: sulfuric") == [acid_recipe]
+    assert index.best_matches("in: blend") == [battery_recipe]
+    assert index.best_matches("in: constructor") == []
+    assert index.best_matches("battery") == [battery_recipe]
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from satisfactory_recipes import search
+
+
+def _reference_sort(options: list[str], entry: str) -> list[str]:
+    def sort_key(option: str) -> tuple[bool, bool, int, str]:
+        return (
+            option.lower() != entry.lower(),
+            not option.lower().startswith(entry.lower()),
+            -search.match_score(option, entry),
+            option,
+        )
+
+    return [
+        option
+        for option in sorted(options, key=sort_key)
+        if search.match_score(option, entry)
+    ]
+
+
+def test_search_index_ranks_like_match_score() -> None:
+    rng = random.Random(0)
+    words = ["iron", "Iron", "rod", "plate", "reinforced", "pla", "Re", "  x"]
+    options = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+        for _ in range(300)
+    ]
+    options += ["Iron  Rod", " iron rod", "IRON ROD", "iron rod "]
+    index = search.SearchIndex(options, label=str)
+
+    for entry in ["i", "ir", "iron", "iron r", "Iron  Rod", "rod", "re", "pla", "q"]:
+        assert index.search(entry) == _reference_sort(options, entry)
+        assert search.sort_options(options, entry) == _reference_sort(options, entry)
+
+
+def test_search_index_narrows_queries_typed_one_character_at_a_time() -> None:
+    rng = random.Random(1)
+    words = ["iron", "ingot", "in", "Iron", "rod", "reinforced", "re", "i"]
+    options = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+        for _ in range(300)
+    ]
+    index = search.SearchIndex(options, label=str)
+
+    for typed in ["iron rod", "Reinforced iron", "in ing", "ix"]:
+        for end in [*range(1, len(typed) + 1), len(typed) - 2, len(typed)]:
+            entry = typed[:end]
+            assert index.search(entry) == _reference_sort(options, entry)
+
+
+def test_search_index_preserves_identity_and_handles_repeated_queries() -> None:
+    first = ("Alternate Recipe", object())
+    second = ("Alternate Recipe", object())
+    index = search.SearchIndex([first, second], label=lambda option: option[0])
+
+    assert index.search("") == []
+    assert index.search("rec") == [first, second]
+    result = index.search("rec")
+    result.clear()
+    assert index.search("rec") == [first, second]
+    assert index.search("recx") == [first, second]
+    assert index.search("x") == []
+
+
+ITEM_NAMES = [
+    "Heavy Modular Frame",
+    "Modular Frame",
+    "Fused Modular Frame",
+    "Aluminum Ingot",
+    "Aluminum Scrap",
+    "Alumina Solution",
+    "Iron Rod",
+    "Iron Plate",
+]
+
+
+@pytest.mark.parametrize(
+    ("entry", "best"),
+    [
+        ("heavy modlar frame", "Heavy Modular Frame"),
+        ("alumnium", "Aluminum Ingot"),
+        ("fused modualr", "Fused Modular Frame"),
+        ("modular", "Modular Frame"),
+    ],
+)
+def test_best_matches_tolerates_typos(entry: str, best: str) -> None:
+    index = search.SearchIndex(ITEM_NAMES, label=str)
+
+    assert index.best_matches(entry)[0] == best
+
+
+def test_best_matches_agrees_with_search_for_short_queries() -> None:
+    index = search.SearchIndex(ITEM_NAMES, label=str)
+
+    for entry in ["i", "ir", "mod", "zz"]:
+        assert index.best_matches(entry) == index.search(entry)
+    assert index.best_matches("iron", limit=1) == ["Iron Plate"]
+    assert index.best_matches("qqqqqqqq") == []
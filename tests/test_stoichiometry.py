@@ -0,0 +1,78 @@
+import fractions as fr
+
+import pytest
+
+from satisfactory_recipes import info_classes as ic
+from satisfactory_recipes import production_chain as pc
+from satisfactory_recipes import stupid_classes as sc
+from tests import support
+
+
+def _make_game_data() -> tuple[ic.GameData, dict[str, ic.Item]]:
+    ore = support.make_fake_item("Ore")
+    water = support.make_fake_item("Water", ic.MatterState.LIQUID)
+    ingot = support.make_fake_item("Ingot")
+    slag = support.make_fake_item("Slag")
+    unused = support.make_fake_item("Unused")
+    game_data = support.make_fake_game_data(
+        items=[ore, water, ingot, slag, unused],
+        recipes=[
+            support.make_fake_recipe(
+                class_name="Recipe_Ingot_C",
+                inputs={ore: fr.Fraction(3), water: fr.Fraction(7, 1000)},
+                products={ingot: fr.Fraction(2), slag: fr.Fraction(1)},
+                craft_time=fr.Fraction(7),
+            ),
+            support.make_fake_recipe(
+                class_name="Recipe_Recycle_C",
+                inputs={slag: fr.Fraction(5), ingot: fr.Fraction(1)},
+                products={ore: fr.Fraction(2), ingot: fr.Fraction(3)},
+                craft_time=fr.Fraction(11, 3),
+            ),
+        ],
+    )
+    return game_data, {item.name: item for item in game_data.items_d.values()}
+
+
+def test_matrix_net_rates_match_fraction_path_exactly() -> None:
+    game_data, items = _make_game_data()
+    chain = pc.ProductionChain(
+        goal=items["Ingot"],
+        recipes=sc.ScalableCounter[ic.Recipe](
+            {
+                game_data.recipes_d["Recipe_Ingot_C"]: fr.Fraction(13, 9),
+                game_data.recipes_d["Recipe_Recycle_C"]: fr.Fraction(5, 17),
+            }
+        ),
+    )
+
+    matrix = game_data.stoichiometry_matrix
+
+    assert chain.get_net_per_min_from_matrix(matrix) == chain.get_net_per_min()
+    assert matrix.net_rates([fr.Fraction(0)] * len(matrix.recipes)) == [
+        fr.Fraction(0)
+    ] * len(matrix.items)
+
+
+def test_matrix_index_tables_and_touching_recipes() -> None:
+    game_data, items = _make_game_data()
+    matrix = game_data.stoichiometry_matrix
+
+    assert set(matrix.items) == set(game_data.items_d.values())
+    assert {recipe.class_name for recipe in matrix.recipes_touching(items["Slag"])} == {
+        "Recipe_Ingot_C",
+        "Recipe_Recycle_C",
+    }
+    assert matrix.recipes_touching(items["Unused"]) == ()
+
+
+def test_matrix_is_rebuilt_after_rescale_and_rejects_stale_recipes() -> None:
+    game_data, _items = _make_game_data()
+    old_recipe = game_data.recipes_d["Recipe_Ingot_C"]
+    old_matrix = game_data.stoichiometry_matrix
+
+    game_data.scale_recipes(fr.Fraction(1, 2))
+
+    assert game_data.stoichiometry_matrix is not old_matrix
+    with pytest.raises(ValueError, match="was the game data rescaled"):
+        game_data.stoichiometry_matrix.counts_vector({old_recipe: fr.Fraction(1)})